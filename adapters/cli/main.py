@@ -4,15 +4,55 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gzip
+import io
 import json
+import math
+import sys
+from array import array
+from itertools import repeat
 from pathlib import Path
-from typing import Callable, Sequence
+from typing import Callable, Iterable, Iterator, Sequence
 
 from core.fs.models import Directory, User
 from core.fs.permissions import PermissionSet
-from core.scheduler.metrics import SimulationMetrics
+from core.scheduler.devices import IODevice
+from core.scheduler.metrics import SimulationMetrics, summarize
+from core.scheduler.pcb_table import PCBTable
+from core.scheduler.profiling import SimulationProfile
 from core.services import FsService, SimService
-from core.services.sim_service import JobSpec, SimulationRequest
+from core.services.bench_service import (
+    ARRIVAL_PATTERNS,
+    BURST_DISTRIBUTIONS,
+    BenchComparison,
+    BenchRequest,
+    BenchResult,
+    BenchService,
+)
+from core.services.sim_service import (
+    JobSpec,
+    SimulationRequest,
+    SweepRequest,
+    SweepResult,
+    jobs_to_table,
+    table_to_jobs,
+)
+
+
+ALGORITHMS = [
+    "fcfs",
+    "rr",
+    "rr-adaptive",
+    "sjf",
+    "srtf",
+    "priority",
+    "priority-preemptive",
+    "mlfq",
+    "lottery",
+    "stride",
+    "edf",
+    "edf-nonpreemptive",
+]
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -25,7 +65,7 @@ def build_parser() -> argparse.ArgumentParser:
     sim_parser = subparsers.add_parser("sim", help="Run a scheduling simulation.")
     sim_parser.add_argument(
         "--algo",
-        choices=["fcfs", "rr", "sjf"],
+        choices=ALGORITHMS,
         required=True,
         help="Scheduling algorithm to use.",
     )
@@ -33,16 +73,296 @@ def build_parser() -> argparse.ArgumentParser:
         "--quantum",
         type=int,
         default=None,
-        help="Quantum for Round Robin (ignored otherwise).",
+        help=(
+            "Quantum for Round Robin, lottery and stride, the level-0 quantum for MLFQ "
+            "or the starting quantum for adaptive Round Robin."
+        ),
+    )
+    sim_parser.add_argument(
+        "--target-percentile",
+        type=float,
+        default=None,
+        help="Percentile of recent CPU bursts the adaptive quantum tracks (default: 0.8).",
+    )
+    sim_parser.add_argument(
+        "--burst-window",
+        type=int,
+        default=None,
+        help="Number of recent CPU bursts the adaptive quantum is computed from (default: 64).",
+    )
+    sim_parser.add_argument(
+        "--levels",
+        type=int,
+        default=None,
+        help="Number of MLFQ levels (default: 3).",
+    )
+    sim_parser.add_argument(
+        "--level-quanta",
+        nargs="+",
+        type=int,
+        default=None,
+        help="Quantum of each MLFQ level, highest level first.",
+    )
+    sim_parser.add_argument(
+        "--boost",
+        type=int,
+        default=None,
+        help="Ticks between MLFQ priority boosts (default: never).",
     )
     sim_parser.add_argument(
         "--input",
         type=str,
         required=True,
-        help="Path to the scenario file (CSV/JSON).",
+        help="Path to the scenario file (CSV/JSON/JSONL; '-' reads JSON Lines from stdin).",
+    )
+    sim_parser.add_argument(
+        "--aging",
+        type=int,
+        default=None,
+        help="Ticks of waiting per priority level gained (priority algorithms only).",
+    )
+    sim_parser.add_argument(
+        "--cpus",
+        type=int,
+        default=1,
+        help="Number of CPU cores to simulate.",
+    )
+    sim_parser.add_argument(
+        "--queue-policy",
+        choices=["global", "per_core"],
+        default="global",
+        help="Shared ready queue or per-core queues with work stealing.",
+    )
+    sim_parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for the I/O schedule generator (reproducible runs).",
+    )
+    sim_parser.add_argument(
+        "--dispatch-latency",
+        type=int,
+        default=0,
+        help="Ticks charged for every context switch (default: 0).",
+    )
+    sim_parser.add_argument(
+        "--cache-warmup",
+        type=int,
+        default=0,
+        help="Extra ticks charged when switching to a process with a cold cache (default: 0).",
+    )
+    sim_parser.add_argument(
+        "--cache-decay",
+        type=float,
+        default=10.0,
+        help="Off-CPU ticks after which the cache of a process is mostly cold (time constant).",
+    )
+    sim_parser.add_argument(
+        "--device",
+        dest="devices",
+        action="append",
+        type=_parse_device,
+        default=None,
+        metavar="NAME[:PARALLELISM[:DISCIPLINE[:TRACKS[:SEEK]]]]",
+        help=(
+            "Add an I/O device with its own queue (repeatable). Jobs pick one with the "
+            "'io_device' metadata key; the first device is the default."
+        ),
+    )
+    sim_parser.add_argument(
+        "--job-store",
+        choices=["objects", "table"],
+        default="objects",
+        help="Keep one PCB object per job, or a compact column table for very large traces.",
+    )
+    sim_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the binary .pcbt sidecar that caches the parsed scenario.",
+    )
+    sim_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Admit JSON Lines jobs as they are parsed instead of loading the file first (needs sorted arrivals).",
+    )
+    sim_parser.add_argument(
+        "--trace-out",
+        type=str,
+        default=None,
+        help="Record an execution trace; .json writes Chrome trace events, anything else the binary format.",
+    )
+    sim_parser.add_argument(
+        "--engine",
+        choices=["tick", "event"],
+        default="tick",
+        help="Step one tick at a time, or jump to the next event (faster for long bursts).",
+    )
+    sim_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each phase of the simulation loop and print loop counters.",
     )
     sim_parser.set_defaults(handler=handle_sim_command)
 
+    sweep_parser = subparsers.add_parser(
+        "sweep",
+        help="Run the cross product of algorithms, quanta and I/O settings in parallel.",
+    )
+    sweep_parser.add_argument(
+        "--algos",
+        nargs="+",
+        choices=ALGORITHMS,
+        default=["fcfs", "sjf", "rr"],
+        help="Algorithms to compare.",
+    )
+    sweep_parser.add_argument(
+        "--quanta",
+        nargs="+",
+        type=_parse_int_range,
+        default=[[2]],
+        help=(
+            "Quanta for rr, lottery and stride (starting quantum for rr-adaptive); "
+            "accepts values and inclusive ranges like 1:200 or 1:200:5."
+        ),
+    )
+    sweep_parser.add_argument(
+        "--input",
+        dest="inputs",
+        nargs="+",
+        required=True,
+        help="One or more scenario files (CSV/JSON/JSONL).",
+    )
+    sweep_parser.add_argument(
+        "--io-interval-mean",
+        nargs="+",
+        type=float,
+        default=None,
+        help="Mean CPU time between I/O requests to try.",
+    )
+    sweep_parser.add_argument(
+        "--io-duration-mean",
+        nargs="+",
+        type=float,
+        default=None,
+        help="Mean I/O duration to try.",
+    )
+    sweep_parser.add_argument(
+        "--no-io",
+        action="store_true",
+        help="Disable I/O for every run of the sweep.",
+    )
+    sweep_parser.add_argument(
+        "--cpus",
+        dest="cpu_grid",
+        nargs="+",
+        type=int,
+        default=None,
+        help="CPU counts to try.",
+    )
+    sweep_parser.add_argument(
+        "--dispatch-latency",
+        dest="dispatch_latency_grid",
+        nargs="+",
+        type=int,
+        default=None,
+        help="Context switch costs (ticks) to try.",
+    )
+    sweep_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (defaults to every core; 1 runs in-process).",
+    )
+    sweep_parser.add_argument(
+        "--seed",
+        dest="sweep_seed",
+        type=int,
+        default=None,
+        help="Seed shared by every run so points differ only by their parameters.",
+    )
+    sweep_parser.set_defaults(handler=handle_sweep_command)
+
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Time the schedulers on synthetic workloads and compare against a baseline.",
+    )
+    bench_parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=_parse_size,
+        default=[1_000],
+        help="Jobs per workload; accepts suffixes like 1k, 100k or 1M.",
+    )
+    bench_parser.add_argument(
+        "--algos",
+        nargs="+",
+        choices=ALGORITHMS,
+        default=["fcfs", "sjf", "rr"],
+        help="Algorithms to time.",
+    )
+    bench_parser.add_argument(
+        "--arrivals",
+        nargs="+",
+        choices=list(ARRIVAL_PATTERNS),
+        default=["poisson"],
+        help="Arrival patterns to generate.",
+    )
+    bench_parser.add_argument(
+        "--bursts",
+        nargs="+",
+        choices=list(BURST_DISTRIBUTIONS),
+        default=["exponential"],
+        help="CPU burst distributions to generate.",
+    )
+    bench_parser.add_argument(
+        "--io",
+        choices=["on", "off", "both"],
+        default="both",
+        help="Run with I/O, without it, or both.",
+    )
+    bench_parser.add_argument(
+        "--quantum",
+        type=int,
+        default=4,
+        help="Quantum for Round Robin cases.",
+    )
+    bench_parser.add_argument(
+        "--engine",
+        choices=["tick", "event"],
+        default=None,
+        help="Simulation engine (defaults to the simulator default).",
+    )
+    bench_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for workload generation and I/O schedules.",
+    )
+    bench_parser.add_argument(
+        "--out",
+        type=str,
+        default=None,
+        help="Write the results as JSON to this path.",
+    )
+    bench_parser.add_argument(
+        "--baseline",
+        type=str,
+        default=None,
+        help="JSON results of an earlier run to compare against.",
+    )
+    bench_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed throughput drop against the baseline, as a fraction.",
+    )
+    bench_parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Run every case in this process (faster, but peak RSS accumulates).",
+    )
+    bench_parser.set_defaults(handler=handle_bench_command)
+
     fs_parser = subparsers.add_parser(
         "fs",
         help="Start an interactive shell for the virtual filesystem.",
@@ -58,8 +378,112 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _parse_int_range(value: str) -> list[int]:
+    """Parse an integer or an inclusive `start:stop[:step]` range."""
+    parts = value.split(":")
+    try:
+        numbers = [int(part) for part in parts]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Invalid integer or range '{value}'") from exc
+    if len(numbers) == 1:
+        return numbers
+    if len(numbers) not in (2, 3) or (len(numbers) == 3 and numbers[2] <= 0):
+        raise argparse.ArgumentTypeError(f"Invalid range '{value}', use start:stop[:step]")
+    step = numbers[2] if len(numbers) == 3 else 1
+    return list(range(numbers[0], numbers[1] + 1, step))
+
+
+def _parse_size(value: str) -> int:
+    """Parse a job count with an optional k/M suffix (e.g. 100k, 1M)."""
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    text = value.strip().lower()
+    factor = multipliers.get(text[-1:], 1)
+    if factor != 1:
+        text = text[:-1]
+    try:
+        size = int(text) * factor
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Invalid job count '{value}'") from exc
+    if size <= 0:
+        raise argparse.ArgumentTypeError(f"Job count must be positive, got '{value}'")
+    return size
+
+
+def _parse_device(value: str) -> IODevice:
+    """Parse `name[:parallelism[:discipline[:tracks[:seek_time]]]]` into an `IODevice`."""
+    parts = value.split(":")
+    if not parts[0] or len(parts) > 5:
+        raise argparse.ArgumentTypeError(
+            f"Invalid device '{value}', use name[:parallelism[:discipline[:tracks[:seek]]]]"
+        )
+    try:
+        return IODevice(
+            name=parts[0],
+            parallelism=int(parts[1]) if len(parts) > 1 and parts[1] else 1,
+            discipline=parts[2] if len(parts) > 2 and parts[2] else "fifo",
+            tracks=int(parts[3]) if len(parts) > 3 and parts[3] else 0,
+            seek_time=float(parts[4]) if len(parts) > 4 and parts[4] else 0.0,
+        )
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Invalid device '{value}': {exc}") from exc
+
+
+def _parse_deadline(value: str) -> tuple[int | None, int | None]:
+    """Split a deadline cell into (absolute, relative); a leading '+' means relative to the arrival."""
+    text = value.strip()
+    if not text:
+        return None, None
+    if text.startswith('+'):
+        return None, int(text[1:])
+    return int(text), None
+
+
+def _parse_bursts(value: str) -> list[int] | None:
+    """Split a `cpu;io;cpu;...` burst trace cell; an empty cell means no trace."""
+    text = value.strip()
+    if not text:
+        return None
+    return [int(part) for part in text.split(';')]
+
+
+def _job_from_csv_row(row: list[str]) -> JobSpec:
+    """Build the JobSpec of one CSV row with at least three columns; raises ValueError on invalid data."""
+    pid = int(row[0].strip())
+    arrival = int(row[1].strip())
+    priority = int(row[3].strip()) if len(row) > 3 and row[3].strip() else None
+    deadline, relative_deadline = _parse_deadline(row[4]) if len(row) > 4 else (None, None)
+    bursts = _parse_bursts(row[5]) if len(row) > 5 else None
+
+    if bursts is not None:
+        job = JobSpec.from_bursts(
+            pid,
+            arrival,
+            bursts,
+            priority=priority,
+            deadline=deadline,
+            relative_deadline=relative_deadline,
+        )
+        if row[2].strip() and int(row[2].strip()) != job.burst:
+            raise ValueError(f"burst time {row[2].strip()} does not match the trace CPU total {job.burst}")
+        return job
+
+    return JobSpec(
+        pid=pid,
+        arrival=arrival,
+        burst=int(row[2].strip()),
+        priority=priority,
+        deadline=deadline,
+        relative_deadline=relative_deadline,
+    )
+
+
 def _load_jobs_from_csv(path: Path) -> list[JobSpec]:
-    """Parse jobs from CSV format: pid,arrival_time,burst_time[,priority]"""
+    """
+    Parse jobs from CSV format: pid,arrival_time,burst_time[,priority[,deadline[,bursts]]]
+
+    `bursts` is a recorded `cpu;io;cpu;...` sequence replayed exactly; the
+    burst time column may then be left empty, otherwise it must match the CPU total.
+    """
     jobs = []
     with open(path, 'r', encoding='utf-8') as f:
         reader = csv.reader(f)
@@ -72,18 +496,7 @@ def _load_jobs_from_csv(path: Path) -> list[JobSpec]:
                 if len(row) < 3:
                     print(f"Warning: Line {line_num} has insufficient columns, skipping")
                     continue
-                
-                pid = int(row[0].strip())
-                arrival = int(row[1].strip())
-                burst = int(row[2].strip())
-                priority = int(row[3].strip()) if len(row) > 3 and row[3].strip() else None
-                
-                jobs.append(JobSpec(
-                    pid=pid,
-                    arrival=arrival,
-                    burst=burst,
-                    priority=priority
-                ))
+                jobs.append(_job_from_csv_row(row))
             except ValueError as e:
                 print(f"Warning: Line {line_num} has invalid data ({e}), skipping")
                 continue
@@ -91,8 +504,170 @@ def _load_jobs_from_csv(path: Path) -> list[JobSpec]:
     return jobs
 
 
+# Bytes of lines read per chunk by the bulk CSV loader.
+_CSV_CHUNK_BYTES = 1 << 20
+# Characters that keep a chunk off the column-at-a-time fast path.
+_CSV_SLOW_MARKERS = ('"', '#', '+', ';')
+# Chunks that are not plain are halved down to this many lines before parsing row by row.
+_CSV_MIN_SPLIT = 64
+
+
+def _extend_plain_chunk(table: PCBTable, lines: list[str]) -> bool:
+    """
+    Append a chunk of plain CSV rows to `table` one column at a time.
+
+    Plain means 3 to 5 integer cells per row, the same count on every row, no
+    quotes, comments, relative deadlines or traces. Returns False, leaving
+    the table untouched, for any other chunk.
+    """
+    text = "".join(lines)
+    if any(marker in text for marker in _CSV_SLOW_MARKERS):
+        return False
+    separators = set(map(str.count, lines, repeat(',')))
+    if len(separators) != 1:
+        return False
+    width = separators.pop() + 1
+    if not 3 <= width <= 5:
+        return False
+    # One flat list of cells, row after row; column k is every width-th cell from k.
+    cells = text.replace('\n', ',').split(',')
+    if text.endswith('\n'):
+        cells.pop()
+    try:
+        # int() accepts the surrounding spaces and a '\r' line ending.
+        columns = [array('q', map(int, cells[index::width])) for index in range(width)]
+    except ValueError:
+        return False
+    table.extend(
+        columns[0],
+        columns[1],
+        columns[2],
+        priorities=columns[3] if len(columns) > 3 else None,
+        deadlines=columns[4] if len(columns) > 4 else None,
+    )
+    return True
+
+
+def _load_table_from_csv(path: Path) -> PCBTable:
+    """
+    Bulk-parse a CSV scenario straight into `PCBTable` columns.
+
+    The file is read in chunks of about `_CSV_CHUNK_BYTES`. Plain chunks are
+    converted a column at a time. Other chunks are halved until the pieces are
+    plain or small, so a stray comment or bad line only sends a few lines
+    through the row parser of `_load_jobs_from_csv`. Row order is kept.
+    Invalid lines are skipped and reported in a single warning rather than
+    one line each.
+    """
+    table = PCBTable()
+    skipped = 0
+    first_error = ""
+
+    def extend(lines: list[str], first_line: int) -> None:
+        nonlocal skipped, first_error
+        if _extend_plain_chunk(table, lines):
+            return
+        if len(lines) > _CSV_MIN_SPLIT:
+            middle = len(lines) // 2
+            extend(lines[:middle], first_line)
+            extend(lines[middle:], first_line + middle)
+            return
+        for offset, row in enumerate(csv.reader(lines)):
+            if not row or (row[0] and row[0].strip().startswith('#')):
+                continue
+            try:
+                if len(row) < 3:
+                    raise ValueError("insufficient columns")
+                jobs_to_table([_job_from_csv_row(row)], table)
+            except ValueError as e:
+                skipped += 1
+                first_error = first_error or f"line {first_line + offset}: {e}"
+
+    line_num = 0
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        while lines := f.readlines(_CSV_CHUNK_BYTES):
+            extend(lines, line_num + 1)
+            line_num += len(lines)
+    if skipped:
+        print(f"Warning: skipped {skipped} invalid line(s) (first at {first_error})")
+    return table
+
+
+def load_table_from_path(path: Path, *, cache: bool = True) -> PCBTable:
+    """
+    Load a scenario straight into a `PCBTable` (for `sim` with either job store).
+
+    CSV files go through the chunked bulk parser, JSON through the regular
+    loader and JSON Lines through the streaming parser. With `cache`, the
+    table is also written next to the scenario as `<name>.pcbt`, stamped with
+    the source's mtime and size, and later loads of the unchanged file read
+    the columns back instead of parsing. Stdin ('-') is never cached.
+    """
+    if str(path) == '-':
+        table = jobs_to_table(iter_jobs_from_jsonl(path))
+        if not len(table):
+            raise ValueError("No valid jobs found on stdin")
+        return table
+    if not path.exists():
+        raise FileNotFoundError(f"Scenario file '{path}' does not exist.")
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    sidecar = path.with_name(path.name + '.pcbt')
+    if cache and sidecar.exists():
+        try:
+            return PCBTable.read_binary(sidecar, stamp=stamp)
+        except (OSError, ValueError):
+            pass  # stale, corrupt or foreign sidecar: parse again and overwrite it
+
+    if path.suffix.lower() == '.csv':
+        table = _load_table_from_csv(path)
+    elif path.suffix.lower() == '.json':
+        table = jobs_to_table(_load_jobs_from_json(path))
+    elif is_jsonl_source(path):
+        table = jobs_to_table(iter_jobs_from_jsonl(path))
+    else:
+        raise ValueError(f"Unsupported file format: {path.suffix}. Use .csv, .json, .jsonl or .ndjson")
+
+    if not len(table):
+        raise ValueError(f"No valid jobs found in {path}")
+
+    if cache:
+        try:
+            table.write_binary(sidecar, stamp=stamp)
+        except OSError:
+            pass  # e.g. a read-only scenario directory; the cache is only an optimization
+    return table
+
+
+def _job_from_json(job_data: dict, index: int) -> JobSpec:
+    """Build the JobSpec of one JSON job object; `index` numbers jobs without a pid."""
+    metadata = dict(job_data.get('metadata') or {})
+    if job_data.get('io_device') is not None:
+        metadata['io_device'] = str(job_data['io_device'])
+    fields = dict(
+        priority=int(job_data['priority']) if job_data.get('priority') is not None else None,
+        deadline=int(job_data['deadline']) if job_data.get('deadline') is not None else None,
+        relative_deadline=(
+            int(job_data['relative_deadline']) if job_data.get('relative_deadline') is not None else None
+        ),
+        metadata=metadata,
+    )
+    pid = int(job_data.get('pid', index + 1))
+    arrival = int(job_data.get('arrival', 0))
+    if job_data.get('bursts') is not None:
+        return JobSpec.from_bursts(pid, arrival, job_data['bursts'], **fields)
+    return JobSpec(pid=pid, arrival=arrival, burst=int(job_data.get('burst', 1)), **fields)
+
+
 def _load_jobs_from_json(path: Path) -> list[JobSpec]:
-    """Parse jobs from JSON format: [{"pid": int, "arrival": int, "burst": int, "priority": int?}]"""
+    """
+    Parse jobs from JSON format:
+    [{"pid": int, "arrival": int, "burst": int, "priority": int?, "deadline": int?, "relative_deadline": int?,
+      "io_device": str?, "metadata": object?, "bursts": [int]?}]
+
+    `bursts` is a recorded [cpu, io, cpu, ...] sequence replayed exactly; it
+    replaces `burst`.
+    """
     with open(path, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
@@ -106,12 +681,7 @@ def _load_jobs_from_json(path: Path) -> list[JobSpec]:
             continue
             
         try:
-            jobs.append(JobSpec(
-                pid=int(job_data.get('pid', i + 1)),
-                arrival=int(job_data.get('arrival', 0)),
-                burst=int(job_data.get('burst', 1)),
-                priority=int(job_data['priority']) if job_data.get('priority') is not None else None
-            ))
+            jobs.append(_job_from_json(job_data, i))
         except (ValueError, KeyError) as e:
             print(f"Warning: Item {i} has invalid data ({e}), skipping")
             continue
@@ -119,6 +689,63 @@ def _load_jobs_from_json(path: Path) -> list[JobSpec]:
     return jobs
 
 
+# Newline-delimited JSON: one job object per line. A trailing ".gz" is decompressed on the fly.
+JSONL_SUFFIXES = ('.jsonl', '.ndjson')
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+def is_jsonl_source(source: Path | str) -> bool:
+    """Whether `source` is read as JSON Lines: stdin ('-') or a .jsonl/.ndjson file, gzipped or not."""
+    if str(source) == '-':
+        return True
+    suffixes = [suffix.lower() for suffix in Path(source).suffixes]
+    if suffixes[-1:] == ['.gz']:
+        suffixes.pop()
+    return bool(suffixes) and suffixes[-1] in JSONL_SUFFIXES
+
+
+def _jobs_from_lines(lines: Iterable[str]) -> Iterator[JobSpec]:
+    index = 0
+    for line_num, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            job_data = json.loads(line)
+            if not isinstance(job_data, dict):
+                raise ValueError("not a JSON object")
+            job = _job_from_json(job_data, index)
+        except (ValueError, KeyError) as e:
+            print(f"Warning: Line {line_num} has invalid data ({e}), skipping")
+            continue
+        index += 1
+        yield job
+
+
+def iter_jobs_from_jsonl(source: Path | str) -> Iterator[JobSpec]:
+    """
+    Lazily parse a JSON Lines scenario, one job object per line.
+
+    `source` is a .jsonl/.ndjson file, optionally gzip-compressed (.gz), or
+    '-' for stdin, where gzip is recognized by its magic bytes. Objects take
+    the same keys as the JSON format. Lines are parsed as the simulator
+    admits jobs, so the file is never held in memory and, for streaming runs,
+    must be sorted by arrival. Blank lines are skipped; invalid ones are
+    reported and skipped.
+    """
+    if str(source) == '-':
+        stream = sys.stdin.buffer
+        if stream.peek(len(_GZIP_MAGIC))[: len(_GZIP_MAGIC)] == _GZIP_MAGIC:
+            stream = gzip.GzipFile(fileobj=stream)
+        yield from _jobs_from_lines(io.TextIOWrapper(stream, encoding='utf-8'))
+        return
+    path = Path(source)
+    if not path.exists():
+        raise FileNotFoundError(f"Scenario file '{path}' does not exist.")
+    opener = gzip.open if path.suffix.lower() == '.gz' else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        yield from _jobs_from_lines(f)
+
+
 def _print_fs_help() -> None:
     """Print help for filesystem commands."""
     help_text = """
@@ -161,17 +788,133 @@ def main(argv: Sequence[str] | None = None) -> int:
 def handle_sim_command(args: argparse.Namespace) -> int:
     """Dispatch the sim subcommand to the scheduler service."""
     sim_service = SimService()
-    jobs = load_jobs_from_path(Path(args.input))
+    jobs: Iterable[JobSpec] | PCBTable
+    # Stdin, or JSON Lines with --stream, goes straight into the arrival path, parsed as jobs
+    # are admitted; such input must already be sorted by arrival.
+    stream_input = args.input == "-" or (args.stream and is_jsonl_source(args.input))
+    streaming = args.job_store == "objects" and stream_input
+    if args.job_store == "table":
+        jobs = load_table_from_path(Path(args.input), cache=not args.no_cache)
+    elif streaming:
+        jobs = iter_jobs_from_jsonl(args.input)
+    else:
+        # Same bulk parser and .pcbt cache as the table store; PCBs are then built from the rows.
+        jobs = table_to_jobs(load_table_from_path(Path(args.input), cache=not args.no_cache))
     request = SimulationRequest(
         jobs=jobs,
         algorithm=args.algo,
         quantum=args.quantum,
+        options={
+            "cpus": args.cpus,
+            "queue_policy": args.queue_policy,
+            "seed": args.seed,
+            "engine": args.engine,
+            "trace": args.trace_out is not None,
+            "profile": args.profile,
+            "dispatch_latency": args.dispatch_latency,
+            "cache_warmup": args.cache_warmup,
+            "cache_decay": args.cache_decay,
+            "io_devices": args.devices or (),
+        },
+        algorithm_options=_algorithm_options(args),
+        job_store=args.job_store,
+        streaming=streaming,
     )
-    metrics = sim_service.run(request)
+    try:
+        metrics = sim_service.run(request)
+    except ValueError as exc:
+        # e.g. a streamed job that arrives before the one ahead of it
+        print(f"Error: {exc}")
+        return 1
     print(format_metrics(metrics))
+    if metrics.profile is not None:
+        print(format_profile(metrics.profile))
+    if args.trace_out is not None and metrics.trace is not None:
+        trace_path = Path(args.trace_out)
+        if trace_path.suffix.lower() == ".json":
+            metrics.trace.write_chrome_trace(trace_path)
+        else:
+            metrics.trace.write_binary(trace_path)
+        print(f"Trace written to {trace_path} ({len(metrics.trace)} segments)")
+    return 0
+
+
+def _algorithm_options(args: argparse.Namespace) -> dict[str, object]:
+    """Collect the algorithm tuning flags that were given on the command line."""
+    options: dict[str, object] = {}
+    if args.aging is not None:
+        options["aging_interval"] = args.aging
+    if args.level_quanta is not None:
+        options["quanta"] = args.level_quanta
+        options["levels"] = args.levels if args.levels is not None else len(args.level_quanta)
+    elif args.levels is not None:
+        options["levels"] = args.levels
+    if args.boost is not None:
+        options["boost_interval"] = args.boost
+    if args.target_percentile is not None:
+        options["percentile"] = args.target_percentile
+    if args.burst_window is not None:
+        options["window"] = args.burst_window
+    return options
+
+
+def handle_sweep_command(args: argparse.Namespace) -> int:
+    """Run a parameter sweep through the scheduler service and print a comparison table."""
+    traces = {path: load_jobs_from_path(Path(path)) for path in args.inputs}
+    option_grid: dict[str, list[object]] = {}
+    if args.no_io:
+        option_grid["io_enabled"] = [False]
+    if args.io_interval_mean:
+        option_grid["io_interval_mean"] = list(args.io_interval_mean)
+    if args.io_duration_mean:
+        option_grid["io_duration_mean"] = list(args.io_duration_mean)
+    if args.cpu_grid:
+        option_grid["cpus"] = list(args.cpu_grid)
+    if args.dispatch_latency_grid:
+        option_grid["dispatch_latency"] = list(args.dispatch_latency_grid)
+    if args.sweep_seed is not None:
+        option_grid["seed"] = [args.sweep_seed]
+    request = SweepRequest(
+        traces=traces,
+        algorithms=args.algos,
+        quanta=sorted({quantum for group in args.quanta for quantum in group}),
+        option_grid=option_grid,
+        max_workers=args.workers,
+    )
+    results = SimService().sweep(request)
+    print(format_sweep_results(results))
     return 0
 
 
+def handle_bench_command(args: argparse.Namespace) -> int:
+    """Run the benchmark grid, optionally saving it and checking it against a baseline."""
+    service = BenchService()
+    options: dict[str, object] = {}
+    if args.engine is not None:
+        options["engine"] = args.engine
+    request = BenchRequest(
+        sizes=args.sizes,
+        algorithms=args.algos,
+        arrivals=args.arrivals,
+        bursts=args.bursts,
+        io={"on": (True,), "off": (False,), "both": (False, True)}[args.io],
+        quantum=args.quantum,
+        seed=args.seed,
+        options=options,
+        isolate=not args.no_isolate,
+    )
+    results = service.run(request)
+    print(format_bench_results(results))
+    if args.out is not None:
+        service.write(results, args.out)
+        print(f"Results written to {args.out}")
+    if args.baseline is None:
+        return 0
+    comparisons = service.compare(results, service.load_baseline(args.baseline), tolerance=args.tolerance)
+    print(format_bench_comparison(comparisons))
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+
 def handle_fs_command(args: argparse.Namespace) -> int:
     """Launch a minimal REPL that uses FsService for each command."""
     service = bootstrap_fs_service(username=args.user)
@@ -183,20 +926,26 @@ def load_jobs_from_path(path: Path) -> list[JobSpec]:
     """
     Load job definitions from disk.
     
-    Supports CSV format: pid,arrival_time,burst_time[,priority]
-    Supports JSON format: [{"pid": int, "arrival": int, "burst": int, "priority": int?}]
+    Supports CSV format: pid,arrival_time,burst_time[,priority[,deadline[,bursts]]]
+    Supports JSON format: [{"pid": int, "arrival": int, "burst": int, "priority": int?, "deadline": int?}]
+    Deadlines are absolute ticks; "+N" in CSV or "relative_deadline" in JSON counts from the arrival.
+    Recorded burst traces ("3;2;4" in CSV, "bursts": [3, 2, 4] in JSON) replace the synthetic I/O.
+    JSON Lines (.jsonl/.ndjson, optionally .gz, or '-' for stdin) holds one JSON job object per line;
+    see `iter_jobs_from_jsonl` to consume it lazily instead.
     """
-    if not path.exists():
+    if str(path) != '-' and not path.exists():
         raise FileNotFoundError(f"Scenario file '{path}' does not exist.")
     
     jobs = []
     
-    if path.suffix.lower() == '.csv':
+    if is_jsonl_source(path):
+        jobs = list(iter_jobs_from_jsonl(path))
+    elif path.suffix.lower() == '.csv':
         jobs = _load_jobs_from_csv(path)
     elif path.suffix.lower() == '.json':
         jobs = _load_jobs_from_json(path)
     else:
-        raise ValueError(f"Unsupported file format: {path.suffix}. Use .csv or .json")
+        raise ValueError(f"Unsupported file format: {path.suffix}. Use .csv, .json, .jsonl or .ndjson")
     
     if not jobs:
         raise ValueError(f"No valid jobs found in {path}")
@@ -208,7 +957,8 @@ def format_metrics(metrics: SimulationMetrics) -> str:
     """
     Render simulation metrics for terminal output.
     """
-    if not metrics.processes:
+    online_count = metrics.online.count if metrics.online is not None else 0
+    if len(metrics.pids) == 0 and online_count == 0:
         return "No process metrics available (simulation may not have run properly)."
     
     output = []
@@ -216,17 +966,20 @@ def format_metrics(metrics: SimulationMetrics) -> str:
     output.append("SIMULATION RESULTS")
     output.append("=" * 80)
     
-    # Process metrics table
-    output.append("\nPER-PROCESS METRICS:")
-    output.append("-" * 60)
-    output.append(f"{'PID':<5} {'Wait Time':<12} {'Turnaround':<12} {'Response':<10}")
-    output.append("-" * 60)
-    
-    for proc in metrics.processes:
-        wait = f"{proc.waiting_time:.1f}" if proc.waiting_time is not None else "N/A"
-        turnaround = f"{proc.turnaround_time:.1f}" if proc.turnaround_time is not None else "N/A"
-        response = f"{proc.response_time:.1f}" if proc.response_time is not None else "N/A"
-        output.append(f"{proc.pid:<5} {wait:<12} {turnaround:<12} {response:<10}")
+    # Process metrics table (absent when only online statistics were kept)
+    if len(metrics.pids) > 0:
+        output.append("\nPER-PROCESS METRICS:")
+        output.append("-" * 60)
+        output.append(f"{'PID':<5} {'Wait Time':<12} {'Turnaround':<12} {'Response':<10}")
+        output.append("-" * 60)
+
+        columns = zip(metrics.pids, metrics.waiting_times, metrics.turnaround_times, metrics.response_times)
+        for pid, waiting, turnaround, response in columns:
+            output.append(
+                f"{pid:<5} {_format_value(waiting):<12} {_format_value(turnaround):<12} {_format_value(response):<10}"
+            )
+    else:
+        output.append(f"\nFinished processes: {online_count} (online statistics, percentiles estimated)")
     
     # System metrics
     output.append("\nSYSTEM METRICS:")
@@ -234,29 +987,189 @@ def format_metrics(metrics: SimulationMetrics) -> str:
     if metrics.throughput is not None:
         output.append(f"Throughput: {metrics.throughput:.2f} processes/unit")
     if metrics.cpu_utilization is not None:
-        output.append(f"CPU Utilization: {metrics.cpu_utilization:.1f}%")
+        output.append(f"CPU Utilization: {metrics.cpu_utilization * 100:.1f}%")
     output.append(f"Context Switches: {metrics.context_switches}")
+    if metrics.quantum_history:
+        output.append(f"Quantum: {_format_quantum_history(metrics.quantum_history)}")
+    if metrics.switch_time > 0:
+        output.append(
+            f"Switch Overhead: {metrics.switch_time} ticks "
+            f"({metrics.switch_time / metrics.busy_time * 100:.1f}% of busy time)"
+        )
+        if metrics.effective_utilization is not None:
+            output.append(f"Effective CPU Utilization: {metrics.effective_utilization * 100:.1f}%")
+    if len(metrics.core_busy_time) > 1:
+        for index, busy in enumerate(metrics.core_busy_time):
+            utilization = metrics.core_utilization[index] if metrics.core_utilization else 0.0
+            output.append(
+                f"  CPU {index}: busy {busy}, utilization {utilization * 100:.1f}%, "
+                f"context switches {metrics.core_context_switches[index]}"
+            )
     
     # Average calculations
-    if metrics.processes:
-        wait_times = [p.waiting_time for p in metrics.processes if p.waiting_time is not None]
-        turnaround_times = [p.turnaround_time for p in metrics.processes if p.turnaround_time is not None]
-        response_times = [p.response_time for p in metrics.processes if p.response_time is not None]
-        
-        if wait_times:
-            avg_wait = sum(wait_times) / len(wait_times)
-            output.append(f"Average Waiting Time: {avg_wait:.2f}")
-        if turnaround_times:
-            avg_turnaround = sum(turnaround_times) / len(turnaround_times)
-            output.append(f"Average Turnaround Time: {avg_turnaround:.2f}")
-        if response_times:
-            avg_response = sum(response_times) / len(response_times)
-            output.append(f"Average Response Time: {avg_response:.2f}")
-    
+    summaries = metrics.summaries()
+    for key, label in (("waiting", "Waiting"), ("turnaround", "Turnaround"), ("response", "Response")):
+        if summaries[key].mean is not None:
+            output.append(f"Average {label} Time: {summaries[key].mean:.2f}")
+
+    if metrics.deadline_jobs > 0:
+        output.append("\nDEADLINES:")
+        output.append("-" * 30)
+        output.append(f"Jobs with deadline: {metrics.deadline_jobs}")
+        output.append(f"Deadline Misses: {metrics.deadline_misses} ({metrics.deadline_miss_rate * 100:.1f}%)")
+        output.append(f"Max Lateness: {metrics.max_lateness:.2f}")
+
+    if metrics.devices:
+        output.append("\nI/O DEVICES:")
+        output.append("-" * 80)
+        output.append(
+            f"{'Device':<12} {'Channels':>8} {'Requests':>9} {'Util%':>7} "
+            f"{'MeanWait':>9} {'MaxWait':>8} {'MaxQueue':>9}"
+        )
+        output.append("-" * 80)
+        for device in metrics.devices.values():
+            utilization = device.utilization * 100 if device.utilization is not None else 0.0
+            mean_wait = f"{device.mean_wait:.2f}" if device.mean_wait is not None else "N/A"
+            output.append(
+                f"{device.name:<12} {device.parallelism:>8} {device.requests:>9} {utilization:>7.1f} "
+                f"{mean_wait:>9} {device.max_wait:>8} {device.max_queue:>9}"
+            )
+
+    # Distribution of per-process metrics
+    output.append("\nDISTRIBUTION:")
+    output.append("-" * 80)
+    output.append(
+        f"{'Metric':<12} {'Mean':>9} {'P50':>9} {'P95':>9} {'P99':>9} {'Max':>9} {'StdDev':>9} {'Jain':>7}"
+    )
+    output.append("-" * 80)
+    rows = (("waiting", "Waiting"), ("turnaround", "Turnaround"), ("response", "Response"), ("tardiness", "Tardiness"))
+    for key, label in rows:
+        summary = summaries[key]
+        if summary.count == 0:
+            continue
+        output.append(
+            f"{label:<12} {summary.mean:>9.2f} {summary.p50:>9.2f} {summary.p95:>9.2f} "
+            f"{summary.p99:>9.2f} {summary.max:>9.2f} {summary.stddev:>9.2f} {summary.fairness:>7.3f}"
+        )
+
     output.append("=" * 80)
     return "\n".join(output)
 
 
+def format_profile(profile: SimulationProfile) -> str:
+    """
+    Render the per-phase timers and loop counters of a profiled run.
+    """
+    output = ["=" * 50, "PROFILE", "=" * 50]
+    timed = sum(profile.phase_times.values())
+    for phase, seconds in profile.phase_times.items():
+        share = seconds / timed * 100 if timed else 0.0
+        output.append(f"{phase:<14} {seconds * 1000:>10.2f} ms {share:>6.1f}%")
+    output.append(f"{'total (wall)':<14} {profile.wall_time * 1000:>10.2f} ms")
+    output.append("-" * 50)
+    counters = [
+        ("Loop steps", profile.steps),
+        ("Scheduling decisions", profile.decisions),
+        ("Dispatches", profile.dispatches),
+        ("Preemptions", profile.preemptions),
+        ("I/O blocks", profile.blocks),
+        ("Ready queue length", f"max {profile.ready_queue_max}, mean {profile.ready_queue_mean:.2f}"),
+        ("Blocked queue length", f"max {profile.blocked_queue_max}, mean {profile.blocked_queue_mean:.2f}"),
+    ]
+    output.extend(f"{label + ':':<22}{value}" for label, value in counters)
+    output.append("=" * 50)
+    return "\n".join(output)
+
+
+def _format_quantum_history(history: Sequence[tuple[int, int]], limit: int = 8) -> str:
+    """Render quantum changes as `q@t` steps, keeping the first and last few."""
+    steps = [f"{quantum}@{time}" for time, quantum in history]
+    if len(steps) > limit:
+        steps = steps[: limit // 2] + ["..."] + steps[-(limit // 2):]
+    return f"{' -> '.join(steps)} ({len(history) - 1} changes)"
+
+
+def _format_value(value: float) -> str:
+    """Format a per-process metric column entry; NaN marks a missing value."""
+    return "N/A" if math.isnan(value) else f"{value:.1f}"
+
+
+def format_sweep_results(results: Sequence[SweepResult]) -> str:
+    """
+    Render one comparison row per sweep point.
+    """
+    if not results:
+        return "No sweep results."
+
+    def average(values: Sequence[float]) -> str:
+        mean = summarize(values).mean
+        return f"{mean:.2f}" if mean is not None else "N/A"
+
+    option_names = sorted({name for result in results for name in result.point.options})
+    algo_width = max(len("Algo"), *(len(result.point.algorithm) for result in results))
+    header = f"{'Trace':<28} {'Algo':<{algo_width}} {'Q':>4} "
+    header += "".join(f"{name:>18} " for name in option_names)
+    header += f"{'Avg Wait':>9} {'Avg Turn':>9} {'Avg Resp':>9} {'Thru':>6} {'CPU%':>6} {'CS':>6}"
+    show_switch_cost = any(result.metrics.switch_time > 0 for result in results)
+    if show_switch_cost:
+        header += f" {'Eff%':>6}"
+    output = ["=" * len(header), "SWEEP RESULTS", "=" * len(header), header, "-" * len(header)]
+    for result in results:
+        point, metrics = result.point, result.metrics
+        quantum = str(point.quantum) if point.quantum is not None else "-"
+        row = f"{Path(point.trace).name[:28]:<28} {point.algorithm:<{algo_width}} {quantum:>4} "
+        row += "".join(f"{str(point.options.get(name, '-')):>18} " for name in option_names)
+        row += f"{average(metrics.waiting_times):>9} "
+        row += f"{average(metrics.turnaround_times):>9} "
+        row += f"{average(metrics.response_times):>9} "
+        throughput = f"{metrics.throughput:.3f}" if metrics.throughput is not None else "N/A"
+        utilization = f"{metrics.cpu_utilization * 100:.1f}" if metrics.cpu_utilization is not None else "N/A"
+        row += f"{throughput:>6} {utilization:>6} {metrics.context_switches:>6}"
+        if show_switch_cost:
+            effective = metrics.effective_utilization
+            row += f" {effective * 100:>6.1f}" if effective is not None else f" {'N/A':>6}"
+        output.append(row)
+    output.append("=" * len(header))
+    return "\n".join(output)
+
+
+def format_bench_results(results: Sequence[BenchResult]) -> str:
+    """
+    Render one row per benchmark case.
+    """
+    if not results:
+        return "No benchmark results."
+    case_width = max(len("Case"), *(len(result.case.name) for result in results))
+    header = f"{'Case':<{case_width}} {'Wall s':>9} {'Ticks':>12} {'Ticks/s':>12} {'Jobs/s':>11} {'Peak RSS MiB':>13}"
+    output = ["=" * len(header), "BENCHMARK RESULTS", "=" * len(header), header, "-" * len(header)]
+    for result in results:
+        rss = f"{result.peak_rss_kb / 1024:.1f}" if result.peak_rss_kb is not None else "N/A"
+        output.append(
+            f"{result.case.name:<{case_width}} {result.wall_time:>9.3f} {result.ticks:>12} "
+            f"{result.ticks_per_second:>12,.0f} {result.jobs_per_second:>11,.0f} {rss:>13}"
+        )
+    output.append("=" * len(header))
+    return "\n".join(output)
+
+
+def format_bench_comparison(comparisons: Sequence[BenchComparison]) -> str:
+    """
+    Render throughput against the baseline, flagging regressions.
+    """
+    if not comparisons:
+        return "No matching cases in the baseline."
+    case_width = max(len("Case"), *(len(comparison.name) for comparison in comparisons))
+    header = f"{'Case':<{case_width}} {'Metric':<17} {'Baseline':>12} {'Current':>12} {'Ratio':>7}"
+    output = [header, "-" * len(header)]
+    for comparison in comparisons:
+        flag = "  REGRESSION" if comparison.regressed else ""
+        output.append(
+            f"{comparison.name:<{case_width}} {comparison.metric:<17} {comparison.baseline:>12,.0f} "
+            f"{comparison.current:>12,.0f} {comparison.ratio:>7.2f}{flag}"
+        )
+    return "\n".join(output)
+
+
 def bootstrap_fs_service(*, username: str) -> FsService:
     """Create a fresh FsService with a root directory for the given user."""
     user = User(username=username)
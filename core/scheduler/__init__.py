@@ -1,14 +1,28 @@
 """Scheduler core primitives exposed for higher layers."""
 
-from .metrics import ProcessMetrics, SimulationMetrics
+from .devices import IODevice
+from .metrics import DeviceMetrics, MetricSummary, OnlineMetrics, ProcessMetrics, SimulationMetrics, summarize
 from .pcb import PCB
+from .pcb_table import PCBTable, PCBView
+from .profiling import SimulationObserver, SimulationProfile
 from .simulator import SchedulerSimulator
 from .states import ProcessState
+from .trace import TraceRecorder
 
 __all__ = [
+    "DeviceMetrics",
+    "IODevice",
+    "MetricSummary",
+    "OnlineMetrics",
     "PCB",
+    "PCBTable",
+    "PCBView",
     "ProcessMetrics",
     "ProcessState",
     "SchedulerSimulator",
     "SimulationMetrics",
+    "SimulationObserver",
+    "SimulationProfile",
+    "TraceRecorder",
+    "summarize",
 ]
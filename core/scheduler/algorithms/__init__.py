@@ -1,14 +1,28 @@
 """Public exports for the available scheduling algorithms."""
 
+from .adaptive_rr import AdaptiveRoundRobinAlgorithm
 from .base import SchedulingAlgorithm, SchedulingDecision
+from .edf import EDFAlgorithm
 from .fcfs import FCFSAlgorithm
+from .lottery import LotteryAlgorithm
+from .mlfq import MLFQAlgorithm
+from .priority import PriorityAlgorithm
 from .rr import RoundRobinAlgorithm
 from .sjf import SJFAlgorithm
+from .srtf import SRTFAlgorithm
+from .stride import StrideAlgorithm
 
 __all__ = [
+    "AdaptiveRoundRobinAlgorithm",
     "SchedulingAlgorithm",
     "SchedulingDecision",
+    "EDFAlgorithm",
     "FCFSAlgorithm",
+    "LotteryAlgorithm",
+    "MLFQAlgorithm",
+    "PriorityAlgorithm",
     "RoundRobinAlgorithm",
     "SJFAlgorithm",
+    "SRTFAlgorithm",
+    "StrideAlgorithm",
 ]
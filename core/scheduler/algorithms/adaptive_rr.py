@@ -0,0 +1,140 @@
+"""Round Robin that tunes its quantum from the observed CPU bursts."""
+
+from __future__ import annotations
+
+import copy
+import math
+from typing import Any, Dict, List, Tuple
+
+from ..metrics import SlidingWindowQuantile
+from ..pcb import PCB
+from ..queues import ReadyQueue
+from ..states import ProcessState
+from .base import SchedulingDecision
+from .rr import RoundRobinAlgorithm
+
+
+class _QuantumTuner:
+    """Burst window, current quantum and its history, shared by every core's copy of the algorithm."""
+
+    def __init__(self, quantum: int, window: int) -> None:
+        self.quantum = quantum
+        self.bursts = SlidingWindowQuantile(window)
+        self.history: List[Tuple[int, int]] = [(0, quantum)]
+        self.observed = 0
+        self.pending: List[int] = []
+
+
+class AdaptiveRoundRobinAlgorithm(RoundRobinAlgorithm):
+    """
+    Round Robin whose quantum follows a percentile of recent CPU bursts.
+
+    A CPU burst is the CPU time a job uses between two I/O waits, or up to
+    its completion. The last `window` bursts feed a sliding-window quantile,
+    and every `update_every` bursts the quantum becomes the `percentile` of
+    that window, rounded up and clamped to [min_quantum, max_quantum]. With
+    the default 0.8, about four bursts in five finish or block without being
+    preempted. On several cores all copies share one window and quantum.
+    Every quantum adopted is kept in `quantum_history` as (time, quantum)
+    pairs, starting with the initial one.
+    """
+
+    name = "rr-adaptive"
+
+    def __init__(
+        self,
+        quantum: int = 4,
+        *,
+        percentile: float = 0.8,
+        window: int = 64,
+        update_every: int = 8,
+        min_quantum: int = 1,
+        max_quantum: int | None = None,
+    ) -> None:
+        if not 0.0 < percentile <= 1.0:
+            raise ValueError("The target percentile must be in (0, 1].")
+        if update_every < 1:
+            raise ValueError("The quantum must be updated at least every burst.")
+        if min_quantum < 1 or (max_quantum is not None and max_quantum < min_quantum):
+            raise ValueError("Quantum bounds must satisfy 1 <= min_quantum <= max_quantum.")
+        self.percentile = percentile
+        self.window = window
+        self.update_every = update_every
+        self.min_quantum = min_quantum
+        self.max_quantum = max_quantum
+        self._current: PCB | None = None
+        super().__init__(quantum)
+
+    @property
+    def quantum(self) -> int:
+        return self._tuner.quantum
+
+    @quantum.setter
+    def quantum(self, value: int) -> None:
+        # Set from outside (constructor or `SimulationConfig.time_slice`): the new starting point.
+        self.initial_quantum = value
+        self._tuner = _QuantumTuner(value, self.window)
+
+    @property
+    def quantum_history(self) -> List[Tuple[int, int]]:
+        """(time, quantum) for the initial quantum and every change since."""
+        return self._tuner.history
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "AdaptiveRoundRobinAlgorithm":
+        # Per-core copies keep their own rotation state but tune one shared quantum.
+        memo[id(self._tuner)] = self._tuner
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        for name, value in vars(self).items():
+            setattr(clone, name, copy.deepcopy(value, memo))
+        return clone
+
+    def reset(self) -> None:
+        """Restore the initial quantum and forget the observed bursts."""
+        super().reset()
+        self._tuner = _QuantumTuner(self.initial_quantum, self.window)
+        self._current = None
+
+    def on_io_return(self, pcb: PCB) -> None:
+        """Record the burst that ended with this I/O; a new one starts now."""
+        self._tuner.pending.append(pcb.executed_time - pcb.burst_mark)
+        pcb.burst_mark = pcb.executed_time
+
+    def next_tick(
+        self,
+        *,
+        current_time: int,
+        running: PCB | None,
+        ready_queue: ReadyQueue,
+    ) -> SchedulingDecision:
+        """Fold in the bursts seen since the last decision, then rotate as Round Robin does."""
+        current = self._current
+        if current is not None and current is not running and current.state is ProcessState.TERMINATED:
+            self._tuner.pending.append(current.executed_time - current.burst_mark)
+        if self._tuner.pending:
+            self._observe(current_time)
+        decision = super().next_tick(current_time=current_time, running=running, ready_queue=ready_queue)
+        self._current = decision.next_process
+        return decision
+
+    def _observe(self, current_time: int) -> None:
+        tuner = self._tuner
+        for burst in tuner.pending:
+            tuner.bursts.add(burst)
+            tuner.observed += 1
+            if tuner.observed % self.update_every == 0:
+                self._retune(current_time)
+        tuner.pending.clear()
+
+    def _retune(self, current_time: int) -> None:
+        tuner = self._tuner
+        quantile = tuner.bursts.quantile(self.percentile)
+        if quantile is None:
+            return
+        target = math.ceil(quantile)
+        target = max(target, self.min_quantum)
+        if self.max_quantum is not None:
+            target = min(target, self.max_quantum)
+        if target != tuner.quantum:
+            tuner.quantum = target
+            tuner.history.append((current_time, target))
@@ -33,10 +33,25 @@ class SchedulingAlgorithm(Protocol):
         """Reset internal state before a new simulation run."""
         raise NotImplementedError
 
+    def create_ready_queue(self) -> ReadyQueue:
+        """Build the ready queue the simulator should hand to this algorithm."""
+        return ReadyQueue()
+
     def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
         """Load the ready queue before starting the simulation loop."""
         raise NotImplementedError
 
+    def on_io_return(self, pcb: PCB) -> None:
+        """Called when `pcb` finishes its I/O, right before it re-enters a ready queue."""
+
+    def on_run_start(self, pcb: PCB, current_time: int) -> None:
+        """
+        Called when a charged context switch to `pcb` completes and it starts running.
+
+        Switches are not interrupted, so `next_tick` is not consulted while one
+        is paid for; time-sliced algorithms restart the quantum here.
+        """
+
     def next_tick(
         self,
         *,
@@ -46,3 +61,20 @@ class SchedulingAlgorithm(Protocol):
     ) -> SchedulingDecision:
         """Return the next scheduling decision."""
         raise NotImplementedError
+
+    def next_event_time(
+        self,
+        *,
+        current_time: int,
+        running: PCB,
+        ready_queue: ReadyQueue,
+    ) -> int | None:
+        """
+        Return the earliest tick at which `next_tick` may stop keeping `running`.
+
+        The event-driven engine calls this right after a decision, assuming the
+        ready queue only changes through arrivals or I/O completions (which are
+        events on their own). None means the decision can only change on such
+        external events. The default is conservative and forces tick stepping.
+        """
+        return current_time + 1
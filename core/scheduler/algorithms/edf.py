@@ -0,0 +1,78 @@
+"""Earliest Deadline First scheduling algorithm."""
+
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+from ..pcb import PCB
+from ..queues import PriorityReadyQueue, ReadyQueue
+from .base import SchedulingAlgorithm, SchedulingDecision
+
+
+def deadline_key(pcb: PCB) -> float:
+    """Heap key of `pcb`: its absolute deadline, with jobs without one last."""
+    return math.inf if pcb.deadline is None else pcb.deadline
+
+
+class EDFAlgorithm(SchedulingAlgorithm):
+    """
+    Earliest Deadline First: the job whose deadline comes first gets the CPU.
+
+    Ready jobs sit in a min-heap keyed by absolute deadline, so selection is
+    an O(1) peek and each dispatch costs O(log n). Jobs without a deadline run
+    only when no job with one is waiting, in arrival order. With
+    `preemptive=True` (the default) a newly ready job with a strictly earlier
+    deadline takes the CPU right away; ties keep the running job.
+    """
+
+    name = "edf"
+
+    def __init__(self, *, preemptive: bool = True) -> None:
+        self.preemptive = preemptive
+
+    def reset(self) -> None:
+        """Reset algorithm state between runs."""
+        # EDF keeps all of its state in the ready queue.
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """Heap keyed by (deadline, enqueue order)."""
+        return PriorityReadyQueue(key=deadline_key)
+
+    def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
+        """Initial load enqueues the jobs in arrival order; the heap does the ordering."""
+        ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.arrival_time))
+
+    def next_tick(
+        self,
+        *,
+        current_time: int,  # noqa: ARG002 - reserved for stats
+        running: PCB | None,
+        ready_queue: ReadyQueue,
+    ) -> SchedulingDecision:
+        """Run the earliest deadline, preempting the running job if allowed and outranked."""
+        if len(ready_queue) == 0 or (running is not None and not self.preemptive):
+            return SchedulingDecision(next_process=running)
+
+        earliest = self._heap(ready_queue).peek()
+        if running is not None and deadline_key(running) <= deadline_key(earliest):
+            return SchedulingDecision(next_process=running)
+
+        ready_queue.dequeue()
+        return SchedulingDecision(next_process=earliest, preempt_current=running is not None)
+
+    def next_event_time(
+        self,
+        *,
+        current_time: int,  # noqa: ARG002 - part of the protocol
+        running: PCB,  # noqa: ARG002 - part of the protocol
+        ready_queue: ReadyQueue,  # noqa: ARG002 - part of the protocol
+    ) -> int | None:
+        """Deadlines are fixed, so only arrivals and I/O completions change the order."""
+        return None
+
+    @staticmethod
+    def _heap(ready_queue: ReadyQueue) -> PriorityReadyQueue:
+        if not isinstance(ready_queue, PriorityReadyQueue):
+            raise TypeError("EDFAlgorithm needs the PriorityReadyQueue built by create_ready_queue().")
+        return ready_queue
@@ -34,3 +34,13 @@ class FCFSAlgorithm(SchedulingAlgorithm):
 
         next_proc = ready_queue.dequeue()
         return SchedulingDecision(next_process=next_proc)
+
+    def next_event_time(
+        self,
+        *,
+        current_time: int,  # noqa: ARG002 - part of the protocol
+        running: PCB,  # noqa: ARG002 - part of the protocol
+        ready_queue: ReadyQueue,  # noqa: ARG002 - part of the protocol
+    ) -> int | None:
+        """FCFS never preempts, so only external events matter."""
+        return None
@@ -0,0 +1,120 @@
+"""Lottery scheduling algorithm (proportional share)."""
+
+from __future__ import annotations
+
+import random
+from typing import Iterable
+
+from ..pcb import PCB
+from ..queues import LotteryReadyQueue, ReadyQueue
+from .base import SchedulingAlgorithm, SchedulingDecision
+
+DEFAULT_TICKETS = 100
+
+
+def tickets_for(pcb: PCB, default_tickets: int = DEFAULT_TICKETS) -> int:
+    """
+    Tickets held by `pcb`.
+
+    An explicit `metadata["tickets"]` wins; otherwise the share follows the
+    priority (lower value, more tickets): `default_tickets // (priority + 1)`.
+    Jobs without either get `default_tickets`.
+    """
+    tickets = pcb.metadata.get("tickets")
+    if tickets is not None:
+        return max(1, int(tickets))
+    if pcb.priority is not None:
+        return max(1, default_tickets // (max(pcb.priority, 0) + 1))
+    return default_tickets
+
+
+class LotteryAlgorithm(SchedulingAlgorithm):
+    """
+    Lottery scheduling: each quantum goes to the holder of a random ticket.
+
+    The running job takes part in the draw when its quantum expires, so it
+    keeps the CPU with probability proportional to its share. Winners are
+    drawn from a Fenwick tree in O(log n). Draws are reproducible for a given
+    `seed`.
+    """
+
+    name = "lottery"
+
+    def __init__(self, quantum: int, *, seed: int | None = None, default_tickets: int = DEFAULT_TICKETS) -> None:
+        self.quantum = quantum
+        self.seed = seed
+        self.default_tickets = default_tickets
+        self._rng = random.Random(seed)
+        self._current_pid: int | None = None
+        self._dispatch_time: int = 0
+
+    def reset(self) -> None:
+        """Reset algorithm state between runs; the generator is reseeded in place."""
+        self._rng.seed(self.seed)
+        self._current_pid = None
+        self._dispatch_time = 0
+
+    def tickets(self, pcb: PCB) -> int:
+        return tickets_for(pcb, self.default_tickets)
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """Fenwick tree over the tickets of the waiting jobs."""
+        return LotteryReadyQueue(tickets=self.tickets, rng=self._rng)
+
+    def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
+        """Initial load simply enqueues the jobs."""
+        ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.arrival_time))
+
+    def on_run_start(self, pcb: PCB, current_time: int) -> None:  # noqa: ARG002 - part of the protocol
+        """Start the quantum once the context switch has been paid for."""
+        self._dispatch_time = current_time
+
+    def next_tick(
+        self,
+        *,
+        current_time: int,
+        running: PCB | None,
+        ready_queue: ReadyQueue,
+    ) -> SchedulingDecision:
+        """Hold a lottery whenever the CPU is free or the quantum expires with jobs waiting."""
+        queue = self._lottery(ready_queue)
+        if running is not None and running.pid != self._current_pid:
+            # Process was (re)dispatched outside of our bookkeeping window.
+            self._current_pid = running.pid
+            self._dispatch_time = current_time
+
+        if running is None:
+            winner = queue.dequeue()
+            self._current_pid = winner.pid if winner is not None else None
+            self._dispatch_time = current_time
+            return SchedulingDecision(next_process=winner, timeslice=self.quantum)
+
+        if current_time - self._dispatch_time < self.quantum or len(queue) == 0:
+            return SchedulingDecision(next_process=running, timeslice=self.quantum)
+
+        running_tickets = self.tickets(running)
+        ticket = queue.rng.randrange(running_tickets + queue.total_tickets)
+        self._dispatch_time = current_time
+        if ticket < running_tickets:
+            return SchedulingDecision(next_process=running, timeslice=self.quantum)
+        winner = queue.pop_ticket(ticket - running_tickets)
+        self._current_pid = winner.pid
+        return SchedulingDecision(next_process=winner, preempt_current=True, timeslice=self.quantum)
+
+    def next_event_time(
+        self,
+        *,
+        current_time: int,  # noqa: ARG002 - part of the protocol
+        running: PCB,  # noqa: ARG002 - part of the protocol
+        ready_queue: ReadyQueue,
+    ) -> int | None:
+        """A new lottery is only held at quantum expiry while someone is waiting."""
+        if len(ready_queue) == 0:
+            return None
+        return self._dispatch_time + self.quantum
+
+    @staticmethod
+    def _lottery(ready_queue: ReadyQueue) -> LotteryReadyQueue:
+        if not isinstance(ready_queue, LotteryReadyQueue):
+            raise TypeError("LotteryAlgorithm needs the LotteryReadyQueue built by create_ready_queue().")
+        return ready_queue
@@ -0,0 +1,136 @@
+"""Multilevel Feedback Queue scheduling algorithm."""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+from ..pcb import PCB
+from ..queues import MultilevelReadyQueue, ReadyQueue
+from .base import SchedulingAlgorithm, SchedulingDecision
+
+
+class MLFQAlgorithm(SchedulingAlgorithm):
+    """
+    Multilevel Feedback Queue: round robin per level, higher levels first.
+
+    New jobs start at level 0. A job that uses up the quantum of its level
+    drops one level; a job returning from I/O moves up one level, which keeps
+    interactive jobs near the top. Every `boost_interval` ticks all jobs go
+    back to level 0 so CPU-bound work cannot starve. A job waiting on a higher
+    level preempts the running one.
+    """
+
+    name = "mlfq"
+
+    def __init__(
+        self,
+        *,
+        levels: int = 3,
+        quanta: Sequence[int] | None = None,
+        boost_interval: int | None = None,
+    ) -> None:
+        if levels < 1:
+            raise ValueError("MLFQ needs at least one level.")
+        if quanta is None:
+            quanta = [2 ** (level + 1) for level in range(levels)]
+        if len(quanta) != levels:
+            raise ValueError(f"MLFQ needs one quantum per level ({levels}), got {len(quanta)}.")
+        if any(quantum <= 0 for quantum in quanta):
+            raise ValueError("MLFQ quanta must be positive.")
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError("The boost interval must be a positive number of ticks.")
+        self.levels = levels
+        self.quanta = list(quanta)
+        self.boost_interval = boost_interval
+        self._current_pid: int | None = None
+        self._dispatch_time: int = 0
+        self._next_boost: int | None = boost_interval
+
+    def reset(self) -> None:
+        """Reset algorithm state between runs."""
+        self._current_pid = None
+        self._dispatch_time = 0
+        self._next_boost = self.boost_interval
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """One FIFO per level with an O(1) non-empty level bitmap."""
+        return MultilevelReadyQueue(self.levels)
+
+    def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
+        """Initial load enqueues the jobs at their level in arrival order."""
+        ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.arrival_time))
+
+    def on_io_return(self, pcb: PCB) -> None:
+        """Promote a job coming back from I/O by one level."""
+        if pcb.queue_level > 0:
+            pcb.queue_level -= 1
+
+    def on_run_start(self, pcb: PCB, current_time: int) -> None:  # noqa: ARG002 - part of the protocol
+        """Start the quantum once the context switch has been paid for."""
+        self._dispatch_time = current_time
+
+    def next_tick(
+        self,
+        *,
+        current_time: int,
+        running: PCB | None,
+        ready_queue: ReadyQueue,
+    ) -> SchedulingDecision:
+        """Apply boosts and demotions, then run the head of the highest non-empty level."""
+        queue = self._multilevel(ready_queue)
+        if running is not None and running.pid != self._current_pid:
+            # Process was (re)dispatched outside of our bookkeeping window.
+            self._current_pid = running.pid
+            self._dispatch_time = current_time
+
+        if self._next_boost is not None and current_time >= self._next_boost:
+            queue.boost()
+            if running is not None:
+                running.queue_level = 0
+            self._next_boost = (current_time // self.boost_interval + 1) * self.boost_interval
+
+        if running is None:
+            return self._dispatch_next(queue, current_time, preempt=False)
+
+        waiting_level = queue.highest_level()
+        if current_time - self._dispatch_time >= self.quanta[running.queue_level]:
+            running.queue_level = min(running.queue_level + 1, self.levels - 1)
+            if waiting_level is not None and waiting_level <= running.queue_level:
+                return self._dispatch_next(queue, current_time, preempt=True)
+            # Nobody at or above the new level: keep running with a fresh quantum.
+            self._dispatch_time = current_time
+        elif waiting_level is not None and waiting_level < running.queue_level:
+            return self._dispatch_next(queue, current_time, preempt=True)
+        return SchedulingDecision(next_process=running, timeslice=self.quanta[running.queue_level])
+
+    def next_event_time(
+        self,
+        *,
+        current_time: int,  # noqa: ARG002 - part of the protocol
+        running: PCB,
+        ready_queue: ReadyQueue,  # noqa: ARG002 - part of the protocol
+    ) -> int | None:
+        """Quantum expiry demotes even when nobody waits; boosts happen on schedule."""
+        expiry = self._dispatch_time + self.quanta[running.queue_level]
+        if self._next_boost is None:
+            return expiry
+        return min(expiry, self._next_boost)
+
+    def _dispatch_next(self, queue: MultilevelReadyQueue, current_time: int, *, preempt: bool) -> SchedulingDecision:
+        next_proc = queue.dequeue()
+        if next_proc is None:
+            self._current_pid = None
+            return SchedulingDecision(next_process=None)
+        self._current_pid = next_proc.pid
+        self._dispatch_time = current_time
+        return SchedulingDecision(
+            next_process=next_proc,
+            preempt_current=preempt,
+            timeslice=self.quanta[next_proc.queue_level],
+        )
+
+    @staticmethod
+    def _multilevel(ready_queue: ReadyQueue) -> MultilevelReadyQueue:
+        if not isinstance(ready_queue, MultilevelReadyQueue):
+            raise TypeError("MLFQAlgorithm needs the MultilevelReadyQueue built by create_ready_queue().")
+        return ready_queue
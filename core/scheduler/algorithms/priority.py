@@ -0,0 +1,102 @@
+"""Priority scheduling algorithm with optional preemption and aging."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from ..pcb import PCB
+from ..queues import AgingReadyQueue, ReadyQueue
+from .base import SchedulingAlgorithm, SchedulingDecision
+
+
+class PriorityAlgorithm(SchedulingAlgorithm):
+    """
+    Static priority scheduling driven by `PCB.priority` (lower runs first).
+
+    With `aging_interval`, a waiting job gains one priority level for every
+    `aging_interval` ticks it spends in the ready queue, so low-priority jobs
+    cannot starve. Aging is computed lazily by `AgingReadyQueue` from the time
+    each job became ready. A dispatched job keeps the priority it had reached
+    while it holds the CPU and restarts from its base priority once it leaves.
+    With `preemptive=True` the running job yields as soon as a waiting job has
+    a strictly better priority.
+    """
+
+    name = "priority"
+
+    def __init__(
+        self,
+        *,
+        preemptive: bool = False,
+        aging_interval: int | None = None,
+        default_priority: int = 0,
+    ) -> None:
+        if aging_interval is not None and aging_interval <= 0:
+            raise ValueError("The aging interval must be a positive number of ticks.")
+        self.preemptive = preemptive
+        self.aging_interval = aging_interval
+        self.default_priority = default_priority
+        self._current_pid: int | None = None
+        self._current_priority: int = default_priority
+
+    def reset(self) -> None:
+        """Reset algorithm state between runs."""
+        self._current_pid = None
+        self._current_priority = self.default_priority
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """Priority buckets with lazy aging."""
+        return AgingReadyQueue(aging_interval=self.aging_interval, default_priority=self.default_priority)
+
+    def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
+        """Initial load enqueues the jobs in arrival order; the buckets do the ordering."""
+        ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.arrival_time))
+
+    def next_tick(
+        self,
+        *,
+        current_time: int,
+        running: PCB | None,
+        ready_queue: ReadyQueue,
+    ) -> SchedulingDecision:
+        """Dispatch the best waiting job, preempting the running one if allowed and outranked."""
+        queue = self._aging_queue(ready_queue)
+        queue.now = current_time
+        if running is not None and running.pid != self._current_pid:
+            # Process was (re)dispatched outside of our bookkeeping window.
+            self._current_pid = running.pid
+            self._current_priority = queue.base_priority(running)
+
+        if len(queue) == 0 or (running is not None and not self.preemptive):
+            return SchedulingDecision(next_process=running)
+
+        best = queue.peek()
+        best_priority = queue.effective_priority(best, current_time)
+        if running is not None and best_priority >= self._current_priority:
+            return SchedulingDecision(next_process=running)
+
+        queue.dequeue()
+        self._current_pid = best.pid
+        self._current_priority = best_priority
+        return SchedulingDecision(next_process=best, preempt_current=running is not None)
+
+    def next_event_time(
+        self,
+        *,
+        current_time: int,
+        running: PCB,  # noqa: ARG002 - part of the protocol
+        ready_queue: ReadyQueue,
+    ) -> int | None:
+        """
+        Without preemption only external events matter; with it, the running
+        job can also be outranked when a waiting job ages past its priority.
+        """
+        if not self.preemptive:
+            return None
+        return self._aging_queue(ready_queue).next_overtake_time(self._current_priority, current_time)
+
+    @staticmethod
+    def _aging_queue(ready_queue: ReadyQueue) -> AgingReadyQueue:
+        if not isinstance(ready_queue, AgingReadyQueue):
+            raise TypeError("PriorityAlgorithm needs the AgingReadyQueue built by create_ready_queue().")
+        return ready_queue
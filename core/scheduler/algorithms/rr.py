@@ -28,6 +28,10 @@ class RoundRobinAlgorithm(SchedulingAlgorithm):
         """Initial load simply enqueues the jobs."""
         ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.arrival_time))
 
+    def on_run_start(self, pcb: PCB, current_time: int) -> None:  # noqa: ARG002 - part of the protocol
+        """Start the quantum once the context switch has been paid for."""
+        self._dispatch_time = current_time
+
     def next_tick(
         self,
         *,
@@ -65,3 +69,15 @@ class RoundRobinAlgorithm(SchedulingAlgorithm):
             preempt_current=should_preempt,
             timeslice=self.quantum,
         )
+
+    def next_event_time(
+        self,
+        *,
+        current_time: int,  # noqa: ARG002 - part of the protocol
+        running: PCB,  # noqa: ARG002 - part of the protocol
+        ready_queue: ReadyQueue,
+    ) -> int | None:
+        """Quantum expiry only matters while someone is waiting for the CPU."""
+        if len(ready_queue) == 0:
+            return None
+        return self._dispatch_time + self.quantum
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Iterable
 
 from ..pcb import PCB
-from ..queues import ReadyQueue
+from ..queues import PriorityProcessQueue, PriorityReadyQueue, ReadyQueue
 from .base import SchedulingAlgorithm, SchedulingDecision
 
 
@@ -18,6 +18,10 @@ class SJFAlgorithm(SchedulingAlgorithm):
         """Reset algorithm state between runs."""
         # SJF uses no additional state yet.
 
+    def create_ready_queue(self) -> ReadyQueue:
+        """Heap keyed by (remaining_time, enqueue order) so dispatch is O(log n)."""
+        return PriorityReadyQueue(key=lambda pcb: pcb.remaining_time)
+
     def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
         """Load all available jobs before the simulation starts."""
         ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.burst_time))
@@ -36,7 +40,10 @@ class SJFAlgorithm(SchedulingAlgorithm):
         if len(ready_queue) == 0:
             return SchedulingDecision(next_process=None)
 
-        # Choose the PCB with the smallest remaining burst time.
+        if isinstance(ready_queue, PriorityProcessQueue):
+            return SchedulingDecision(next_process=ready_queue.dequeue())
+
+        # Plain FIFO queue: choose the PCB with the smallest remaining burst time.
         shortest = min(ready_queue, key=lambda pcb: pcb.remaining_time)
 
         # Rebuild the queue without the selected PCB.
@@ -49,3 +56,13 @@ class SJFAlgorithm(SchedulingAlgorithm):
         ready_queue.extend(buffer)
 
         return SchedulingDecision(next_process=shortest)
+
+    def next_event_time(
+        self,
+        *,
+        current_time: int,  # noqa: ARG002 - part of the protocol
+        running: PCB,  # noqa: ARG002 - part of the protocol
+        ready_queue: ReadyQueue,  # noqa: ARG002 - part of the protocol
+    ) -> int | None:
+        """Non-preemptive SJF keeps the running job until it blocks or finishes."""
+        return None
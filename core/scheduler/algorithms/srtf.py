@@ -0,0 +1,85 @@
+"""Shortest Remaining Time First scheduling algorithm (preemptive SJF)."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from ..pcb import PCB
+from ..queues import PriorityProcessQueue, PriorityReadyQueue, ReadyQueue
+from .base import SchedulingAlgorithm, SchedulingDecision
+
+
+class SRTFAlgorithm(SchedulingAlgorithm):
+    """
+    Preemptive SJF: the running job yields as soon as a ready job needs less CPU.
+
+    The ready queue is a min-heap keyed by remaining time, so comparing the
+    shortest waiting job against the running one is an O(1) peek and each
+    preemption costs O(log n). Waiting jobs do not consume CPU, so their keys
+    never go stale while they sit in the heap. Ties keep the running job to
+    avoid needless context switches.
+    """
+
+    name = "srtf"
+
+    def reset(self) -> None:
+        """Reset algorithm state between runs."""
+        # SRTF keeps all of its state in the ready queue.
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """Heap keyed by (remaining_time, enqueue order)."""
+        return PriorityReadyQueue(key=lambda pcb: pcb.remaining_time)
+
+    def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
+        """Load all available jobs before the simulation starts."""
+        ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.remaining_time))
+
+    def next_tick(
+        self,
+        *,
+        current_time: int,  # noqa: ARG002 - reserved for stats
+        running: PCB | None,
+        ready_queue: ReadyQueue,
+    ) -> SchedulingDecision:
+        """Run the job with the least remaining time, preempting if a shorter one waits."""
+        if len(ready_queue) == 0:
+            return SchedulingDecision(next_process=running)
+
+        shortest = self._peek_shortest(ready_queue)
+        if running is not None and running.remaining_time <= shortest.remaining_time:
+            return SchedulingDecision(next_process=running)
+
+        self._remove(ready_queue, shortest)
+        return SchedulingDecision(next_process=shortest, preempt_current=running is not None)
+
+    def next_event_time(
+        self,
+        *,
+        current_time: int,  # noqa: ARG002 - part of the protocol
+        running: PCB,  # noqa: ARG002 - part of the protocol
+        ready_queue: ReadyQueue,  # noqa: ARG002 - part of the protocol
+    ) -> int | None:
+        """
+        The running job only gets shorter, so it can lose the CPU solely to a
+        new arrival or an I/O completion, which are external events.
+        """
+        return None
+
+    @staticmethod
+    def _peek_shortest(ready_queue: ReadyQueue) -> PCB:
+        if isinstance(ready_queue, PriorityProcessQueue):
+            return ready_queue.peek()
+        # Plain FIFO queue: first PCB with the smallest remaining time.
+        return min(ready_queue, key=lambda pcb: pcb.remaining_time)
+
+    @staticmethod
+    def _remove(ready_queue: ReadyQueue, pcb: PCB) -> None:
+        if isinstance(ready_queue, PriorityProcessQueue):
+            ready_queue.dequeue()
+            return
+        buffer = []
+        while len(ready_queue) > 0:
+            candidate = ready_queue.dequeue()
+            if candidate is not pcb:
+                buffer.append(candidate)
+        ready_queue.extend(buffer)
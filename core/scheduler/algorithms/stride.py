@@ -0,0 +1,102 @@
+"""Stride scheduling algorithm (deterministic proportional share)."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from ..pcb import PCB
+from ..queues import ReadyQueue, StrideReadyQueue
+from .base import SchedulingAlgorithm, SchedulingDecision
+from .lottery import DEFAULT_TICKETS, tickets_for
+
+# Numerator of the stride; large so integer strides keep ticket ratios precise.
+STRIDE_SCALE = 1 << 20
+
+
+class StrideAlgorithm(SchedulingAlgorithm):
+    """
+    Stride scheduling: the job with the smallest pass gets the next quantum.
+
+    Each job advances its pass by `STRIDE_SCALE // tickets` per tick of CPU,
+    so over time CPU shares converge to ticket ratios without randomness.
+    Tickets come from `metadata["tickets"]` or the priority, as in lottery
+    scheduling. Passes live in a heap, so selection costs O(log n); ties keep
+    the running job.
+    """
+
+    name = "stride"
+
+    def __init__(self, quantum: int, *, default_tickets: int = DEFAULT_TICKETS) -> None:
+        self.quantum = quantum
+        self.default_tickets = default_tickets
+        self._current_pid: int | None = None
+        self._dispatch_time: int = 0
+
+    def reset(self) -> None:
+        """Reset algorithm state between runs."""
+        self._current_pid = None
+        self._dispatch_time = 0
+
+    def stride(self, pcb: PCB) -> int:
+        return STRIDE_SCALE // tickets_for(pcb, self.default_tickets)
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """Heap keyed by pass value."""
+        return StrideReadyQueue(stride=self.stride)
+
+    def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
+        """Initial load simply enqueues the jobs."""
+        ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.arrival_time))
+
+    def on_run_start(self, pcb: PCB, current_time: int) -> None:  # noqa: ARG002 - part of the protocol
+        """Start the quantum once the context switch has been paid for."""
+        self._dispatch_time = current_time
+
+    def next_tick(
+        self,
+        *,
+        current_time: int,
+        running: PCB | None,
+        ready_queue: ReadyQueue,
+    ) -> SchedulingDecision:
+        """Give the CPU to the smallest pass when it is free or the quantum expires."""
+        queue = self._stride_queue(ready_queue)
+        if running is not None and running.pid != self._current_pid:
+            # Process was (re)dispatched outside of our bookkeeping window.
+            self._current_pid = running.pid
+            self._dispatch_time = current_time
+
+        if running is None:
+            next_proc = queue.dequeue()
+            self._current_pid = next_proc.pid if next_proc is not None else None
+            self._dispatch_time = current_time
+            return SchedulingDecision(next_process=next_proc, timeslice=self.quantum)
+
+        if current_time - self._dispatch_time < self.quantum or len(queue) == 0:
+            return SchedulingDecision(next_process=running, timeslice=self.quantum)
+
+        self._dispatch_time = current_time
+        min_pass = queue.min_pass()
+        next_proc = queue.dequeue() if min_pass is not None and queue.pass_of(running) > min_pass else None
+        if next_proc is None:
+            return SchedulingDecision(next_process=running, timeslice=self.quantum)
+        self._current_pid = next_proc.pid
+        return SchedulingDecision(next_process=next_proc, preempt_current=True, timeslice=self.quantum)
+
+    def next_event_time(
+        self,
+        *,
+        current_time: int,  # noqa: ARG002 - part of the protocol
+        running: PCB,  # noqa: ARG002 - part of the protocol
+        ready_queue: ReadyQueue,
+    ) -> int | None:
+        """Passes are only compared at quantum expiry while someone is waiting."""
+        if len(ready_queue) == 0:
+            return None
+        return self._dispatch_time + self.quantum
+
+    @staticmethod
+    def _stride_queue(ready_queue: ReadyQueue) -> StrideReadyQueue:
+        if not isinstance(ready_queue, StrideReadyQueue):
+            raise TypeError("StrideAlgorithm needs the StrideReadyQueue built by create_ready_queue().")
+        return ready_queue
@@ -0,0 +1,33 @@
+"""Little-endian column encoding shared by the binary trace and job table files."""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Tuple
+
+
+def little_endian_bytes(column: array) -> bytes:
+    """Raw bytes of `column` in little-endian order, whatever the host byte order."""
+    if sys.byteorder == "little":
+        return column.tobytes()
+    swapped = array(column.typecode, column)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def read_column(typecode: str, payload: memoryview, offset: int, count: int) -> Tuple[array, int]:
+    """
+    Read `count` little-endian items of `typecode` at `offset`.
+
+    Returns the column and the offset right after it. Raises ValueError when
+    the payload ends before the column does.
+    """
+    column = array(typecode)
+    size = column.itemsize * count
+    if offset + size > len(payload):
+        raise ValueError("Binary payload is truncated.")
+    column.frombytes(payload[offset : offset + size])
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column, offset + size
@@ -0,0 +1,177 @@
+"""I/O devices with their own request queues, service disciplines and channels."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import random
+from collections import deque
+from dataclasses import dataclass
+from itertools import count
+
+from .metrics import DeviceMetrics
+from .pcb import PCB
+
+DISCIPLINES = ("fifo", "sstf", "scan")
+
+
+@dataclass(slots=True)
+class IODevice:
+    """
+    Configuration of one named I/O device.
+
+    `parallelism` requests are serviced at once, one per channel. The others
+    wait in the device queue and are picked by `discipline`:
+
+    * "fifo": in the order they were issued;
+    * "sstf": shortest seek first, the request closest to the channel's head;
+    * "scan": the elevator, which sweeps the head up and down across tracks.
+
+    Positional disciplines only make sense when seeking costs something. With
+    `tracks`, each request targets a track (`metadata["io_track"]` of the job,
+    or a uniform draw), and moving the head adds `seek_time` ticks per track
+    to the service time.
+    """
+
+    name: str
+    parallelism: int = 1
+    discipline: str = "fifo"
+    tracks: int = 0
+    seek_time: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.parallelism < 1:
+            raise ValueError(f"Device '{self.name}' needs at least one channel.")
+        if self.discipline not in DISCIPLINES:
+            raise ValueError(f"Unsupported discipline '{self.discipline}'. Use one of {DISCIPLINES}.")
+        if self.tracks < 0 or self.seek_time < 0:
+            raise ValueError(f"Device '{self.name}' needs non-negative tracks and seek time.")
+
+
+@dataclass(slots=True)
+class _Request:
+    pcb: PCB
+    issued: int
+    duration: int
+    track: int
+
+
+@dataclass(slots=True)
+class _Channel:
+    head: int = 0
+    # +1 while the elevator sweeps towards higher tracks, -1 on the way back.
+    direction: int = 1
+    request: _Request | None = None
+    # Completion tick of `request`.
+    until: int = 0
+
+
+class DeviceQueue:
+    """
+    Runtime state of an `IODevice`: its waiting requests, channels and counters.
+
+    FIFO waits in a deque. Positional disciplines keep requests sorted by
+    (track, issue order), so picking the next one is a binary search around
+    the head.
+    """
+
+    def __init__(self, device: IODevice, rng: random.Random | None = None) -> None:
+        self.device = device
+        self._rng = rng
+        self._channels = [_Channel() for _ in range(device.parallelism)]
+        self._fifo: deque[_Request] = deque()
+        self._by_track: list[tuple[int, int, _Request]] = []
+        self._sequence = count()
+        self.metrics = DeviceMetrics(name=device.name, parallelism=device.parallelism)
+
+    def __len__(self) -> int:
+        """Number of requests waiting for a free channel."""
+        return len(self._fifo) + len(self._by_track)
+
+    def submit(self, pcb: PCB, *, issued: int, duration: int) -> int | None:
+        """
+        Issue an I/O of `duration` ticks for `pcb` at `issued`.
+
+        Returns its completion tick when a channel is free. Otherwise returns
+        None and the request waits in the device queue.
+        """
+        request = _Request(pcb=pcb, issued=issued, duration=duration, track=self._track_for(pcb))
+        self.metrics.requests += 1
+        for channel in self._channels:
+            if channel.request is None:
+                return self._start(channel, request, issued)
+        if self.device.discipline == "fifo":
+            self._fifo.append(request)
+        else:
+            bisect.insort(self._by_track, (request.track, next(self._sequence), request))
+        self.metrics.max_queue = max(self.metrics.max_queue, len(self))
+        return None
+
+    def complete(self, pcb: PCB, now: int) -> tuple[PCB, int] | None:
+        """Free the channel serving `pcb`; return the next request started on it and its completion."""
+        channel = next(channel for channel in self._channels if channel.request and channel.request.pcb is pcb)
+        channel.request = None
+        request = self._next_for(channel)
+        if request is None:
+            return None
+        return request.pcb, self._start(channel, request, now)
+
+    def close(self, now: int) -> None:
+        """
+        End the run at `now`: drop from `busy_time` the service that requests
+        still in flight would only have received after it.
+        """
+        for channel in self._channels:
+            if channel.request is not None and channel.until > now:
+                self.metrics.busy_time -= channel.until - now
+
+    def _track_for(self, pcb: PCB) -> int:
+        if not self.device.tracks:
+            return 0
+        track = pcb.metadata.get("io_track")
+        if track is not None:
+            return int(track) % self.device.tracks
+        return (self._rng or random).randrange(self.device.tracks)
+
+    def _start(self, channel: _Channel, request: _Request, now: int) -> int:
+        seek = abs(request.track - channel.head)
+        service = request.duration + round(seek * self.device.seek_time)
+        channel.head = request.track
+        channel.request = request
+        channel.until = now + service
+        wait = now - request.issued
+        metrics = self.metrics
+        metrics.started += 1
+        metrics.busy_time += service
+        metrics.total_wait += wait
+        metrics.max_wait = max(metrics.max_wait, wait)
+        return channel.until
+
+    def _next_for(self, channel: _Channel) -> _Request | None:
+        if self.device.discipline == "fifo":
+            return self._fifo.popleft() if self._fifo else None
+        waiting = self._by_track
+        if not waiting:
+            return None
+        if self.device.discipline == "sstf":
+            above = bisect.bisect_left(waiting, (channel.head, -1))
+            below = above - 1
+            if above == len(waiting) or (
+                below >= 0 and channel.head - waiting[below][0] <= waiting[above][0] - channel.head
+            ):
+                above = bisect.bisect_left(waiting, (waiting[below][0], -1))
+            return waiting.pop(above)[2]
+        # Elevator: keep moving in the current direction, reverse at the last request.
+        if channel.direction > 0:
+            index = bisect.bisect_left(waiting, (channel.head, -1))
+            if index < len(waiting):
+                return waiting.pop(index)[2]
+            channel.direction = -1
+        index = bisect.bisect_right(waiting, (channel.head, math.inf)) - 1
+        if index < 0:
+            channel.direction = 1
+            index = 0
+        else:
+            # Oldest request on that track first.
+            index = bisect.bisect_left(waiting, (waiting[index][0], -1))
+        return waiting.pop(index)[2]
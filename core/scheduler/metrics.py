@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
+import bisect
+import math
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Iterable, List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .pcb import PCB
+    from .profiling import SimulationProfile
+    from .trace import TraceRecorder
 
 
 @dataclass(slots=True)
@@ -14,52 +23,443 @@ class ProcessMetrics:
     waiting_time: float | None = None
     turnaround_time: float | None = None # total time from arrival to completion
     response_time: float | None = None
+    lateness: float | None = None  # finish time minus deadline; None without a deadline
+
+    @classmethod
+    def from_pcb(cls, pcb: PCB) -> ProcessMetrics | None:
+        """Derive the metrics of a finished PCB, or None if it never finished."""
+        if pcb.finish_time is None:
+            return None
+        return cls(pcb.pid, *_finished_times(pcb, pcb.finish_time))
+
+
+def _finished_times(pcb: PCB, finish: int) -> Tuple[float | None, float, float | None, float | None]:
+    """(waiting, turnaround, response, lateness) of a PCB that finished at `finish`."""
+    waiting = pcb.waiting_time
+    if waiting is None and pcb.turnaround_time is not None:
+        waiting = pcb.turnaround_time - pcb.burst_time
+    turnaround = pcb.turnaround_time
+    if turnaround is None:
+        turnaround = finish - pcb.arrival_time
+    lateness = finish - pcb.deadline if pcb.deadline is not None else None
+    return waiting, turnaround, pcb.response_time, lateness
+
+
+@dataclass(slots=True)
+class MetricSummary:
+    """Distribution summary of one per-process metric."""
+
+    count: int = 0
+    mean: float | None = None
+    p50: float | None = None
+    p95: float | None = None
+    p99: float | None = None
+    max: float | None = None
+    stddev: float | None = None
+    fairness: float | None = None  # Jain's index: 1.0 when every process gets the same value
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Linear-interpolated percentile over already sorted values."""
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    weight = position - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * weight
+
+
+def summarize(values: Iterable[float]) -> MetricSummary:
+    """
+    Summarise a column of per-process values, ignoring NaN (missing) entries.
+
+    Returns mean, p50/p95/p99, max, population standard deviation and Jain's
+    fairness index (sum(x))^2 / (n * sum(x^2)).
+    """
+    ordered = sorted(value for value in values if not math.isnan(value))
+    count = len(ordered)
+    if count == 0:
+        return MetricSummary()
+    total = math.fsum(ordered)
+    squares = math.fsum(value * value for value in ordered)
+    mean = total / count
+    variance = max(0.0, squares / count - mean * mean)
+    return MetricSummary(
+        count=count,
+        mean=mean,
+        p50=_percentile(ordered, 0.50),
+        p95=_percentile(ordered, 0.95),
+        p99=_percentile(ordered, 0.99),
+        max=ordered[-1],
+        stddev=math.sqrt(variance),
+        fairness=(total * total) / (count * squares) if squares > 0 else 1.0,
+    )
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate with the P-square algorithm (Jain & Chlamtac, 1985).
+
+    Keeps five markers whatever the number of observations, adjusting their
+    heights with piecewise-parabolic interpolation; exact until five values.
+    """
+
+    __slots__ = ("fraction", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, fraction: float) -> None:
+        self.fraction = fraction
+        self._heights: List[float] = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self._desired = [1.0, 1.0 + 2 * fraction, 1.0 + 4 * fraction, 3.0 + 2 * fraction, 5.0]
+        self._increments = [0.0, fraction / 2, fraction, (1.0 + fraction) / 2, 1.0]
+
+    def add(self, value: float) -> None:
+        """Feed one observation."""
+        heights = self._heights
+        if len(heights) < 5:
+            bisect.insort(heights, value)
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = bisect.bisect_right(heights, value) - 1
+
+        positions = self._positions
+        for index in range(cell + 1, 5):
+            positions[index] += 1
+        for index in range(5):
+            self._desired[index] += self._increments[index]
+
+        for index in range(1, 4):
+            offset = self._desired[index] - positions[index]
+            if (offset >= 1 and positions[index + 1] - positions[index] > 1) or (
+                offset <= -1 and positions[index - 1] - positions[index] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                candidate = self._parabolic(index, step)
+                if not heights[index - 1] < candidate < heights[index + 1]:
+                    candidate = heights[index] + step * (heights[index + step] - heights[index]) / (
+                        positions[index + step] - positions[index]
+                    )
+                heights[index] = candidate
+                positions[index] += step
+
+    def _parabolic(self, index: int, step: int) -> float:
+        heights, positions = self._heights, self._positions
+        below = positions[index] - positions[index - 1]
+        above = positions[index + 1] - positions[index]
+        span = positions[index + 1] - positions[index - 1]
+        return heights[index] + step / span * (
+            (below + step) * (heights[index + 1] - heights[index]) / above
+            + (above - step) * (heights[index] - heights[index - 1]) / below
+        )
+
+    def value(self) -> float | None:
+        """Current estimate, or None before the first observation."""
+        if not self._heights:
+            return None
+        if len(self._heights) < 5:
+            return _percentile(self._heights, self.fraction)
+        return self._heights[2]
+
+
+class SlidingWindowQuantile:
+    """
+    Exact quantiles over the last `window` observations.
+
+    Values are kept twice: in arrival order, to evict the oldest, and sorted,
+    so any quantile is an O(1) lookup. Each update costs O(log w) to locate
+    plus a memmove of at most `window` slots, and memory never exceeds the
+    window.
+    """
+
+    __slots__ = ("window", "_recent", "_ordered")
+
+    def __init__(self, window: int) -> None:
+        if window < 1:
+            raise ValueError("The sliding window needs at least one slot.")
+        self.window = window
+        self._recent: deque[float] = deque()
+        self._ordered: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def add(self, value: float) -> None:
+        """Feed one observation, evicting the oldest once the window is full."""
+        if len(self._recent) == self.window:
+            oldest = self._recent.popleft()
+            del self._ordered[bisect.bisect_left(self._ordered, oldest)]
+        self._recent.append(value)
+        bisect.insort(self._ordered, value)
+
+    def quantile(self, fraction: float) -> float | None:
+        """Linear-interpolated quantile of the window, or None while it is empty."""
+        if not self._ordered:
+            return None
+        return _percentile(self._ordered, fraction)
+
+
+class OnlineSummary:
+    """Constant-memory accumulator producing a `MetricSummary` at any time."""
+
+    __slots__ = ("count", "_mean", "_m2", "_sum", "_squares", "_max", "_quantiles")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sum = 0.0
+        self._squares = 0.0
+        self._max: float | None = None
+        self._quantiles = (P2Quantile(0.50), P2Quantile(0.95), P2Quantile(0.99))
+
+    def add(self, value: float | None) -> None:
+        """Feed one observation; None and NaN are ignored."""
+        if value is None or math.isnan(value):
+            return
+        # Welford's update keeps the variance numerically stable.
+        self.count += 1
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        self._sum += value
+        self._squares += value * value
+        if self._max is None or value > self._max:
+            self._max = value
+        for quantile in self._quantiles:
+            quantile.add(value)
+
+    def summary(self) -> MetricSummary:
+        """Snapshot of the distribution seen so far."""
+        if self.count == 0:
+            return MetricSummary()
+        p50, p95, p99 = (quantile.value() for quantile in self._quantiles)
+        return MetricSummary(
+            count=self.count,
+            mean=self._mean,
+            p50=p50,
+            p95=p95,
+            p99=p99,
+            max=self._max,
+            stddev=math.sqrt(self._m2 / self.count),
+            fairness=(self._sum * self._sum) / (self.count * self._squares) if self._squares > 0 else 1.0,
+        )
+
+
+class OnlineMetrics:
+    """Live, constant-memory counterpart of the per-process metric columns."""
+
+    __slots__ = ("waiting", "turnaround", "response", "tardiness")
+
+    def __init__(self) -> None:
+        self.waiting = OnlineSummary()
+        self.turnaround = OnlineSummary()
+        self.response = OnlineSummary()
+        self.tardiness = OnlineSummary()
+
+    @property
+    def count(self) -> int:
+        """Number of finished processes observed."""
+        return self.turnaround.count
+
+    def observe(
+        self,
+        waiting_time: float | None,
+        turnaround_time: float | None,
+        response_time: float | None,
+        lateness: float | None = None,
+    ) -> None:
+        """Fold one finished process into the running statistics."""
+        self.waiting.add(waiting_time)
+        self.turnaround.add(turnaround_time)
+        self.response.add(response_time)
+        if lateness is not None:
+            self.tardiness.add(max(lateness, 0))
+
+    def summaries(self) -> Dict[str, MetricSummary]:
+        """Distribution summaries for waiting, turnaround, response time and tardiness."""
+        return {
+            "waiting": self.waiting.summary(),
+            "turnaround": self.turnaround.summary(),
+            "response": self.response.summary(),
+            "tardiness": self.tardiness.summary(),
+        }
+
+
+@dataclass(slots=True)
+class DeviceMetrics:
+    """Load and queueing delay of one I/O device over a run."""
+
+    name: str
+    parallelism: int = 1
+    requests: int = 0
+    started: int = 0
+    busy_time: int = 0  # channel-ticks of service, seek time included
+    total_wait: int = 0  # ticks requests spent queued before a channel picked them up
+    max_wait: int = 0
+    max_queue: int = 0
+    utilization: float | None = None  # busy_time over the channel capacity of the run
+
+    @property
+    def mean_wait(self) -> float | None:
+        """Average queueing delay of the requests that started service."""
+        return self.total_wait / self.started if self.started else None
+
+
+def _column() -> array:
+    return array("d")
+
+
+def _stored(value: float | None) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _loaded(value: float) -> float | None:
+    return None if math.isnan(value) else value
 
 
 @dataclass(slots=True)
 class SimulationMetrics:
-    """Aggregated metrics from a scheduler run."""
+    """
+    Aggregated metrics from a scheduler run.
 
-    processes: List[ProcessMetrics] = field(default_factory=list)
+    Per-process values live in parallel typed columns (`pids`, `waiting_times`,
+    `turnaround_times`, `response_times`, `lateness`) indexed by completion order; missing
+    values are stored as NaN. `processes` rebuilds `ProcessMetrics` objects on
+    demand for callers that prefer the object view. `online`, when present,
+    holds constant-memory running statistics updated as each process finishes;
+    `trace` the execution trace when the run was configured with `trace=True`,
+    and `profile` the phase timers and loop counters when run with `profile=True`.
+    """
+
+    pids: array = field(default_factory=lambda: array("q"))
+    waiting_times: array = field(default_factory=_column)
+    turnaround_times: array = field(default_factory=_column)
+    response_times: array = field(default_factory=_column)
+    # NaN for jobs without a deadline, and NaN != NaN, so equality relies on the deadline counters.
+    lateness: array = field(default_factory=_column, compare=False)
     throughput: float | None = None
     cpu_utilization: float | None = None
     context_switches: int = 0
+    total_time: int = 0
+    deadline_jobs: int = 0
+    deadline_misses: int = 0
+    max_lateness: float | None = None
+    busy_time: int = 0
+    # Busy ticks spent on context switches rather than on processes.
+    switch_time: int = 0
+    core_busy_time: List[int] = field(default_factory=list)
+    core_utilization: List[float] = field(default_factory=list)
+    core_context_switches: List[int] = field(default_factory=list)
+    # Per-device load and queueing delay, keyed by device name; empty without devices.
+    devices: Dict[str, DeviceMetrics] = field(default_factory=dict)
+    # (time, quantum) for every quantum an adaptive algorithm adopted, starting with the initial one.
+    quantum_history: List[Tuple[int, int]] = field(default_factory=list)
+    online: OnlineMetrics | None = field(default=None, compare=False)
+    trace: TraceRecorder | None = field(default=None, compare=False, repr=False)
+    profile: SimulationProfile | None = field(default=None, compare=False, repr=False)
+
+    @property
+    def processes(self) -> List[ProcessMetrics]:
+        """Per-process metrics as objects, in completion order."""
+        return [
+            ProcessMetrics(
+                pid=pid,
+                waiting_time=_loaded(waiting),
+                turnaround_time=_loaded(turnaround),
+                response_time=_loaded(response),
+                lateness=_loaded(lateness),
+            )
+            for pid, waiting, turnaround, response, lateness in zip(
+                self.pids, self.waiting_times, self.turnaround_times, self.response_times, self.lateness
+            )
+        ]
+
+    @property
+    def effective_utilization(self) -> float | None:
+        """Share of CPU capacity spent running processes, excluding context switch cost."""
+        if self.cpu_utilization is None or self.busy_time == 0:
+            return self.cpu_utilization
+        return self.cpu_utilization * (self.busy_time - self.switch_time) / self.busy_time
+
+    @property
+    def deadline_miss_rate(self) -> float | None:
+        """Share of jobs with a deadline that finished after it, or None without deadlines."""
+        return self.deadline_misses / self.deadline_jobs if self.deadline_jobs else None
+
+    def record(
+        self,
+        pid: int,
+        waiting_time: float | None,
+        turnaround_time: float | None,
+        response_time: float | None,
+        lateness: float | None = None,
+    ) -> None:
+        """Append one finished process to the columns."""
+        self.pids.append(pid)
+        self.waiting_times.append(_stored(waiting_time))
+        self.turnaround_times.append(_stored(turnaround_time))
+        self.response_times.append(_stored(response_time))
+        self.lateness.append(_stored(lateness))
+
+    def record_deadline(self, lateness: float) -> None:
+        """Count a finished job that had a deadline; positive lateness is a miss."""
+        self.deadline_jobs += 1
+        if lateness > 0:
+            self.deadline_misses += 1
+        if self.max_lateness is None or lateness > self.max_lateness:
+            self.max_lateness = lateness
 
     def add_process_metrics(self, metrics: ProcessMetrics) -> None:
         """Collect metrics for a single process."""
-        self.processes.append(metrics)
+        self.record(
+            metrics.pid,
+            metrics.waiting_time,
+            metrics.turnaround_time,
+            metrics.response_time,
+            metrics.lateness,
+        )
+        if metrics.lateness is not None:
+            self.record_deadline(metrics.lateness)
+
+    def summaries(self) -> Dict[str, MetricSummary]:
+        """
+        Distribution summaries for waiting, turnaround, response time and
+        tardiness (lateness clamped at zero, over jobs with a deadline).
+
+        Exact when per-process columns were kept, otherwise estimated from the
+        online accumulator.
+        """
+        if len(self.pids) == 0 and self.online is not None:
+            return self.online.summaries()
+        return {
+            "waiting": summarize(self.waiting_times),
+            "turnaround": summarize(self.turnaround_times),
+            "response": summarize(self.response_times),
+            "tardiness": summarize(max(value, 0.0) for value in self.lateness if not math.isnan(value)),
+        }
 
     @classmethod
-    def from_pcbs(cls, pcbs: Iterable["PCB"]) -> "SimulationMetrics": # type: ignore
+    def from_pcbs(cls, pcbs: Iterable[PCB]) -> SimulationMetrics:
         """
         Convenience constructor to build metrics from the final PCB state.
 
         Derives waiting, turnaround and response time for each PCB that has
-        finished execution.
+        finished execution, straight into the columns.
         """
-        from .pcb import PCB  # pylint: disable=cyclic-import
-
         metrics = cls()
-        finished: List[PCB] = list(pcbs)
-
-        for pcb in finished:
+        for pcb in pcbs:
             if pcb.finish_time is None:
                 # Skip processes that never finished.
                 continue
-            waiting = pcb.waiting_time
-            if waiting is None and pcb.turnaround_time is not None:
-                waiting = pcb.turnaround_time - pcb.burst_time
-            turnaround = pcb.turnaround_time
-            if turnaround is None:
-                turnaround = pcb.finish_time - pcb.arrival_time
-            response = pcb.response_time
-            metrics.add_process_metrics(
-                ProcessMetrics(
-                    pid=pcb.pid,
-                    waiting_time=waiting,
-                    turnaround_time=turnaround,
-                    response_time=response,
-                )
-            )
+            waiting, turnaround, response, lateness = _finished_times(pcb, pcb.finish_time)
+            metrics.record(pcb.pid, waiting, turnaround, response, lateness)
+            if lateness is not None:
+                metrics.record_deadline(lateness)
 
         return metrics
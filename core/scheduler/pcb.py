@@ -3,12 +3,39 @@
 
 from __future__ import annotations
 
+import random
+from array import array
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterable
 
 from .states import ProcessState
 
 
+def replay_schedule(bursts: Iterable[int]) -> tuple[int, array]:
+    """
+    Turn an observed (cpu, io, cpu, ..., cpu) burst sequence into a job's total
+    CPU time and its flat (trigger, duration) I/O events.
+
+    The sequence must start and end with CPU and every burst must be positive.
+    """
+    events = array("q")
+    cpu_total = 0
+    length = 0
+    for index, burst in enumerate(bursts):
+        burst = int(burst)
+        if burst <= 0:
+            raise ValueError(f"Burst {index} must be positive, got {burst}.")
+        if index % 2:
+            events.append(cpu_total)
+            events.append(burst)
+        else:
+            cpu_total += burst
+        length = index + 1
+    if length % 2 == 0:
+        raise ValueError("A burst sequence must alternate cpu and io bursts and end with a cpu burst.")
+    return cpu_total, events
+
+
 @dataclass(slots=True)
 class PCB:
     """Minimal PCB structure enriched with execution time and optional I/O schedule."""
@@ -18,6 +45,10 @@ class PCB:
     burst_time: int
     priority: int | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Absolute tick by which the job should finish; None for jobs without a deadline.
+    deadline: int | None = None
+    # Recorded (trigger, duration) I/O events replayed instead of drawing a schedule; see `replay_schedule`.
+    io_trace: array | None = field(default=None, repr=False)
     remaining_time: int = field(init=False)
     state: ProcessState = field(default=ProcessState.NEW, init=False)
     start_time: int | None = field(default=None, init=False)
@@ -26,13 +57,45 @@ class PCB:
     waiting_time: int | None = field(default=None, init=False)
     turnaround_time: int | None = field(default=None, init=False)
     executed_time: int = field(default=0, init=False)
-    io_schedule: list[tuple[int, int]] = field(default_factory=list, init=False, repr=False)
     io_remaining_time: int | None = field(default=None, init=False)
+    last_core: int | None = field(default=None, init=False, repr=False)
+    # Tick at which the PCB last left a CPU (preemption or I/O); None before its first dispatch.
+    off_cpu_since: int | None = field(default=None, init=False, repr=False)
+    # Tick at which the PCB last entered a ready queue (arrival, I/O return or preemption).
+    ready_since: int | None = field(default=None, init=False, repr=False)
+    # Level in multilevel schedulers (0 is the highest); maintained by the algorithm.
+    queue_level: int = field(default=0, init=False, repr=False)
+    # executed_time when the current CPU burst began (at arrival or on return from I/O).
+    burst_mark: int = field(default=0, init=False, repr=False)
+    # Stride scheduling offset; the pass is this plus stride * executed_time.
+    stride_pass: int = field(default=0, init=False, repr=False)
     _next_io_index: int = field(default=0, init=False, repr=False)
+    # Flat (trigger, duration, trigger, duration, ...) pairs, possibly shared by every PCB
+    # of a run; this job's events are the `_io_count` pairs from `_io_offset`. None without I/O.
+    _io_events: array | None = field(default=None, init=False, repr=False)
+    _io_offset: int = field(default=0, init=False, repr=False)
+    _io_count: int = field(default=0, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.remaining_time = self.burst_time
 
+    @property
+    def io_schedule(self) -> list[tuple[int, int]]:
+        """I/O events as (cpu_time_at_request, io_duration) tuples."""
+        events = self._io_events
+        if events is None:
+            return []
+        own = events[self._io_offset : self._io_offset + 2 * self._io_count]
+        return list(zip(own[0::2], own[1::2]))
+
+    @io_schedule.setter
+    def io_schedule(self, events: Iterable[tuple[int, int]]) -> None:
+        flat = array("q")
+        for trigger_at, duration in events:
+            flat.append(trigger_at)
+            flat.append(duration)
+        self._attach_io(flat if flat else None, 0)
+
     def set_state(self, state: ProcessState) -> None:
         """Update PCB state; algorithms may hook extra bookkeeping before or after."""
         self.state = state
@@ -56,48 +119,73 @@ class PCB:
         duration_stddev: float,
         max_events: int | None = None,
         enabled: bool = True,
+        rng: random.Random | None = None,
+        buffer: array | None = None,
     ) -> None:
         """
         Attach an I/O schedule generated from normal distributions.
 
-        Each event is a tuple (cpu_time_at_request, io_duration). Events are
-        bounded to the total burst time to avoid overshooting completion.
+        Each event is a pair (cpu_time_at_request, io_duration) stored flat in
+        an `array`. With `buffer`, the events are appended to that run-wide
+        array and the PCB keeps only its offset and event count, so a whole
+        workload shares one buffer; otherwise the PCB gets its own array.
+        Events are bounded to the total burst time to avoid overshooting
+        completion. Draws come from `rng` when given (one seeded
+        `random.Random` per run) and from the global generator otherwise.
+        A job with an `io_trace` replays it as is, without drawing anything.
         """
+        if enabled and self.io_trace is not None:
+            self._attach_io(self.io_trace or None, 0)
+            return
         if not enabled or interval_mean <= 0 or duration_mean <= 0:
-            self.io_schedule = []
+            self._attach_io(None, 0)
             return
 
-        import random
-
-        events: list[tuple[int, int]] = []
+        normalvariate = (rng or random).normalvariate
+        burst_time = self.burst_time
+        events = array("q") if buffer is None else buffer
+        offset = len(events)
+        append = events.append
+        count = 0
         cpu_cursor = 0
-        while True:
-            if max_events is not None and len(events) >= max_events:
-                break
-            gap = max(1, round(random.normalvariate(interval_mean, interval_stddev)))
+        while max_events is None or count < max_events:
+            gap = max(1, round(normalvariate(interval_mean, interval_stddev)))
             cpu_cursor += gap
-            if cpu_cursor >= self.burst_time:
+            if cpu_cursor >= burst_time:
                 break
-            duration = max(1, round(random.normalvariate(duration_mean, duration_stddev)))
-            events.append((cpu_cursor, duration))
-        self.io_schedule = events
+            append(cpu_cursor)
+            append(max(1, round(normalvariate(duration_mean, duration_stddev))))
+            count += 1
+        self._attach_io(events if count else None, offset)
+
+    def _attach_io(self, events: array | None, offset: int) -> None:
+        """Point the PCB at its flat I/O events, starting at `offset` in `events`."""
+        self._io_events = events
+        self._io_offset = offset
+        self._io_count = (len(events) - offset) // 2 if events is not None else 0
         self._next_io_index = 0
 
     def io_request_due(self) -> tuple[bool, int | None]:
         """Return whether an I/O should start after the last CPU consumption."""
-        if self._next_io_index >= len(self.io_schedule):
+        events = self._io_events
+        if events is None or self._next_io_index >= self._io_count:
             return (False, None)
-        trigger_at, duration = self.io_schedule[self._next_io_index]
+        position = self._io_offset + 2 * self._next_io_index
+        trigger_at = events[position]
+        duration = events[position + 1]
         if self.executed_time >= trigger_at and self.remaining_time > 0:
             self._next_io_index += 1
             self.io_remaining_time = duration
             return (True, duration)
         return (False, None)
 
-    def tick_io(self) -> None:
-        """Advance I/O timer for a blocked process."""
-        if self.io_remaining_time is None:
-            return
-        self.io_remaining_time = max(0, self.io_remaining_time - 1)
-        if self.io_remaining_time == 0:
-            self.io_remaining_time = None
+    def cpu_until_next_io(self) -> int | None:
+        """Return the CPU time left before the next scheduled I/O, or None when none remain."""
+        events = self._io_events
+        if events is None or self._next_io_index >= self._io_count:
+            return None
+        return events[self._io_offset + 2 * self._next_io_index] - self.executed_time
+
+    def complete_io(self) -> None:
+        """Clear the in-flight I/O once the simulator decides it has finished."""
+        self.io_remaining_time = None
@@ -0,0 +1,347 @@
+"""Structure-of-arrays job store for workloads too large for one PCB object per job."""
+
+from __future__ import annotations
+
+import json
+import struct
+from array import array
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Tuple
+
+from .binary import little_endian_bytes, read_column
+from .pcb import PCB
+from .states import ProcessState
+
+# Stored in integer columns in place of None.
+_MISSING = -(2**63)
+_NO_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+_MAGIC = b"PCBTABLE"
+_VERSION = 1
+# magic, version, source stamp (two words), rows, traced rows, trace words, metadata bytes
+_HEADER = struct.Struct("<8sHQQQQQQ")
+
+
+def _optional(value: int) -> int | None:
+    return None if value == _MISSING else value
+
+
+def _stored(value: int | None) -> int:
+    return _MISSING if value is None else value
+
+
+class PCBTable:
+    """
+    Jobs kept as parallel typed columns indexed by row (the order of `add`).
+
+    Only the durable facts of a job live here: pid, arrival, burst, priority,
+    deadline, start and finish time, 56 bytes per job. Metadata and recorded
+    I/O traces are kept sparsely, only for jobs that have some. Scheduling state that matters
+    only while a job is in the system (remaining time, I/O cursor, queue
+    bookkeeping) lives on a `PCBView`. `jobs()` creates a view when the job
+    is admitted, and the simulator drops it once the job finishes. Memory
+    therefore follows the number of jobs in the system, not the trace size.
+    """
+
+    def __init__(self) -> None:
+        self.pids = array("q")
+        self.arrivals = array("q")
+        self.bursts = array("q")
+        self.priorities = array("q")
+        self.deadlines = array("q")
+        self.start_times = array("q")
+        self.finish_times = array("q")
+        self.metadata: Dict[int, Dict[str, Any]] = {}
+        self.io_traces: Dict[int, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the column buffers and I/O traces (metadata dictionaries not included)."""
+        columns = (
+            self.pids,
+            self.arrivals,
+            self.bursts,
+            self.priorities,
+            self.deadlines,
+            self.start_times,
+            self.finish_times,
+        )
+        columns += tuple(self.io_traces.values())
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def add(
+        self,
+        pid: int,
+        arrival: int,
+        burst: int,
+        *,
+        priority: int | None = None,
+        deadline: int | None = None,
+        metadata: Dict[str, Any] | None = None,
+        io_trace: array | None = None,
+    ) -> int:
+        """Append a job and return its row."""
+        row = len(self.pids)
+        self.pids.append(pid)
+        self.arrivals.append(arrival)
+        self.bursts.append(burst)
+        self.priorities.append(_stored(priority))
+        self.deadlines.append(_stored(deadline))
+        self.start_times.append(_MISSING)
+        self.finish_times.append(_MISSING)
+        if metadata:
+            self.metadata[row] = metadata
+        if io_trace is not None:
+            self.io_traces[row] = io_trace
+        return row
+
+    def extend(
+        self,
+        pids: array,
+        arrivals: array,
+        bursts: array,
+        *,
+        priorities: array | None = None,
+        deadlines: array | None = None,
+    ) -> None:
+        """Append whole columns at once; missing priority or deadline columns mean None for every job."""
+        count = len(pids)
+        if not len(arrivals) == len(bursts) == count:
+            raise ValueError("Job columns must have the same length.")
+        missing = array("q", [_MISSING]) * count
+        self.pids.extend(pids)
+        self.arrivals.extend(arrivals)
+        self.bursts.extend(bursts)
+        self.priorities.extend(missing if priorities is None else priorities)
+        self.deadlines.extend(missing if deadlines is None else deadlines)
+        self.start_times.extend(missing)
+        self.finish_times.extend(missing)
+
+    def write_binary(self, path: Path | str, *, stamp: Tuple[int, int] = (0, 0)) -> None:
+        """
+        Write the job columns as a little-endian binary file.
+
+        Layout: header (magic, version, `stamp`, row count, traced rows, trace
+        length, metadata length) followed by the raw columns pids, arrivals,
+        bursts, priorities and deadlines, the I/O traces (rows, offsets, flat
+        events) and the metadata as JSON. Start and finish times are run state
+        and are not written. `stamp` is opaque to the table; loaders use it to
+        tell whether a cache still matches its source file.
+        """
+        rows = array("q", self.io_traces)
+        offsets = array("q", [0])
+        events = array("q")
+        for trace in self.io_traces.values():
+            events.extend(trace)
+            offsets.append(len(events))
+        metadata = json.dumps({str(row): value for row, value in self.metadata.items()}).encode("utf-8")
+        with open(path, "wb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, _VERSION, *stamp, len(self), len(rows), len(events), len(metadata)))
+            columns = (self.pids, self.arrivals, self.bursts, self.priorities, self.deadlines, rows, offsets, events)
+            for column in columns:
+                handle.write(little_endian_bytes(column))
+            handle.write(metadata)
+
+    @classmethod
+    def read_binary(cls, path: Path | str, *, stamp: Tuple[int, int] | None = None) -> "PCBTable":
+        """
+        Load a table written by :meth:`write_binary`.
+
+        Raises ValueError when the file is not a complete job table or, with
+        `stamp`, when it was written for another version of the source.
+        """
+        payload = memoryview(Path(path).read_bytes())
+        if len(payload) < _HEADER.size:
+            raise ValueError(f"'{path}' is not a job table (version {_VERSION}).")
+        magic, version, stamp_high, stamp_low, count, traced, words, metadata_size = _HEADER.unpack_from(payload, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"'{path}' is not a job table (version {_VERSION}).")
+        if stamp is not None and (stamp_high, stamp_low) != tuple(stamp):
+            raise ValueError(f"'{path}' is stale for its source.")
+        words_expected = 5 * count + 2 * traced + 1 + words
+        if len(payload) != _HEADER.size + 8 * words_expected + metadata_size:
+            raise ValueError(f"'{path}' is truncated or corrupt.")
+        table = cls()
+        offset = _HEADER.size
+        table.pids, offset = read_column("q", payload, offset, count)
+        table.arrivals, offset = read_column("q", payload, offset, count)
+        table.bursts, offset = read_column("q", payload, offset, count)
+        table.priorities, offset = read_column("q", payload, offset, count)
+        table.deadlines, offset = read_column("q", payload, offset, count)
+        table.start_times = array("q", [_MISSING]) * count
+        table.finish_times = array("q", [_MISSING]) * count
+        rows, offset = read_column("q", payload, offset, traced)
+        bounds, offset = read_column("q", payload, offset, traced + 1)
+        events, offset = read_column("q", payload, offset, words)
+        for index, row in enumerate(rows):
+            table.io_traces[row] = events[bounds[index] : bounds[index + 1]]
+        if metadata_size:
+            metadata = json.loads(bytes(payload[offset : offset + metadata_size]))
+            if not isinstance(metadata, dict):
+                raise ValueError(f"'{path}' has corrupt metadata.")
+            table.metadata = {int(row): value for row, value in metadata.items()}
+        return table
+
+    def view(self, row: int) -> "PCBView":
+        """Create the live PCB view of `row`, with its full burst remaining."""
+        return PCBView(self, row)
+
+    def jobs(self) -> Iterator["PCBView"]:
+        """
+        Lazily yield a fresh view per job in arrival order (ties keep row order).
+
+        Suited to `SchedulerSimulator.load_jobs(..., presorted=True)`. Rows
+        added in arrival order are walked directly; otherwise a sorted row
+        index (8 bytes per job) is built first.
+        """
+        arrivals = self.arrivals
+        rows: range | array = range(len(arrivals))
+        if any(arrivals[index] > arrivals[index + 1] for index in range(len(arrivals) - 1)):
+            rows = array("q", sorted(rows, key=arrivals.__getitem__))
+        for row in rows:
+            yield PCBView(self, row)
+
+
+class PCBView:
+    """
+    PCB interface over one row of a `PCBTable`, plus the state of a live job.
+
+    Algorithms, queues and the simulator use it exactly like a `PCB`. Identity
+    matters to them, so the simulator keeps the single view created on
+    admission for the whole life of the job. `response_time`,
+    `turnaround_time` and `waiting_time` are derived from the start and finish
+    columns; assigning them has no effect.
+    """
+
+    __slots__ = (
+        "table",
+        "row",
+        "remaining_time",
+        "state",
+        "executed_time",
+        "io_remaining_time",
+        "last_core",
+        "off_cpu_since",
+        "ready_since",
+        "queue_level",
+        "burst_mark",
+        "stride_pass",
+        "_next_io_index",
+        "_io_events",
+        "_io_offset",
+        "_io_count",
+    )
+
+    def __init__(self, table: PCBTable, row: int) -> None:
+        self.table = table
+        self.row = row
+        self.remaining_time = table.bursts[row]
+        self.state = ProcessState.NEW
+        self.executed_time = 0
+        self.io_remaining_time: int | None = None
+        self.last_core: int | None = None
+        self.off_cpu_since: int | None = None
+        self.ready_since: int | None = None
+        self.queue_level = 0
+        self.burst_mark = 0
+        self.stride_pass = 0
+        self._next_io_index = 0
+        self._io_events: array | None = None
+        self._io_offset = 0
+        self._io_count = 0
+
+    def __repr__(self) -> str:
+        return f"PCBView(pid={self.pid}, row={self.row}, state={self.state.name})"
+
+    # Execution and I/O bookkeeping is shared with PCB.
+    set_state = PCB.set_state
+    consume = PCB.consume
+    prepare_io_schedule = PCB.prepare_io_schedule
+    io_request_due = PCB.io_request_due
+    cpu_until_next_io = PCB.cpu_until_next_io
+    complete_io = PCB.complete_io
+    io_schedule = PCB.io_schedule
+    _attach_io = PCB._attach_io
+
+    @property
+    def pid(self) -> int:
+        return self.table.pids[self.row]
+
+    @property
+    def arrival_time(self) -> int:
+        return self.table.arrivals[self.row]
+
+    @property
+    def burst_time(self) -> int:
+        return self.table.bursts[self.row]
+
+    @property
+    def metadata(self) -> Mapping[str, Any]:
+        return self.table.metadata.get(self.row, _NO_METADATA)
+
+    @property
+    def io_trace(self) -> array | None:
+        return self.table.io_traces.get(self.row)
+
+    @property
+    def priority(self) -> int | None:
+        return _optional(self.table.priorities[self.row])
+
+    @priority.setter
+    def priority(self, value: int | None) -> None:
+        self.table.priorities[self.row] = _stored(value)
+
+    @property
+    def deadline(self) -> int | None:
+        return _optional(self.table.deadlines[self.row])
+
+    @deadline.setter
+    def deadline(self, value: int | None) -> None:
+        self.table.deadlines[self.row] = _stored(value)
+
+    @property
+    def start_time(self) -> int | None:
+        return _optional(self.table.start_times[self.row])
+
+    @start_time.setter
+    def start_time(self, value: int | None) -> None:
+        self.table.start_times[self.row] = _stored(value)
+
+    @property
+    def finish_time(self) -> int | None:
+        return _optional(self.table.finish_times[self.row])
+
+    @finish_time.setter
+    def finish_time(self, value: int | None) -> None:
+        self.table.finish_times[self.row] = _stored(value)
+
+    @property
+    def response_time(self) -> int | None:
+        start = self.start_time
+        return None if start is None else start - self.arrival_time
+
+    @response_time.setter
+    def response_time(self, value: int | None) -> None:
+        """Derived from `start_time`."""
+
+    @property
+    def turnaround_time(self) -> int | None:
+        finish = self.finish_time
+        return None if finish is None else finish - self.arrival_time
+
+    @turnaround_time.setter
+    def turnaround_time(self, value: int | None) -> None:
+        """Derived from `finish_time`."""
+
+    @property
+    def waiting_time(self) -> int | None:
+        turnaround = self.turnaround_time
+        return None if turnaround is None else turnaround - self.burst_time
+
+    @waiting_time.setter
+    def waiting_time(self, value: int | None) -> None:
+        """Derived from `finish_time`."""
@@ -0,0 +1,93 @@
+"""Instrumentation surface of the simulator: observer callbacks and a phase profiler."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict
+
+from .pcb import PCB
+
+# Loop phases timed by the profiler, in execution order.
+PHASES = ("admission", "io_wakeup", "decision", "execution", "completion")
+
+
+class SimulationObserver:
+    """
+    Base class for callbacks fired by :class:`SchedulerSimulator` during a run.
+
+    Every hook is a no-op; subclasses override the ones they need. Observers
+    are only consulted when at least one is registered, so an unobserved run
+    pays nothing for them.
+    """
+
+    def on_arrival(self, pcb: PCB, time: int) -> None:
+        """A job entered a ready queue for the first time."""
+
+    def on_dispatch(self, core: int, pcb: PCB, time: int) -> None:
+        """`pcb` was given the CPU of `core`."""
+
+    def on_preempt(self, core: int, pcb: PCB, time: int) -> None:
+        """`pcb` was taken off `core` and returned to a ready queue."""
+
+    def on_block(self, core: int, pcb: PCB, time: int, wake_time: int | None) -> None:
+        """`pcb` left `core` for I/O and becomes ready again at `wake_time` (None while queued for a busy device)."""
+
+    def on_unblock(self, pcb: PCB, time: int) -> None:
+        """`pcb` finished its I/O and is ready again."""
+
+    def on_finish(self, core: int, pcb: PCB, time: int) -> None:
+        """`pcb` consumed its whole burst on `core`."""
+
+
+@dataclass(slots=True)
+class SimulationProfile:
+    """
+    Cumulative per-phase wall time and loop counters of one run.
+
+    `phase_times` holds seconds per entry of `PHASES`. Queue lengths are
+    sampled once per step and weighted by the ticks the step covers, so the
+    means are time averages over the simulated clock.
+    """
+
+    phase_times: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    wall_time: float = 0.0
+    steps: int = 0
+    ticks: int = 0
+    decisions: int = 0
+    dispatches: int = 0
+    preemptions: int = 0
+    blocks: int = 0
+    ready_queue_max: int = 0
+    blocked_queue_max: int = 0
+    _ready_area: int = field(default=0, repr=False)
+    _blocked_area: int = field(default=0, repr=False)
+    _started: float = field(default_factory=perf_counter, repr=False)
+
+    def lap(self, phase: str, since: float) -> float:
+        """Charge the time elapsed since `since` to `phase` and return the current instant."""
+        now = perf_counter()
+        self.phase_times[phase] += now - since
+        return now
+
+    def sample_queues(self, ready: int, blocked: int, ticks: int) -> None:
+        """Record queue lengths that held for `ticks` simulated ticks."""
+        if ready > self.ready_queue_max:
+            self.ready_queue_max = ready
+        if blocked > self.blocked_queue_max:
+            self.blocked_queue_max = blocked
+        self._ready_area += ready * ticks
+        self._blocked_area += blocked * ticks
+
+    def finish(self, ticks: int) -> None:
+        """Close the profile once the run stops at simulated time `ticks`."""
+        self.ticks = ticks
+        self.wall_time = perf_counter() - self._started
+
+    @property
+    def ready_queue_mean(self) -> float:
+        return self._ready_area / self.ticks if self.ticks else 0.0
+
+    @property
+    def blocked_queue_mean(self) -> float:
+        return self._blocked_area / self.ticks if self.ticks else 0.0
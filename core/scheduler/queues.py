@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import heapq
+import random
 from collections import deque
-from typing import Deque, Iterable, Iterator
+from itertools import count
+from typing import Any, Callable, Deque, Iterable, Iterator
 
 from .pcb import PCB
 
@@ -49,8 +52,410 @@ class ReadyQueue(ProcessQueue):
         super().__init__(name="ready")
 
 
-class BlockedQueue(ProcessQueue):
-    """Queue for processes waiting on I/O or similar events."""
+class PriorityProcessQueue(ProcessQueue):
+    """
+    Min-heap variant of `ProcessQueue` ordered by `key(pcb)` and then by enqueue order.
+
+    The enqueue sequence breaks ties, so PCBs with equal keys leave in FIFO order
+    exactly like a linear `min()` scan over a deque would pick them.
+    """
+
+    def __init__(self, *, name: str, key: Callable[[PCB], Any]) -> None:
+        self.name = name
+        self._key = key
+        self._heap: list[tuple[Any, int, PCB]] = []
+        self._sequence = count()
+
+    def enqueue(self, pcb: PCB) -> None:
+        """Add a PCB keyed by its current `key` value."""
+        heapq.heappush(self._heap, (self._key(pcb), next(self._sequence), pcb))
+
+    def dequeue(self) -> PCB | None:
+        """Remove and return the PCB with the smallest key, or None when empty."""
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[2]
+
+    def peek(self) -> PCB | None:
+        """Return the PCB with the smallest key without dequeuing it."""
+        if not self._heap:
+            return None
+        return self._heap[0][2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[PCB]:
+        """Iterate in dequeue order (sorts a copy, meant for inspection only)."""
+        return (entry[2] for entry in sorted(self._heap))
+
+    def extend(self, items: Iterable[PCB]) -> None:
+        """Bulk enqueue preserving the iteration order for ties."""
+        for pcb in items:
+            self.enqueue(pcb)
+
+
+class PriorityReadyQueue(PriorityProcessQueue, ReadyQueue):
+    """Ready queue that always yields the PCB with the smallest key first."""
+
+    def __init__(self, *, key: Callable[[PCB], Any]) -> None:
+        PriorityProcessQueue.__init__(self, name="ready", key=key)
+
+
+class BlockedQueue:
+    """
+    Queue for processes waiting on I/O or similar events, indexed by wake-up time.
+
+    Each PCB is stored with the absolute tick at which its I/O completes, so
+    releasing the due PCBs costs O(k log n) for the k that wake instead of
+    touching every blocked process on every tick. PCBs waking on the same tick
+    leave in the order they were blocked.
+    """
 
     def __init__(self) -> None:
-        super().__init__(name="blocked")
+        self.name = "blocked"
+        self._heap: list[tuple[int, int, PCB]] = []
+        self._sequence = count()
+
+    def enqueue(self, pcb: PCB, *, wake_time: int) -> None:
+        """Block a PCB until `wake_time`."""
+        heapq.heappush(self._heap, (wake_time, next(self._sequence), pcb))
+
+    def next_wake_time(self) -> int | None:
+        """Return the earliest wake-up tick, or None when nothing is blocked."""
+        if not self._heap:
+            return None
+        return self._heap[0][0]
+
+    def pop_due(self, now: int) -> list[PCB]:
+        """Remove and return, in wake-up order, every PCB whose wake time is <= `now`."""
+        due: list[PCB] = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[PCB]:
+        """Iterate in wake-up order (sorts a copy, meant for inspection only)."""
+        return (entry[2] for entry in sorted(self._heap))
+
+
+class AgingReadyQueue(ReadyQueue):
+    """
+    Ready queue bucketed by base priority, with lazily computed aging.
+
+    Lower numbers mean higher priority. A PCB that became ready at `ready_since`
+    has the effective priority `base - (now - ready_since) // aging_interval`,
+    computed only when it is compared: nothing is touched while PCBs wait.
+    Inside a bucket every PCB shares the base priority, so the one waiting
+    longest is also the best, and picking the next PCB only compares bucket
+    heads. Ties go to the PCB waiting longest, then to enqueue order.
+    """
+
+    def __init__(self, *, aging_interval: int | None = None, default_priority: int = 0) -> None:
+        super().__init__()
+        self.aging_interval = aging_interval or None
+        self.default_priority = default_priority
+        # Reference time for `dequeue`/`peek`; algorithms move it forward on each decision.
+        self.now = 0
+        self._buckets: dict[int, list[tuple[int, int, PCB]]] = {}
+        self._size = 0
+        self._sequence = count()
+
+    def base_priority(self, pcb: PCB) -> int:
+        """Priority of `pcb` before aging."""
+        return self.default_priority if pcb.priority is None else pcb.priority
+
+    def effective_priority(self, pcb: PCB, now: int) -> int:
+        """Priority of a waiting `pcb` at `now`, after aging."""
+        since = pcb.ready_since if pcb.ready_since is not None else now
+        return self._aged(self.base_priority(pcb), since, now)
+
+    def _aged(self, level: int, since: int, now: int) -> int:
+        if self.aging_interval is None:
+            return level
+        return level - max(now - since, 0) // self.aging_interval
+
+    def enqueue(self, pcb: PCB) -> None:
+        """Add a PCB to the bucket of its base priority, stamped with when it became ready."""
+        since = pcb.ready_since if pcb.ready_since is not None else self.now
+        bucket = self._buckets.setdefault(self.base_priority(pcb), [])
+        heapq.heappush(bucket, (since, next(self._sequence), pcb))
+        self._size += 1
+
+    def _best_level(self, now: int) -> int | None:
+        best_level: int | None = None
+        best_key: tuple[int, int, int] | None = None
+        for level, bucket in self._buckets.items():
+            since, sequence, _ = bucket[0]
+            key = (self._aged(level, since, now), since, sequence)
+            if best_key is None or key < best_key:
+                best_level, best_key = level, key
+        return best_level
+
+    def dequeue(self) -> PCB | None:
+        """Remove and return the best PCB at `now`, or None when empty."""
+        level = self._best_level(self.now)
+        if level is None:
+            return None
+        bucket = self._buckets[level]
+        pcb = heapq.heappop(bucket)[2]
+        if not bucket:
+            del self._buckets[level]
+        self._size -= 1
+        return pcb
+
+    def peek(self) -> PCB | None:
+        """Return the best PCB at `now` without dequeuing it."""
+        level = self._best_level(self.now)
+        return None if level is None else self._buckets[level][0][2]
+
+    def next_overtake_time(self, priority: int, now: int) -> int | None:
+        """
+        Return the first tick after `now` at which some waiting PCB ages to a
+        priority strictly better than `priority`, or None if none ever will.
+        """
+        if self.aging_interval is None:
+            return None
+        earliest: int | None = None
+        for level, bucket in self._buckets.items():
+            since = bucket[0][0]
+            candidate = since + (level - priority + 1) * self.aging_interval
+            if earliest is None or candidate < earliest:
+                earliest = candidate
+        return None if earliest is None else max(earliest, now + 1)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[PCB]:
+        """Iterate in dequeue order at `now` (sorts a copy, meant for inspection only)."""
+        entries = [(self._aged(level, since, self.now), since, sequence, pcb)
+                   for level, bucket in self._buckets.items()
+                   for since, sequence, pcb in bucket]
+        entries.sort(key=lambda entry: entry[:3])
+        return (entry[3] for entry in entries)
+
+    def extend(self, items: Iterable[PCB]) -> None:
+        """Bulk enqueue."""
+        for pcb in items:
+            self.enqueue(pcb)
+
+
+class MultilevelReadyQueue(ReadyQueue):
+    """
+    One FIFO `ProcessQueue` per level plus a bitmap of the non-empty levels.
+
+    Level 0 is served first. A PCB is enqueued at its `queue_level`, which
+    the scheduling algorithm maintains. Bit `i` of the bitmap is set while
+    level `i` holds work, so finding the highest non-empty level is a single
+    lowest-set-bit operation regardless of the number of levels.
+    """
+
+    def __init__(self, levels: int) -> None:
+        super().__init__()
+        if levels < 1:
+            raise ValueError("A multilevel queue needs at least one level.")
+        self.levels = [ProcessQueue(name=f"ready-{level}") for level in range(levels)]
+        self._bitmap = 0
+        self._size = 0
+
+    def enqueue(self, pcb: PCB) -> None:
+        """Add a PCB at the back of its level (clamped to the lowest level)."""
+        level = min(pcb.queue_level, len(self.levels) - 1)
+        self.levels[level].enqueue(pcb)
+        self._bitmap |= 1 << level
+        self._size += 1
+
+    def highest_level(self) -> int | None:
+        """Return the best non-empty level in O(1), or None when empty."""
+        if not self._bitmap:
+            return None
+        return (self._bitmap & -self._bitmap).bit_length() - 1
+
+    def dequeue(self) -> PCB | None:
+        """Remove and return the head of the best non-empty level, or None when empty."""
+        level = self.highest_level()
+        if level is None:
+            return None
+        queue = self.levels[level]
+        pcb = queue.dequeue()
+        if len(queue) == 0:
+            self._bitmap &= ~(1 << level)
+        self._size -= 1
+        return pcb
+
+    def peek(self) -> PCB | None:
+        """Return the head of the best non-empty level without dequeuing it."""
+        level = self.highest_level()
+        return None if level is None else self.levels[level].peek()
+
+    def boost(self) -> None:
+        """Move every waiting PCB to level 0, keeping their relative order."""
+        top = self.levels[0]
+        for queue in self.levels[1:]:
+            while (pcb := queue.dequeue()) is not None:
+                pcb.queue_level = 0
+                top.enqueue(pcb)
+        self._bitmap = 1 if self._size else 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[PCB]:
+        """Iterate in dequeue order."""
+        return (pcb for queue in self.levels for pcb in queue)
+
+    def extend(self, items: Iterable[PCB]) -> None:
+        """Bulk enqueue."""
+        for pcb in items:
+            self.enqueue(pcb)
+
+
+class LotteryReadyQueue(ReadyQueue):
+    """
+    Ready queue that hands out the CPU by lottery over a Fenwick tree of tickets.
+
+    Every PCB occupies a slot holding its ticket count; the tree stores prefix
+    sums over the slots, so drawing the owner of a ticket, adding and removing
+    a PCB all cost O(log n). Freed slots are reused and the tree doubles when
+    full, so its size follows the number of waiting PCBs.
+    """
+
+    def __init__(self, *, tickets: Callable[[PCB], int], rng: random.Random) -> None:
+        super().__init__()
+        self._tickets_of = tickets
+        self.rng = rng
+        self._capacity = 16
+        self._tree = [0] * (self._capacity + 1)
+        self._slot_tickets = [0] * self._capacity
+        self._owners: list[PCB | None] = [None] * self._capacity
+        self._free = list(range(self._capacity - 1, -1, -1))
+        self._size = 0
+        self.total_tickets = 0
+
+    def _add(self, slot: int, delta: int) -> None:
+        index = slot + 1
+        tree = self._tree
+        while index <= self._capacity:
+            tree[index] += delta
+            index += index & -index
+
+    def _grow(self) -> None:
+        old = self._capacity
+        self._capacity *= 2
+        self._slot_tickets.extend([0] * old)
+        self._owners.extend([None] * old)
+        self._free.extend(range(self._capacity - 1, old - 1, -1))
+        # Linear-time Fenwick rebuild.
+        tree = [0] * (self._capacity + 1)
+        for index in range(1, self._capacity + 1):
+            tree[index] += self._slot_tickets[index - 1]
+            parent = index + (index & -index)
+            if parent <= self._capacity:
+                tree[parent] += tree[index]
+        self._tree = tree
+
+    def enqueue(self, pcb: PCB) -> None:
+        """Add a PCB holding `tickets(pcb)` tickets (at least one)."""
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        held = max(1, self._tickets_of(pcb))
+        self._owners[slot] = pcb
+        self._slot_tickets[slot] = held
+        self._add(slot, held)
+        self._size += 1
+        self.total_tickets += held
+
+    def _find(self, ticket: int) -> int:
+        """Return the slot holding `ticket` (0-based) by descending the tree."""
+        position = 0
+        step = 1 << (self._capacity.bit_length() - 1)
+        tree = self._tree
+        while step:
+            candidate = position + step
+            if candidate <= self._capacity and tree[candidate] <= ticket:
+                position = candidate
+                ticket -= tree[candidate]
+            step >>= 1
+        return position
+
+    def pop_ticket(self, ticket: int) -> PCB:
+        """Remove and return the holder of `ticket`, with 0 <= ticket < total_tickets."""
+        slot = self._find(ticket)
+        pcb = self._owners[slot]
+        if pcb is None:
+            raise ValueError(f"Ticket {ticket} has no holder.")
+        held = self._slot_tickets[slot]
+        self._add(slot, -held)
+        self._owners[slot] = None
+        self._slot_tickets[slot] = 0
+        self._free.append(slot)
+        self._size -= 1
+        self.total_tickets -= held
+        return pcb
+
+    def dequeue(self) -> PCB | None:
+        """Remove and return the winner of a lottery among the waiting PCBs."""
+        if not self._size:
+            return None
+        return self.pop_ticket(self.rng.randrange(self.total_tickets))
+
+    def peek(self) -> PCB | None:
+        """Lotteries have no fixed head; return an arbitrary waiting PCB."""
+        return next(iter(self), None)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[PCB]:
+        """Iterate over the waiting PCBs in slot order (inspection only)."""
+        return (pcb for pcb in self._owners if pcb is not None)
+
+    def extend(self, items: Iterable[PCB]) -> None:
+        """Bulk enqueue."""
+        for pcb in items:
+            self.enqueue(pcb)
+
+
+class StrideReadyQueue(PriorityReadyQueue):
+    """
+    Min-heap of PCBs ordered by stride-scheduling pass.
+
+    A PCB's pass is `pcb.stride_pass + stride(pcb) * pcb.executed_time`, so
+    it advances with the CPU time consumed without any per-tick updates. The
+    queue tracks the global pass (that of the last PCB dispatched) and lifts
+    PCBs that join, or return from I/O, behind it so that time spent away
+    cannot be cashed in as a burst of CPU later.
+    """
+
+    def __init__(self, *, stride: Callable[[PCB], int]) -> None:
+        self._stride = stride
+        self.global_pass = 0
+        super().__init__(key=self.pass_of)
+
+    def pass_of(self, pcb: PCB) -> int:
+        """Current pass value of `pcb`."""
+        return pcb.stride_pass + self._stride(pcb) * pcb.executed_time
+
+    def enqueue(self, pcb: PCB) -> None:
+        """Add a PCB, moving its pass up to the global pass if it lags behind."""
+        lag = self.global_pass - self.pass_of(pcb)
+        if lag > 0:
+            pcb.stride_pass += lag
+        super().enqueue(pcb)
+
+    def dequeue(self) -> PCB | None:
+        """Remove and return the PCB with the smallest pass."""
+        if not self._heap:
+            return None
+        current_pass, _, pcb = heapq.heappop(self._heap)
+        self.global_pass = max(self.global_pass, current_pass)
+        return pcb
+
+    def min_pass(self) -> int | None:
+        """Pass of the next PCB to be dispatched, or None when empty."""
+        return self._heap[0][0] if self._heap else None
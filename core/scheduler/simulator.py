@@ -2,19 +2,41 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+import copy
+import math
+import random
+from array import array
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, List, Sequence
 
 from .algorithms.base import SchedulingAlgorithm
-from .metrics import SimulationMetrics
+from .devices import DeviceQueue, IODevice
+from .metrics import OnlineMetrics, SimulationMetrics
 from .pcb import PCB
+from .profiling import SimulationObserver, SimulationProfile
 from .queues import BlockedQueue, ReadyQueue
 from .states import ProcessState
+from .trace import BLOCK, FINISH, PREEMPT, TraceRecorder
 
 
 @dataclass
 class SimulationConfig:
-    """Shared configuration for the simulator and algorithms."""
+    """
+    Shared configuration for the simulator and algorithms.
+
+    Context switches are free by default. `dispatch_latency` charges a fixed
+    number of ticks per switch, and `cache_warmup` up to that many more for
+    a cold cache. The warm-up grows with the time the process spent off-CPU
+    as `cache_warmup * (1 - exp(-off_cpu / cache_decay))`. It is charged in
+    full on the first dispatch and after a migration to another core. Switch
+    ticks keep the core busy without advancing the process.
+
+    Without `io_devices` every I/O runs in parallel with all the others. With
+    them, each I/O goes to the device named by the job's
+    `metadata["io_device"]`, or to the first device, and queues there for a
+    free channel.
+    """
 
     algorithm: SchedulingAlgorithm
     time_slice: int | None = None
@@ -25,47 +47,192 @@ class SimulationConfig:
     io_duration_mean: float = 3.0
     io_duration_stddev: float = 1.0
     io_max_events: int | None = None
+    seed: int | None = None
+    engine: str = "tick"
+    retain_completed: bool = True
+    metrics_mode: str = "columns"
+    trace: bool = False
+    profile: bool = False
+    cpus: int = 1
+    queue_policy: str = "global"
+    dispatch_latency: int = 0
+    cache_warmup: int = 0
+    cache_decay: float = 10.0
+    io_devices: Sequence[IODevice] = ()
+
+
+ENGINES = ("tick", "event")
+QUEUE_POLICIES = ("global", "per_core")
+# "columns" keeps every process in typed arrays, "online" only running
+# statistics in constant memory, "both" does the two.
+METRICS_MODES = ("columns", "online", "both")
+
+
+@dataclass(slots=True)
+class CPUCore:
+    """
+    One CPU with its own running slot and algorithm instance.
+
+    Cores share the ready queue under the "global" policy; under "per_core"
+    each core owns its queue and steals from the longest one when it runs dry.
+    """
+
+    index: int
+    algorithm: SchedulingAlgorithm
+    ready_queue: ReadyQueue
+    running: PCB | None = None
+    busy_time: int = 0
+    context_switches: int = 0
+    # Ticks spent switching (included in busy_time) and those still owed by the running process.
+    switch_time: int = 0
+    switch_remaining: int = 0
+    last_pid: int | None = field(default=None, repr=False)
+
+
+class _ArrivalCursor:
+    """Peekable O(1) cursor over jobs sorted by arrival time."""
+
+    def __init__(self, jobs: Iterable[PCB], *, on_admit: Callable[[PCB], None] | None = None) -> None:
+        self._jobs: Iterator[PCB] = iter(jobs)
+        self._on_admit = on_admit
+        self._head: PCB | None = None
+        self._last_arrival: int | None = None
+        self._advance()
+
+    def _advance(self) -> None:
+        self._head = next(self._jobs, None)
+        if self._head is None:
+            return
+        if self._last_arrival is not None and self._head.arrival_time < self._last_arrival:
+            raise ValueError(
+                f"Job {self._head.pid} arrives at {self._head.arrival_time}, before the previous job "
+                f"({self._last_arrival}); presorted job streams must be ordered by arrival time."
+            )
+        self._last_arrival = self._head.arrival_time
+        if self._on_admit is not None:
+            self._on_admit(self._head)
+
+    def __bool__(self) -> bool:
+        return self._head is not None
+
+    def next_arrival(self) -> int | None:
+        """Return the arrival time of the next job, or None when exhausted."""
+        return self._head.arrival_time if self._head is not None else None
+
+    def pop_arrived(self, now: int) -> Iterator[PCB]:
+        """Yield, in order, every job whose arrival time is <= `now`."""
+        while self._head is not None and self._head.arrival_time <= now:
+            job = self._head
+            self._advance()
+            yield job
 
 
 class SchedulerSimulator:
     """Coordinates queues, algorithm decisions and metrics in a discrete-time run."""
 
-    def __init__(self, config: SimulationConfig) -> None:
+    def __init__(self, config: SimulationConfig, observers: Iterable[SimulationObserver] = ()) -> None:
         self.config = config
-        self.ready_queue = ReadyQueue()
+        self.observers: List[SimulationObserver] = list(observers)
+        self.ready_queue = self._new_ready_queue()
         self.blocked_queue = BlockedQueue()
         self.clock: int = 0
         self.completed: List[PCB] = []
-        self._jobs: list[PCB] = []
+        self.cores: List[CPUCore] = []
+        self.live_metrics: SimulationMetrics | None = None
+        self.trace: TraceRecorder | None = None
+        self.profile: SimulationProfile | None = None
+        self._jobs: Iterable[PCB] = []
+        self._presorted = False
+        self._rng: random.Random | None = None
+        self.devices: dict[str, DeviceQueue] = {}
 
-    def load_jobs(self, jobs: Sequence[PCB] | Iterable[PCB]) -> None:
-        """Reset internal state and register the PCBs to simulate."""
+    def add_observer(self, observer: SimulationObserver) -> None:
+        """Register callbacks fired on arrivals, dispatches, preemptions, I/O and completions."""
+        self.observers.append(observer)
+
+    def load_jobs(self, jobs: Sequence[PCB] | Iterable[PCB], *, presorted: bool = False) -> None:
+        """
+        Reset internal state and register the PCBs to simulate.
+
+        With `presorted=True` the jobs are kept as given and consumed lazily,
+        one at a time, as the clock reaches their arrival; they must already be
+        ordered by arrival time and their I/O schedules are drawn on admission.
+        """
         self.clock = 0
-        self.ready_queue = ReadyQueue()
+        self.ready_queue = self._new_ready_queue()
         self.blocked_queue = BlockedQueue()
         self.completed = []
-        self._jobs = list(jobs)
-        self._jobs.sort(key=lambda pcb: pcb.arrival_time)
+        self._presorted = presorted
+        # A fresh generator per load keeps seeded runs reproducible; without a
+        # seed the global generator is used, as `random.seed` callers expect.
+        self._rng = random.Random(self.config.seed) if self.config.seed is not None else None
+        if presorted:
+            self._jobs = jobs
+            return
+        self._jobs = sorted(jobs, key=lambda pcb: pcb.arrival_time)
+        # Every schedule is drawn in one pass into a single flat buffer.
+        events = array("q")
         for job in self._jobs:
-            job.prepare_io_schedule(
-                interval_mean=self.config.io_interval_mean,
-                interval_stddev=self.config.io_interval_stddev,
-                duration_mean=self.config.io_duration_mean,
-                duration_stddev=self.config.io_duration_stddev,
-                max_events=self.config.io_max_events,
-                enabled=self.config.io_enabled and job.metadata.get("io_enabled", True),
-            )
+            self._prepare_io(job, events)
+
+    def _prepare_io(self, job: PCB, buffer: array | None = None) -> None:
+        """Draw the I/O schedule of a job from the configured distributions, into `buffer` when given."""
+        job.prepare_io_schedule(
+            interval_mean=self.config.io_interval_mean,
+            interval_stddev=self.config.io_interval_stddev,
+            duration_mean=self.config.io_duration_mean,
+            duration_stddev=self.config.io_duration_stddev,
+            max_events=self.config.io_max_events,
+            enabled=self.config.io_enabled and job.metadata.get("io_enabled", True),
+            rng=self._rng,
+            buffer=buffer,
+        )
+
+    def _new_ready_queue(self) -> ReadyQueue:
+        """Let the algorithm pick its ready queue structure, defaulting to FIFO."""
+        factory = getattr(self.config.algorithm, "create_ready_queue", None)
+        if factory is None:
+            return ReadyQueue()
+        return factory()
+
+    @property
+    def ready_queues(self) -> List[ReadyQueue]:
+        """Distinct ready queues in core order (a single one under the global policy)."""
+        if self.config.queue_policy == "per_core" and self.cores:
+            return [core.ready_queue for core in self.cores]
+        return [self.ready_queue]
 
     def run(self) -> SimulationMetrics:
         """
         Execute the simulation using the configured algorithm.
 
         Implements a simple discrete-time simulation: at each tick we enqueue
-        newly-arrived jobs, ask the algorithm for the next process to run, and
-        consume one unit of CPU time. Metrics are derived from the final PCB
-        state.
+        newly-arrived jobs, ask the algorithm for the next process to run on
+        each core, and consume one unit of CPU time per busy core. With
+        `engine="event"` the same loop jumps straight to the next arrival, I/O
+        trigger or completion, quantum expiry or job completion instead of
+        stepping one tick at a time. Per-process metrics are recorded as each
+        job terminates, so with `retain_completed=False` finished PCBs are
+        released right away.
         """
-        if not self._jobs:
+        if self.config.engine not in ENGINES:
+            raise ValueError(f"Unsupported engine '{self.config.engine}'. Use one of {ENGINES}.")
+        if self.config.queue_policy not in QUEUE_POLICIES:
+            raise ValueError(
+                f"Unsupported queue policy '{self.config.queue_policy}'. Use one of {QUEUE_POLICIES}."
+            )
+        if self.config.metrics_mode not in METRICS_MODES:
+            raise ValueError(
+                f"Unsupported metrics mode '{self.config.metrics_mode}'. Use one of {METRICS_MODES}."
+            )
+        if self.config.cpus < 1:
+            raise ValueError("The simulator needs at least one CPU.")
+        if self.config.dispatch_latency < 0 or self.config.cache_warmup < 0:
+            raise ValueError("Context switch costs cannot be negative.")
+        if self.config.cache_decay <= 0:
+            raise ValueError("The cache decay time must be positive.")
+        jobs_pending = _ArrivalCursor(self._jobs, on_admit=self._prepare_io if self._presorted else None)
+        if not jobs_pending:
             return SimulationMetrics()
 
         algorithm = self.config.algorithm
@@ -76,102 +243,408 @@ class SchedulerSimulator:
                 # If the algorithm does not expose a mutable quantum, ignore the suggestion.
                 pass
         algorithm.reset()
+        self.devices = self._build_devices()
+        self.cores = self._build_cores(algorithm)
+        cores = self.cores
 
-        total_jobs = len(self._jobs)
-        jobs_pending: list[PCB] = list(self._jobs)
-        running: PCB | None = None
-        context_switches = 0
-        busy_time = 0
+        event_driven = self.config.engine == "event"
+        metrics = SimulationMetrics()
+        record_columns = self.config.metrics_mode in ("columns", "both")
+        if self.config.metrics_mode in ("online", "both"):
+            metrics.online = OnlineMetrics()
+        online = metrics.online
+        # Updated in place as jobs finish, so observers can read it mid-run.
+        self.live_metrics = metrics
+        completed_count = 0
+        self.trace = TraceRecorder() if self.config.trace else None
+        trace = self.trace
+        # Profiling and observers are opt-in; every hook below is skipped when they are off.
+        self.profile = SimulationProfile() if self.config.profile else None
+        profile = self.profile
+        observers = self.observers
+        mark = 0.0
 
         # Load jobs that arrive at time 0 through the algorithm's priming hook.
-        initial_jobs: list[PCB] = []
-        while jobs_pending and jobs_pending[0].arrival_time <= self.clock:
-            job = jobs_pending.pop(0)
+        initial_jobs: dict[int, list[PCB]] = {}
+        for job in jobs_pending.pop_arrived(self.clock):
             job.set_state(ProcessState.READY)
-            initial_jobs.append(job)
-        if initial_jobs:
-            algorithm.prime(self.ready_queue, initial_jobs)
+            job.ready_since = self.clock
+            target = self._place(job, initial_jobs)
+            initial_jobs.setdefault(target.index, []).append(job)
+            for observer in observers:
+                observer.on_arrival(job, self.clock)
+        for index, jobs in initial_jobs.items():
+            cores[index].algorithm.prime(cores[index].ready_queue, jobs)
 
-        while len(self.completed) < total_jobs:
+        # The loop ends through the idle branch once nothing is running, queued or pending.
+        while True:
             if self.config.max_time is not None and self.clock >= self.config.max_time:
                 break
 
+            if profile is not None:
+                mark = perf_counter()
             # Enqueue jobs that have just arrived.
-            while jobs_pending and jobs_pending[0].arrival_time <= self.clock:
-                job = jobs_pending.pop(0)
+            for job in jobs_pending.pop_arrived(self.clock):
                 job.set_state(ProcessState.READY)
-                self.ready_queue.enqueue(job)
-
-            # Advance blocked processes and return them to the ready queue when I/O completes.
-            if len(self.blocked_queue) > 0:
-                unblock: list[PCB] = []
-                for _ in range(len(self.blocked_queue)):
-                    blocked = self.blocked_queue.dequeue()
-                    if blocked is None:
-                        continue
-                    blocked.tick_io()
-                    if blocked.io_remaining_time is None:
-                        unblock.append(blocked)
-                    else:
-                        self.blocked_queue.enqueue(blocked)
-                if unblock:
-                    for pcb in unblock:
-                        pcb.set_state(ProcessState.READY)
-                    self.ready_queue.extend(unblock)
-
-            # If the CPU is idle and no jobs are ready, jump to the next arrival.
-            if running is None and len(self.ready_queue) == 0:
+                job.ready_since = self.clock
+                self._place(job).ready_queue.enqueue(job)
+                if observers:
+                    for observer in observers:
+                        observer.on_arrival(job, self.clock)
+            if profile is not None:
+                mark = profile.lap("admission", mark)
+
+            # Return blocked processes whose I/O completes by now to the ready queue.
+            for pcb in self.blocked_queue.pop_due(self.clock):
+                if self.devices:
+                    self._release_device(pcb)
+                pcb.complete_io()
+                pcb.set_state(ProcessState.READY)
+                pcb.ready_since = self.clock
+                target = self._place(pcb)
+                io_return = getattr(target.algorithm, "on_io_return", None)
+                if io_return is not None:
+                    io_return(pcb)
+                target.ready_queue.enqueue(pcb)
+                if trace is not None:
+                    trace.unblock(pcb.pid, self.clock)
+                if observers:
+                    for observer in observers:
+                        observer.on_unblock(pcb, self.clock)
+            if profile is not None:
+                mark = profile.lap("io_wakeup", mark)
+
+            # If every CPU is idle and no jobs are ready, jump to the next arrival.
+            if all(core.running is None for core in cores) and not any(map(len, self.ready_queues)):
                 if len(self.blocked_queue) > 0:
-                    self.clock += 1
+                    idle_since = self.clock
+                    if event_driven:
+                        self.clock = self._next_idle_stop(jobs_pending)
+                    else:
+                        self.clock += 1
+                    if profile is not None:
+                        profile.sample_queues(0, self._blocked_count(), self.clock - idle_since)
                     continue
                 if jobs_pending:
-                    self.clock = max(self.clock + 1, jobs_pending[0].arrival_time)
+                    self.clock = max(self.clock + 1, jobs_pending.next_arrival())
                     continue
                 # Nothing left to do.
                 break
 
-            decision = algorithm.next_tick(
-                current_time=self.clock,
-                running=running,
-                ready_queue=self.ready_queue,
-            )
+            for core in cores:
+                if core.switch_remaining:
+                    # A context switch in progress is not interrupted.
+                    continue
+                if core.running is None and len(core.ready_queue) == 0:
+                    self._steal_for(core)
+                self._dispatch(core)
 
-            if decision.preempt_current and running is not None and running is not decision.next_process:
-                running.set_state(ProcessState.READY)
-                self.ready_queue.enqueue(running)
-                running = None
-
-            if decision.next_process is not None and decision.next_process is not running:
-                previous_pid = running.pid if running else None
-                running = decision.next_process
-                if running.start_time is None:
-                    running.start_time = self.clock
-                    running.response_time = self.clock - running.arrival_time
-                if running.pid != previous_pid:
-                    context_switches += 1
-
-            if running is not None:
+            span = 1
+            if event_driven:
+                span = self._step_span(jobs_pending)
+            if profile is not None:
+                mark = profile.lap("decision", mark)
+                profile.steps += 1
+                profile.sample_queues(sum(map(len, self.ready_queues)), self._blocked_count(), span)
+            for core in cores:
+                running = core.running
+                if running is None:
+                    continue
                 running.set_state(ProcessState.RUNNING)
-                running.consume(1)
-                busy_time += 1
-                blocked_now, _duration = running.io_request_due()
+                core.busy_time += span
+                work = span
+                if core.switch_remaining:
+                    # Switch cost comes first and does not advance the process.
+                    paid = min(span, core.switch_remaining)
+                    core.switch_remaining -= paid
+                    core.switch_time += paid
+                    work -= paid
+                    if core.switch_remaining == 0:
+                        run_start = getattr(core.algorithm, "on_run_start", None)
+                        if run_start is not None:
+                            run_start(running, self.clock + paid)
+                    if work == 0:
+                        continue
+                running.consume(work)
+                blocked_now, duration = running.io_request_due()
                 if blocked_now:
+                    # The I/O starts on the last tick of the span and is serviced
+                    # from the next tick on; a zero-length I/O still takes one tick.
+                    wake_time = self.clock + span - 1 + max(duration or 0, 1)
+                    if self.devices:
+                        wake_time = self._device_for(running).submit(
+                            running, issued=self.clock + span - 1, duration=max(duration or 0, 1)
+                        )
                     running.set_state(ProcessState.BLOCKED)
-                    self.blocked_queue.enqueue(running)
-                    running = None
-            self.clock += 1
+                    running.off_cpu_since = self.clock + span
+                    if wake_time is not None:
+                        self.blocked_queue.enqueue(running, wake_time=wake_time)
+                    core.running = None
+                    if trace is not None:
+                        trace.stop(core.index, self.clock + span, BLOCK)
+                    if profile is not None:
+                        profile.blocks += 1
+                    if observers:
+                        for observer in observers:
+                            observer.on_block(core.index, running, self.clock + span, wake_time)
+            self.clock += span
+            if profile is not None:
+                mark = profile.lap("execution", mark)
 
-            if running is not None and running.remaining_time == 0:
+            for core in cores:
+                running = core.running
+                if running is None or running.remaining_time > 0 or core.switch_remaining:
+                    continue
                 running.finish_time = self.clock
                 running.turnaround_time = running.finish_time - running.arrival_time
                 running.waiting_time = running.turnaround_time - running.burst_time
                 running.set_state(ProcessState.TERMINATED)
-                self.completed.append(running)
-                running = None
+                lateness = None
+                if running.deadline is not None:
+                    lateness = self.clock - running.deadline
+                    metrics.record_deadline(lateness)
+                if record_columns:
+                    metrics.record(
+                        running.pid,
+                        running.waiting_time,
+                        running.turnaround_time,
+                        running.response_time,
+                        lateness,
+                    )
+                if online is not None:
+                    online.observe(
+                        running.waiting_time,
+                        running.turnaround_time,
+                        running.response_time,
+                        lateness,
+                    )
+                completed_count += 1
+                if self.config.retain_completed:
+                    self.completed.append(running)
+                core.running = None
+                if trace is not None:
+                    trace.stop(core.index, self.clock, FINISH)
+                if observers:
+                    for observer in observers:
+                        observer.on_finish(core.index, running, self.clock)
+            if profile is not None:
+                profile.lap("completion", mark)
 
-        metrics = SimulationMetrics.from_pcbs(self.completed)
+        if trace is not None:
+            trace.close(self.clock)
+            metrics.trace = trace
+        if profile is not None:
+            profile.finish(self.clock)
+            metrics.profile = profile
+
+        busy_time = sum(core.busy_time for core in cores)
+        metrics.total_time = self.clock
+        metrics.busy_time = busy_time
+        metrics.core_busy_time = [core.busy_time for core in cores]
+        metrics.core_context_switches = [core.context_switches for core in cores]
+        metrics.switch_time = sum(core.switch_time for core in cores)
+        for name, device in self.devices.items():
+            device.close(self.clock)
+            device_metrics = device.metrics
+            if self.clock > 0:
+                device_metrics.utilization = device_metrics.busy_time / (self.clock * device.device.parallelism)
+            metrics.devices[name] = device_metrics
+        # Adaptive algorithms share their tuning state across cores, so the first copy has it all.
+        quantum_history = getattr(cores[0].algorithm, "quantum_history", None)
+        if quantum_history is not None:
+            metrics.quantum_history = list(quantum_history)
         if self.clock > 0:
-            metrics.throughput = len(self.completed) / self.clock
-            metrics.cpu_utilization = busy_time / self.clock
-        metrics.context_switches = context_switches
+            metrics.throughput = completed_count / self.clock
+            metrics.cpu_utilization = busy_time / (self.clock * len(cores))
+            metrics.core_utilization = [core.busy_time / self.clock for core in cores]
+        metrics.context_switches = sum(metrics.core_context_switches)
         return metrics
+
+    def _build_devices(self) -> dict[str, DeviceQueue]:
+        """Create an empty queue per configured device; seeded runs give each its own generator."""
+        devices: dict[str, DeviceQueue] = {}
+        for device in self.config.io_devices:
+            if device.name in devices:
+                raise ValueError(f"Duplicate I/O device '{device.name}'.")
+            rng = random.Random(f"{self.config.seed}:{device.name}") if self.config.seed is not None else None
+            devices[device.name] = DeviceQueue(device, rng)
+        return devices
+
+    def _device_for(self, pcb: PCB) -> DeviceQueue:
+        """Device targeted by `pcb`: `metadata["io_device"]`, else the first configured one."""
+        name = pcb.metadata.get("io_device")
+        if name is None:
+            return next(iter(self.devices.values()))
+        device = self.devices.get(name)
+        if device is None:
+            raise ValueError(f"Job {pcb.pid} targets unknown I/O device '{name}'.")
+        return device
+
+    def _release_device(self, pcb: PCB) -> None:
+        """Free the channel `pcb` used and start the next request waiting for it."""
+        started = self._device_for(pcb).complete(pcb, self.clock)
+        if started is not None:
+            waiting, wake_time = started
+            self.blocked_queue.enqueue(waiting, wake_time=wake_time)
+
+    def _blocked_count(self) -> int:
+        """Blocked processes, including those still queued for a busy device."""
+        return len(self.blocked_queue) + sum(map(len, self.devices.values()))
+
+    def _build_cores(self, algorithm: SchedulingAlgorithm) -> List[CPUCore]:
+        """Create the cores; each one gets its own copy of the (stateful) algorithm."""
+        per_core = self.config.queue_policy == "per_core"
+        cores: List[CPUCore] = []
+        for index in range(self.config.cpus):
+            core_algorithm = algorithm if index == 0 else copy.deepcopy(algorithm)
+            if index == 0 or not per_core:
+                queue = self.ready_queue
+            else:
+                queue = self._new_ready_queue()
+            cores.append(CPUCore(index=index, algorithm=core_algorithm, ready_queue=queue))
+        return cores
+
+    def _place(self, pcb: PCB, pending: dict[int, list[PCB]] | None = None) -> CPUCore:
+        """
+        Pick the core whose queue receives `pcb`.
+
+        Under "per_core" a process returns to the core it last ran on; new work
+        goes to the least loaded core (queued plus running, lowest index on ties).
+        """
+        if len(self.cores) == 1 or self.config.queue_policy == "global":
+            return self.cores[0]
+        if pcb.last_core is not None:
+            return self.cores[pcb.last_core]
+
+        def load(core: CPUCore) -> int:
+            extra = len(pending.get(core.index, ())) if pending is not None else 0
+            return len(core.ready_queue) + extra + (core.running is not None)
+
+        return min(self.cores, key=load)
+
+    def _steal_for(self, core: CPUCore) -> None:
+        """Move one ready PCB from the longest foreign queue to an idle core."""
+        if self.config.queue_policy != "per_core":
+            return
+        victim = max(self.cores, key=lambda other: len(other.ready_queue))
+        if victim is core or len(victim.ready_queue) == 0:
+            return
+        stolen = victim.ready_queue.dequeue()
+        if stolen is not None:
+            core.ready_queue.enqueue(stolen)
+
+    def _dispatch(self, core: CPUCore) -> None:
+        """Apply the core's algorithm decision: preempt, dispatch and count switches."""
+        running = core.running
+        decision = core.algorithm.next_tick(
+            current_time=self.clock,
+            running=running,
+            ready_queue=core.ready_queue,
+        )
+        profile = self.profile
+        if profile is not None:
+            profile.decisions += 1
+
+        if decision.preempt_current and running is not None and running is not decision.next_process:
+            running.set_state(ProcessState.READY)
+            running.ready_since = self.clock
+            running.off_cpu_since = self.clock
+            core.ready_queue.enqueue(running)
+            if self.trace is not None:
+                self.trace.stop(core.index, self.clock, PREEMPT)
+            if profile is not None:
+                profile.preemptions += 1
+            for observer in self.observers:
+                observer.on_preempt(core.index, running, self.clock)
+            running = None
+
+        if decision.next_process is not None and decision.next_process is not running:
+            previous_pid = running.pid if running else None
+            running = decision.next_process
+            migrated = running.last_core is not None and running.last_core != core.index
+            running.last_core = core.index
+            if self.trace is not None:
+                self.trace.dispatch(core.index, running.pid, self.clock)
+            if profile is not None:
+                profile.dispatches += 1
+            for observer in self.observers:
+                observer.on_dispatch(core.index, running, self.clock)
+            if running.start_time is None:
+                running.start_time = self.clock
+                running.response_time = self.clock - running.arrival_time
+            if running.pid != previous_pid:
+                core.context_switches += 1
+                core.switch_remaining = self._switch_cost(running, migrated)
+        core.running = running
+
+    def _switch_cost(self, pcb: PCB, migrated: bool) -> int:
+        """Ticks charged for switching to `pcb`: dispatch latency plus cache warm-up."""
+        cost = self.config.dispatch_latency
+        warmup = self.config.cache_warmup
+        if warmup:
+            if migrated or pcb.off_cpu_since is None:
+                cost += warmup
+            else:
+                off_cpu = self.clock - pcb.off_cpu_since
+                cost += round(warmup * -math.expm1(-off_cpu / self.config.cache_decay))
+        return cost
+
+    def _next_external_event(self, jobs_pending: _ArrivalCursor) -> int | None:
+        """Return the next arrival or I/O completion time, whichever comes first."""
+        next_wake = self.blocked_queue.next_wake_time()
+        next_arrival = jobs_pending.next_arrival()
+        if next_arrival is None:
+            return next_wake
+        return next_arrival if next_wake is None else min(next_arrival, next_wake)
+
+    def _next_idle_stop(self, jobs_pending: _ArrivalCursor) -> int:
+        """Return the tick idle CPUs should jump to while I/O is in flight."""
+        target = self._next_external_event(jobs_pending)
+        if target is None:
+            target = self.clock + 1
+        if self.config.max_time is not None:
+            target = min(target, self.config.max_time)
+        return max(target, self.clock + 1)
+
+    def _step_span(self, jobs_pending: _ArrivalCursor) -> int:
+        """Return how many ticks every core can keep its current process before anything may change."""
+        span: int | None = None
+        waiting_work = any(map(len, self.ready_queues))
+        for core in self.cores:
+            if core.running is None:
+                if waiting_work:
+                    # An idle core next to queued work re-decides on the next tick.
+                    return 1
+                continue
+            core_span = self._running_span(core)
+            span = core_span if span is None else min(span, core_span)
+        if span is None:
+            return 1
+        external = self._next_external_event(jobs_pending)
+        if external is not None:
+            span = min(span, external - self.clock)
+        if self.config.max_time is not None:
+            span = min(span, self.config.max_time - self.clock)
+        return max(span, 1)
+
+    def _running_span(self, core: CPUCore) -> int:
+        """Return how many ticks the core's process can run before its own state may change."""
+        running = core.running
+        if core.switch_remaining:
+            # The algorithm is not consulted until the switch is paid for.
+            return core.switch_remaining
+        span = max(running.remaining_time, 1)
+        until_io = running.cpu_until_next_io()
+        if until_io is not None:
+            span = min(span, max(until_io, 1))
+        horizon = getattr(core.algorithm, "next_event_time", None)
+        if horizon is None:
+            return 1
+        decision_change = horizon(
+            current_time=self.clock,
+            running=running,
+            ready_queue=core.ready_queue,
+        )
+        if decision_change is not None:
+            span = min(span, decision_change - self.clock)
+        return max(span, 1)
@@ -0,0 +1,59 @@
+import argparse
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure the `core` and `adapters` packages are importable when tests run from repository root.
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from core.scheduler.metrics import SimulationMetrics
+from core.services.sim_service import SweepPoint, SweepResult
+
+# `adapters.cli` re-exports `main`, which shadows the module of the same name.
+cli = importlib.import_module("adapters.cli.main")
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("7", [7]), ("1:4", [1, 2, 3, 4]), ("2:10:4", [2, 6, 10]), ("5:1", [])],
+)
+def test_parse_int_range(value, expected):
+    assert cli._parse_int_range(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "a", "1:b", "1:5:0", "1:5:-1", "1:2:3:4"])
+def test_parse_int_range_rejects_malformed_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli._parse_int_range(value)
+
+
+def test_sweep_is_a_sibling_of_sim_and_sim_requires_its_arguments(capsys):
+    parser = cli.build_parser()
+
+    args = parser.parse_args(["sweep", "--input", "a.csv", "--quanta", "1:3", "5"])
+    assert args.handler is cli.handle_sweep_command
+    assert args.quanta == [[1, 2, 3], [5]]
+
+    for argv in (["sim", "--input", "a.csv"], ["sim", "--algo", "fcfs"]):
+        with pytest.raises(SystemExit):
+            parser.parse_args(argv)
+    assert "required" in capsys.readouterr().err
+
+
+def test_sweep_table_columns_fit_long_algorithm_names():
+    metrics = SimulationMetrics(throughput=0.5, cpu_utilization=1.0)
+    metrics.record(1, 1.0, 2.0, 0.0)
+    results = [
+        SweepResult(point=SweepPoint(trace="a.csv", algorithm=algorithm, quantum=quantum), metrics=metrics)
+        for algorithm, quantum in (("fcfs", None), ("priority-preemptive", None), ("rr-adaptive", 4))
+    ]
+
+    lines = cli.format_sweep_results(results).splitlines()
+    header, rows = lines[3], lines[5:-1]
+
+    assert {len(row) for row in rows} == {len(header)}
+    assert {row.index(" 0.500") for row in rows} == {header.index("  Thru")}
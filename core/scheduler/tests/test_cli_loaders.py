@@ -0,0 +1,426 @@
+import gzip
+import importlib
+import io
+import json
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Ensure the `core` and `adapters` packages are importable when tests run from repository root.
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from core.scheduler.pcb_table import PCBTable
+from core.scheduler.trace import TraceRecorder
+from core.services.sim_service import SimService, SimulationRequest, jobs_to_table
+
+# `adapters.cli` re-exports `main`, which shadows the module of the same name.
+cli = importlib.import_module("adapters.cli.main")
+
+
+def _rows(table):
+    return [
+        (
+            job.pid,
+            job.arrival_time,
+            job.burst_time,
+            job.priority,
+            job.deadline,
+            None if job.io_trace is None else list(job.io_trace),
+            dict(job.metadata),
+        )
+        for job in table.jobs()
+    ]
+
+
+def _write_csv(path, lines):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+    return path
+
+
+def _assert_matches_row_parser(path):
+    table = cli._load_table_from_csv(path)
+    assert _rows(table) == _rows(jobs_to_table(cli._load_jobs_from_csv(path)))
+    return table
+
+
+@pytest.mark.parametrize("width", [3, 4, 5])
+def test_plain_csv_takes_the_column_fast_path(tmp_path, monkeypatch, width):
+    lines = [",".join(str(pid * 10 + column) for column in range(width)) for pid in range(1, 201)]
+    path = _write_csv(tmp_path / "plain.csv", lines)
+    plain_chunks = []
+    extend_plain = cli._extend_plain_chunk
+
+    def record(table, chunk):
+        plain_chunks.append(extend_plain(table, chunk))
+        return plain_chunks[-1]
+
+    monkeypatch.setattr(cli, "_extend_plain_chunk", record)
+
+    table = _assert_matches_row_parser(path)
+
+    assert len(table) == 200
+    assert plain_chunks == [True]
+
+
+@pytest.mark.parametrize(
+    "odd_line",
+    [
+        '"7",7,3',
+        "# a comment",
+        "7,7,3,1,+5",
+        "7,7,,1,,2;4;1",
+        "7,7,3,,",
+        "7,7,3",
+        "7,x,3,1,9",
+        "7,7",
+    ],
+)
+def test_csv_chunks_with_odd_lines_fall_back_to_the_row_parser(tmp_path, monkeypatch, odd_line):
+    lines = [f"{pid},{pid},{1 + pid % 4},{pid % 3},{pid + 20}" for pid in range(1, 301)]
+    lines[150] = odd_line
+    path = _write_csv(tmp_path / "odd.csv", lines)
+    monkeypatch.setattr(cli, "_CSV_MIN_SPLIT", 8)
+
+    table = _assert_matches_row_parser(path)
+
+    assert len(table) >= 299
+
+
+def test_csv_rows_straddling_chunk_boundaries_are_kept_whole(tmp_path, monkeypatch):
+    lines = [f"{pid},{pid * 3},{100000 + pid},{pid % 7},{pid * 3 + 50}" for pid in range(1, 2001)]
+    lines[1234] = "1235,3705,7,1,+9"
+    path = _write_csv(tmp_path / "chunks.csv", lines)
+    # Chunks end mid-row unless readlines() finishes the line it is in.
+    monkeypatch.setattr(cli, "_CSV_CHUNK_BYTES", 100)
+    monkeypatch.setattr(cli, "_CSV_MIN_SPLIT", 4)
+
+    table = _assert_matches_row_parser(path)
+
+    assert list(table.pids) == list(range(1, 2001))
+    assert table.view(1234).deadline == 3705 + 9
+
+
+def _scenario(tmp_path):
+    return _write_csv(tmp_path / "jobs.csv", [f"{pid},{pid},{1 + pid % 5},1,{pid + 9}" for pid in range(1, 51)])
+
+
+def _forbid_parsing(monkeypatch):
+    def fail(_path):
+        raise AssertionError("the cached table should have been used")
+
+    monkeypatch.setattr(cli, "_load_table_from_csv", fail)
+
+
+def test_table_cache_is_reused_for_an_unchanged_source(tmp_path, monkeypatch):
+    path = _scenario(tmp_path)
+    sidecar = tmp_path / "jobs.csv.pcbt"
+
+    first = cli.load_table_from_path(path)
+    assert sidecar.exists()
+    _forbid_parsing(monkeypatch)
+
+    assert _rows(cli.load_table_from_path(path)) == _rows(first)
+
+
+def test_table_cache_is_skipped_when_disabled(tmp_path):
+    cli.load_table_from_path(_scenario(tmp_path), cache=False)
+
+    assert not (tmp_path / "jobs.csv.pcbt").exists()
+
+
+def test_table_cache_is_invalidated_when_the_source_changes(tmp_path):
+    path = _scenario(tmp_path)
+    cli.load_table_from_path(path)
+
+    # Same size, different mtime.
+    stat = path.stat()
+    path.write_text(path.read_text(encoding="utf-8").replace("1,1,2,1,10", "1,1,3,1,10"), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert path.stat().st_size == stat.st_size
+    assert cli.load_table_from_path(path).view(0).burst_time == 3
+
+    # Different size, mtime put back.
+    path.write_text(path.read_text(encoding="utf-8") + "51,51,4,1,60\n", encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert len(cli.load_table_from_path(path)) == 51
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda payload: payload[:-20],
+        lambda payload: payload[:10],
+        lambda payload: b"",
+        lambda payload: b"not a job table at all" * 8,
+        lambda payload: payload[:-2] + b"!!",
+    ],
+    ids=["truncated", "header-only", "empty", "garbage", "corrupt-metadata"],
+)
+def test_table_cache_recovers_from_damaged_sidecars(tmp_path, damage):
+    path = _write_csv(tmp_path / "jobs.csv", ['1,0,3,1,+5,"1;2;2"', "2,1,4"])
+    sidecar = tmp_path / "jobs.csv.pcbt"
+    expected = _rows(cli.load_table_from_path(path))
+    sidecar.write_bytes(damage(sidecar.read_bytes()))
+
+    assert _rows(cli.load_table_from_path(path)) == expected
+    # The damaged sidecar was overwritten with a good one.
+    stat = path.stat()
+    assert _rows(PCBTable.read_binary(sidecar, stamp=(stat.st_mtime_ns, stat.st_size))) == expected
+
+
+def test_table_cache_recovers_from_a_foreign_binary_file(tmp_path):
+    path = _scenario(tmp_path)
+    expected = _rows(cli.load_table_from_path(path, cache=False))
+    recorder = TraceRecorder()
+    recorder.dispatch(0, 1, 0)
+    recorder.close(3)
+    recorder.write_binary(tmp_path / "jobs.csv.pcbt")
+
+    assert _rows(cli.load_table_from_path(path)) == expected
+
+
+def test_read_binary_rejects_truncated_tables(tmp_path):
+    table = PCBTable()
+    table.add(1, 0, 3, priority=2, metadata={"io_device": "disk"}, io_trace=[1, 2])
+    table.add(2, 4, 5, deadline=12)
+    path = tmp_path / "table.pcbt"
+    table.write_binary(path, stamp=(7, 9))
+
+    assert _rows(PCBTable.read_binary(path, stamp=(7, 9))) == _rows(table)
+    with pytest.raises(ValueError):
+        PCBTable.read_binary(path, stamp=(7, 10))
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        PCBTable.read_binary(path)
+
+
+def test_trace_binary_round_trip(tmp_path):
+    recorder = TraceRecorder()
+    recorder.dispatch(0, 1, 0)
+    recorder.stop(0, 2, 0)
+    recorder.unblock(1, 4)
+    recorder.dispatch(1, 1, 4)
+    recorder.close(6)
+    path = tmp_path / "run.trace"
+    recorder.write_binary(path)
+
+    loaded = TraceRecorder.read_binary(path)
+
+    assert list(loaded.segments()) == list(recorder.segments())
+    assert list(loaded.events()) == list(recorder.events())
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda payload: payload[:-3],
+        lambda payload: payload + b"\0",
+        lambda payload: payload[:10],
+        lambda payload: b"",
+    ],
+    ids=["truncated", "trailing-bytes", "short-header", "empty"],
+)
+def test_trace_read_binary_rejects_damaged_files(tmp_path, damage):
+    recorder = TraceRecorder()
+    recorder.dispatch(0, 1, 0)
+    recorder.unblock(2, 1)
+    recorder.close(3)
+    path = tmp_path / "run.trace"
+    recorder.write_binary(path)
+    path.write_bytes(damage(path.read_bytes()))
+
+    with pytest.raises(ValueError, match="trace|truncated"):
+        TraceRecorder.read_binary(path)
+
+
+def test_trace_read_binary_rejects_foreign_files(tmp_path):
+    path = tmp_path / "jobs.pcbt"
+    jobs_to_table(cli._load_jobs_from_csv(_scenario(tmp_path))).write_binary(path)
+
+    with pytest.raises(ValueError, match="not a scheduler trace"):
+        TraceRecorder.read_binary(path)
+
+
+_JSONL_JOBS = [
+    {"pid": 1, "arrival": 0, "burst": 4, "priority": 2},
+    {"pid": 2, "arrival": 1, "bursts": [2, 3, 1], "relative_deadline": 9},
+    {"pid": 3, "arrival": 3, "burst": 2, "io_device": "disk", "metadata": {"tag": "x"}},
+]
+
+
+def _jsonl_bytes(jobs):
+    return "".join(json.dumps(job) + "\n" for job in jobs).encode("utf-8")
+
+
+def _job_fields(jobs):
+    return [
+        (
+            job.pid,
+            job.arrival,
+            job.burst,
+            job.priority,
+            job.absolute_deadline,
+            None if job.io_trace is None else list(job.io_trace),
+            job.metadata,
+        )
+        for job in jobs
+    ]
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("-", True),
+        ("jobs.jsonl", True),
+        ("jobs.NDJSON", True),
+        ("trace.jsonl.gz", True),
+        ("dir.v2/jobs.ndjson.gz", True),
+        ("jobs.json", False),
+        ("jobs.csv.gz", False),
+        ("jobs.gz", False),
+        ("jobs", False),
+    ],
+)
+def test_is_jsonl_source(source, expected):
+    assert cli.is_jsonl_source(source) is expected
+    assert cli.is_jsonl_source(Path(source)) is expected
+
+
+def test_iter_jobs_from_jsonl_skips_blank_and_invalid_lines(tmp_path, capsys):
+    first, second, third = (json.dumps(job) for job in _JSONL_JOBS)
+    lines = [first, "", "{not json", "[1, 2]", second, "  ", third]
+    path = tmp_path / "jobs.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    jobs = list(cli.iter_jobs_from_jsonl(path))
+
+    assert _job_fields(jobs) == [
+        (1, 0, 4, 2, None, None, {}),
+        (2, 1, 3, None, 10, [2, 3], {}),
+        (3, 3, 2, None, None, None, {"tag": "x", "io_device": "disk"}),
+    ]
+    warnings = capsys.readouterr().out
+    assert "Line 3" in warnings and "Line 4" in warnings
+
+
+def test_iter_jobs_from_jsonl_is_lazy(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_bytes(_jsonl_bytes(_JSONL_JOBS))
+
+    jobs = cli.iter_jobs_from_jsonl(path)
+    first = next(jobs)
+    path.unlink()
+
+    assert first.pid == 1
+    assert [job.pid for job in jobs] == [2, 3]
+
+
+def test_iter_jobs_from_gzipped_jsonl(tmp_path):
+    plain = tmp_path / "jobs.jsonl"
+    plain.write_bytes(_jsonl_bytes(_JSONL_JOBS))
+    packed = tmp_path / "jobs.jsonl.gz"
+    packed.write_bytes(gzip.compress(_jsonl_bytes(_JSONL_JOBS)))
+
+    assert _job_fields(cli.iter_jobs_from_jsonl(packed)) == _job_fields(cli.iter_jobs_from_jsonl(plain))
+    assert _job_fields(cli.load_jobs_from_path(packed)) == _job_fields(cli.iter_jobs_from_jsonl(plain))
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["plain", "gzip"])
+def test_iter_jobs_from_jsonl_reads_stdin(monkeypatch, compress):
+    payload = _jsonl_bytes(_JSONL_JOBS)
+    if compress:
+        payload = gzip.compress(payload)
+    monkeypatch.setattr(sys, "stdin", SimpleNamespace(buffer=io.BufferedReader(io.BytesIO(payload))))
+
+    assert [job.pid for job in cli.iter_jobs_from_jsonl("-")] == [1, 2, 3]
+
+
+def _run_sim(capsys, *argv):
+    code = cli.main(["sim", "--algo", "fcfs", "--seed", "3", *argv])
+    return code, capsys.readouterr().out
+
+
+def test_sim_sorts_unordered_jsonl_files_unless_streaming(tmp_path, capsys):
+    path = tmp_path / "jobs.jsonl"
+    path.write_bytes(_jsonl_bytes(list(reversed(_JSONL_JOBS))))
+
+    code, output = _run_sim(capsys, "--input", str(path))
+    assert code == 0
+    assert "SIMULATION RESULTS" in output
+
+    code, output = _run_sim(capsys, "--input", str(path), "--stream")
+    assert code == 1
+    assert output.startswith("Error: ") and "ordered by arrival time" in output
+    assert "Traceback" not in output
+
+
+def test_sim_jsonl_matches_json_input(tmp_path, capsys):
+    jsonl = tmp_path / "jobs.jsonl"
+    jsonl.write_bytes(_jsonl_bytes(_JSONL_JOBS))
+    as_json = tmp_path / "jobs.json"
+    as_json.write_text(json.dumps(_JSONL_JOBS), encoding="utf-8")
+
+    assert _run_sim(capsys, "--input", str(jsonl)) == _run_sim(capsys, "--input", str(as_json))
+
+
+def _feed_stdin(monkeypatch, jobs):
+    stdin = SimpleNamespace(buffer=io.BufferedReader(io.BytesIO(_jsonl_bytes(jobs))))
+    monkeypatch.setattr(sys, "stdin", stdin)
+
+
+def test_sim_always_streams_stdin(monkeypatch, capsys):
+    _feed_stdin(monkeypatch, _JSONL_JOBS)
+    code, output = _run_sim(capsys, "--input", "-")
+    assert code == 0
+    assert "SIMULATION RESULTS" in output
+
+    # Stdin is never loaded up front, so it cannot be sorted either.
+    _feed_stdin(monkeypatch, list(reversed(_JSONL_JOBS)))
+    code, output = _run_sim(capsys, "--input", "-")
+    assert code == 1
+    assert "ordered by arrival time" in output
+
+
+def test_sim_loads_file_scenarios_through_the_table_cache(tmp_path, monkeypatch, capsys):
+    path = _write_csv(tmp_path / "jobs.csv", ["1,0,4,2,+9", '2,1,,1,,"2;3;1"', "3,3,2", "4,2,5,1,30"])
+    sidecar = tmp_path / "jobs.csv.pcbt"
+    reference = SimService().run(
+        SimulationRequest(jobs=cli.load_jobs_from_path(path), algorithm="fcfs", options={"seed": 3})
+    )
+
+    first = _run_sim(capsys, "--input", str(path))
+    assert sidecar.exists()
+    _forbid_parsing(monkeypatch)
+
+    assert _run_sim(capsys, "--input", str(path)) == first
+    assert first == (0, cli.format_metrics(reference) + "\n")
+
+
+def test_sim_no_cache_leaves_no_sidecar(tmp_path, capsys):
+    path = _scenario(tmp_path)
+
+    assert _run_sim(capsys, "--input", str(path), "--no-cache")[0] == 0
+    assert not (tmp_path / "jobs.csv.pcbt").exists()
+
+
+def test_sim_engine_flag_reaches_the_simulator(tmp_path, monkeypatch, capsys):
+    path = _write_csv(tmp_path / "long.csv", ["1,0,5000,1", "2,3,20000,2", '3,9,,1,,"700;1500;9000"'])
+    engines = []
+    run = cli.SimService.run
+
+    def record(service, request):
+        engines.append(request.options["engine"])
+        return run(service, request)
+
+    monkeypatch.setattr(cli.SimService, "run", record)
+
+    ticked = _run_sim(capsys, "--input", str(path))
+    evented = _run_sim(capsys, "--input", str(path), "--engine", "event")
+
+    assert engines == ["tick", "event"]
+    assert evented == ticked
@@ -1,5 +1,7 @@
+import json
 import random
 import sys
+from array import array
 from pathlib import Path
 
 import pytest
@@ -9,11 +11,31 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
+from scheduler.algorithms.adaptive_rr import AdaptiveRoundRobinAlgorithm
+from scheduler.algorithms.edf import EDFAlgorithm
 from scheduler.algorithms.fcfs import FCFSAlgorithm
+from scheduler.algorithms.lottery import LotteryAlgorithm
+from scheduler.algorithms.mlfq import MLFQAlgorithm
+from scheduler.algorithms.priority import PriorityAlgorithm
 from scheduler.algorithms.rr import RoundRobinAlgorithm
 from scheduler.algorithms.sjf import SJFAlgorithm
-from scheduler.pcb import PCB
+from scheduler.algorithms.srtf import SRTFAlgorithm
+from scheduler.algorithms.stride import StrideAlgorithm
+from scheduler.devices import DeviceQueue, IODevice
+from scheduler.metrics import ProcessMetrics, SimulationMetrics, SlidingWindowQuantile, summarize
+from scheduler.pcb import PCB, replay_schedule
+from scheduler.pcb_table import PCBTable
+from scheduler.profiling import PHASES, SimulationObserver
+from scheduler.queues import (
+    AgingReadyQueue,
+    BlockedQueue,
+    LotteryReadyQueue,
+    MultilevelReadyQueue,
+    PriorityReadyQueue,
+    ReadyQueue,
+)
 from scheduler.simulator import SchedulerSimulator, SimulationConfig
+from scheduler.trace import TraceRecorder
 
 
 def test_fcfs_runs_in_arrival_order_without_io():
@@ -108,6 +130,250 @@ def test_sjf_tie_uses_queue_order_when_bursts_equal():
     assert metrics.context_switches == 2
 
 
+def test_srtf_preempts_for_shorter_arrival_and_keeps_running_on_ties():
+    config = SimulationConfig(algorithm=SRTFAlgorithm(), io_enabled=False)
+    sim = SchedulerSimulator(config)
+    sim.load_jobs([PCB(1, 0, 8), PCB(2, 1, 4), PCB(3, 2, 3), PCB(4, 5, 3)])
+
+    metrics = sim.run()
+    results = {m.pid: m for m in metrics.processes}
+
+    # P2 preempts P1 at t=1; P3 (3) ties P2's remaining 3 at t=2 and waits.
+    assert [pcb.pid for pcb in sim.completed] == [2, 3, 4, 1]
+    assert results[2].turnaround_time == 4
+    assert results[3].waiting_time == 3
+    assert results[4].response_time == 3
+    assert results[1].turnaround_time == 18
+    assert metrics.context_switches == 5
+
+
+def test_edf_runs_earliest_deadline_and_reports_misses():
+    def run(mode):
+        config = SimulationConfig(algorithm=EDFAlgorithm(), io_enabled=False, metrics_mode=mode)
+        sim = SchedulerSimulator(config)
+        sim.load_jobs(
+            [
+                PCB(1, 0, 5, deadline=20),
+                PCB(2, 1, 3, deadline=5),
+                PCB(3, 2, 2),
+                PCB(4, 3, 4, deadline=6),
+            ]
+        )
+        return sim, sim.run()
+
+    sim, metrics = run("columns")
+    results = {m.pid: m for m in metrics.processes}
+
+    # P2 preempts P1; P4 (deadline 6) waits for P2 (5) and misses by 2; P3 has no deadline and runs last.
+    assert [pcb.pid for pcb in sim.completed] == [2, 4, 1, 3]
+    assert results[2].lateness == -1
+    assert results[4].lateness == 2
+    assert results[3].lateness is None
+    assert metrics.deadline_jobs == 3
+    assert metrics.deadline_misses == 1
+    assert metrics.deadline_miss_rate == pytest.approx(1 / 3)
+    assert metrics.max_lateness == 2
+    assert metrics.summaries()["tardiness"].mean == pytest.approx(2 / 3)
+
+    _, online_metrics = run("online")
+    assert online_metrics.deadline_misses == 1
+    assert online_metrics.summaries()["tardiness"].max == 2
+
+
+def test_priority_aging_prevents_starvation():
+    jobs = [PCB(1, 0, 2, priority=5)] + [PCB(pid, pid - 2, 1, priority=0) for pid in range(2, 32)]
+
+    def finish_order(aging_interval):
+        config = SimulationConfig(
+            algorithm=PriorityAlgorithm(preemptive=True, aging_interval=aging_interval),
+            io_enabled=False,
+        )
+        sim = SchedulerSimulator(config)
+        sim.load_jobs([PCB(job.pid, job.arrival_time, job.burst_time, priority=job.priority) for job in jobs])
+        sim.run()
+        return [pcb.pid for pcb in sim.completed]
+
+    # Without aging the low-priority job waits for the whole stream of urgent work.
+    assert finish_order(None)[-1] == 1
+    # Aged one level every 2 ticks, it reaches priority 0 at t=10 and wins the
+    # tie against the job arriving then because it has waited longer.
+    assert finish_order(2).index(1) == 10
+
+
+def test_aging_ready_queue_computes_priorities_lazily():
+    queue = AgingReadyQueue(aging_interval=4)
+    old, fresh = PCB(1, 0, 5, priority=3), PCB(2, 0, 5, priority=0)
+    old.ready_since, fresh.ready_since = 0, 10
+    queue.extend([old, fresh])
+
+    queue.now = 10
+    assert queue.peek() is fresh
+    # A running priority-0 job is first outranked by `fresh` itself, aged once at t=14.
+    assert queue.next_overtake_time(0, 10) == 14
+    queue.now = 16
+    assert queue.effective_priority(old, 16) == queue.effective_priority(fresh, 16) == -1
+    assert [pcb.pid for pcb in queue] == [1, 2]
+    assert queue.dequeue() is old and len(queue) == 1
+
+
+def test_mlfq_demotes_cpu_bound_jobs_and_promotes_on_io_return():
+    config = SimulationConfig(algorithm=MLFQAlgorithm(levels=2, quanta=[2, 4]), io_enabled=False)
+    sim = SchedulerSimulator(config)
+    batch, interactive = PCB(1, 0, 10), PCB(2, 1, 2)
+    sim.load_jobs([batch, interactive])
+
+    metrics = sim.run()
+    results = {m.pid: m for m in metrics.processes}
+
+    # The batch job exhausts its level-0 quantum at t=2 and yields to the newcomer.
+    assert [pcb.pid for pcb in sim.completed] == [2, 1]
+    assert results[2].waiting_time == 1
+    assert results[1].turnaround_time == 12
+    assert (batch.queue_level, interactive.queue_level) == (1, 0)
+
+    sim.config.algorithm.on_io_return(batch)
+    assert batch.queue_level == 0
+
+
+def test_multilevel_queue_bitmap_and_boost():
+    queue = MultilevelReadyQueue(3)
+    low, mid = PCB(1, 0, 5), PCB(2, 0, 5)
+    low.queue_level, mid.queue_level = 2, 1
+    queue.extend([low, mid])
+
+    assert queue.highest_level() == 1
+    assert [pcb.pid for pcb in queue] == [2, 1]
+    queue.boost()
+    assert queue.highest_level() == 0 and low.queue_level == 0
+    assert queue.dequeue() is mid and queue.dequeue() is low
+    assert queue.highest_level() is None and len(queue) == 0
+
+
+def test_lottery_queue_fenwick_matches_linear_scan():
+    rng = random.Random(3)
+    queue = LotteryReadyQueue(tickets=lambda pcb: pcb.burst_time, rng=random.Random(0))
+    waiting = []
+    for pid in range(200):
+        pcb = PCB(pid, 0, rng.randint(1, 50))
+        queue.enqueue(pcb)
+        waiting.append(pcb)
+        if pid % 3 == 0:
+            ticket = rng.randrange(queue.total_tickets)
+            # Reference: walk the tickets in slot order.
+            remaining = ticket
+            for candidate in queue:
+                if remaining < candidate.burst_time:
+                    break
+                remaining -= candidate.burst_time
+            assert queue.pop_ticket(ticket) is candidate
+            waiting.remove(candidate)
+
+    assert len(queue) == len(waiting)
+    assert queue.total_tickets == sum(pcb.burst_time for pcb in waiting)
+
+
+def test_proportional_share_follows_tickets():
+    def shares(algorithm):
+        jobs = [PCB(1, 0, 10**6, priority=0), PCB(2, 0, 10**6, priority=1), PCB(3, 0, 10**6, priority=3)]
+        config = SimulationConfig(algorithm=algorithm, io_enabled=False, max_time=7000, engine="event")
+        sim = SchedulerSimulator(config)
+        sim.load_jobs(jobs)
+        sim.run()
+        return [job.executed_time for job in jobs]
+
+    # 100, 50 and 25 tickets: stride is exact, lottery close and reproducible.
+    assert shares(StrideAlgorithm(quantum=1)) == [4000, 2000, 1000]
+    lottery = shares(LotteryAlgorithm(quantum=1, seed=3))
+    assert lottery == shares(LotteryAlgorithm(quantum=1, seed=3))
+    assert all(abs(got - want) < 200 for got, want in zip(lottery, [4000, 2000, 1000]))
+
+
+def test_context_switch_costs_are_charged_as_busy_time():
+    def run(engine, **costs):
+        config = SimulationConfig(
+            algorithm=RoundRobinAlgorithm(quantum=2), io_enabled=False, engine=engine, **costs
+        )
+        sim = SchedulerSimulator(config)
+        sim.load_jobs([PCB(1, 0, 4), PCB(2, 0, 4)])
+        return sim.run(), sim.clock
+
+    metrics, clock = run("tick", dispatch_latency=1)
+
+    # Each of the four switches costs a tick and the quantum starts once it is paid.
+    assert clock == 12
+    assert metrics.switch_time == 4
+    assert metrics.busy_time == 12
+    assert metrics.cpu_utilization == 1.0
+    assert metrics.effective_utilization == pytest.approx(8 / 12)
+    assert run("event", dispatch_latency=1) == (metrics, clock)
+
+    # Cold first dispatches pay the full warm-up; later ones decay with time off-CPU.
+    metrics, clock = run("tick", cache_warmup=3, cache_decay=10.0)
+    assert metrics.switch_time == 3 + 3 + 1 + 1
+    assert clock == 16
+    assert run("event", cache_warmup=3, cache_decay=10.0) == (metrics, clock)
+
+
+@pytest.mark.parametrize(
+    "make_algorithm",
+    [
+        SRTFAlgorithm,
+        lambda: RoundRobinAlgorithm(quantum=1),
+        lambda: MLFQAlgorithm(levels=3, quanta=[1, 3, 6], boost_interval=25),
+        lambda: PriorityAlgorithm(preemptive=True, aging_interval=4),
+    ],
+)
+def test_event_engine_matches_tick_engine_with_switch_costs(make_algorithm):
+    def run(engine, seed):
+        rng = random.Random(seed)
+        jobs = [PCB(pid, rng.randint(0, 30), rng.randint(0, 12), priority=rng.randint(0, 4)) for pid in range(12)]
+        config = SimulationConfig(
+            algorithm=make_algorithm(),
+            engine=engine,
+            cpus=2,
+            seed=seed,
+            dispatch_latency=seed % 3,
+            cache_warmup=2,
+            cache_decay=3.0,
+            io_devices=[IODevice("disk", discipline="scan", tracks=40, seek_time=0.1)],
+        )
+        sim = SchedulerSimulator(config)
+        sim.load_jobs(jobs)
+        return sim.run(), [pcb.pid for pcb in sim.completed], sim.clock
+
+    for seed in range(10):
+        assert run("event", seed) == run("tick", seed)
+
+
+def test_adaptive_round_robin_converges_to_burst_percentile():
+    algorithm = AdaptiveRoundRobinAlgorithm(quantum=1, window=8, update_every=4)
+
+    def run():
+        config = SimulationConfig(algorithm=algorithm, io_enabled=False)
+        sim = SchedulerSimulator(config)
+        sim.load_jobs([PCB(pid, 0, 5) for pid in range(12)])
+        return sim.run()
+
+    metrics = run()
+
+    # Every burst runs to completion in 5 ticks, so the quantum settles on 5 after four bursts.
+    assert [quantum for _, quantum in metrics.quantum_history] == [1, 5]
+    assert algorithm.quantum == 5
+    assert run().quantum_history == metrics.quantum_history
+
+
+def test_sliding_window_quantile_matches_sorted_window():
+    rng = random.Random(3)
+    sketch = SlidingWindowQuantile(window=16)
+    values = [rng.randint(0, 50) for _ in range(200)]
+    for index, value in enumerate(values):
+        sketch.add(value)
+        window = sorted(values[max(0, index - 15): index + 1])
+        assert len(sketch) == len(window)
+        assert sketch.quantile(0.5) == summarize(window).p50
+        assert sketch.quantile(1.0) == window[-1]
+
+
 def test_max_time_stops_simulation_early():
     config = SimulationConfig(algorithm=FCFSAlgorithm(), max_time=2, io_enabled=False)
     sim = SchedulerSimulator(config)
@@ -134,3 +400,520 @@ def test_zero_burst_process_completes_without_error():
     assert sim.completed[0].finish_time == 1
     assert results[1].turnaround_time == 1
     assert metrics.cpu_utilization == 1.0
+
+
+def _run_with_engine(engine, algorithm, seed):
+    rng = random.Random(seed)
+    jobs = [PCB(pid, rng.randint(0, 40), rng.randint(0, 15)) for pid in range(10)]
+    for pcb in jobs[::2]:
+        pcb.deadline = pcb.arrival_time + rng.randint(5, 40)
+    config = SimulationConfig(algorithm=algorithm, engine=engine, max_time=120)
+    sim = SchedulerSimulator(config)
+    random.seed(seed)
+    sim.load_jobs(jobs)
+    metrics = sim.run()
+    return metrics, [pcb.pid for pcb in sim.completed], sim.clock
+
+
+@pytest.mark.parametrize(
+    "make_algorithm",
+    [
+        FCFSAlgorithm,
+        SJFAlgorithm,
+        SRTFAlgorithm,
+        lambda: RoundRobinAlgorithm(quantum=1),
+        lambda: RoundRobinAlgorithm(quantum=4),
+        lambda: MLFQAlgorithm(levels=3, quanta=[1, 3, 6], boost_interval=25),
+        lambda: LotteryAlgorithm(quantum=2, seed=7),
+        lambda: StrideAlgorithm(quantum=3),
+        EDFAlgorithm,
+        lambda: EDFAlgorithm(preemptive=False),
+        lambda: AdaptiveRoundRobinAlgorithm(quantum=1, window=8, update_every=2),
+    ],
+)
+def test_event_engine_matches_tick_engine(make_algorithm):
+    for seed in range(20):
+        tick = _run_with_engine("tick", make_algorithm(), seed)
+        event = _run_with_engine("event", make_algorithm(), seed)
+
+        assert event[0] == tick[0]
+        assert event[1] == tick[1]
+        assert event[2] == tick[2]
+
+
+def test_event_engine_skips_long_bursts():
+    config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=1000), engine="event", io_enabled=False)
+    sim = SchedulerSimulator(config)
+    sim.load_jobs([PCB(1, 0, 10**6), PCB(2, 5, 10**6)])
+
+    metrics = sim.run()
+
+    assert sim.clock == 2 * 10**6
+    assert metrics.context_switches == 2000
+    assert metrics.cpu_utilization == 1.0
+
+
+def test_unknown_engine_is_rejected():
+    sim = SchedulerSimulator(SimulationConfig(algorithm=FCFSAlgorithm(), engine="warp"))
+    sim.load_jobs([PCB(1, 0, 1)])
+
+    with pytest.raises(ValueError):
+        sim.run()
+
+
+class _FifoSJF(SJFAlgorithm):
+    """SJF forced onto the plain deque to cross-check the heap-backed queue."""
+
+    def create_ready_queue(self):
+        return ReadyQueue()
+
+
+def test_sjf_heap_queue_matches_linear_scan():
+    for seed in range(20):
+        heap = _run_with_engine("tick", SJFAlgorithm(), seed)
+        linear = _run_with_engine("tick", _FifoSJF(), seed)
+
+        assert heap == linear
+
+
+def test_priority_ready_queue_breaks_ties_in_enqueue_order():
+    queue = PriorityReadyQueue(key=lambda pcb: pcb.remaining_time)
+    queue.extend([PCB(1, 0, 4), PCB(2, 0, 2), PCB(3, 0, 4), PCB(4, 0, 2)])
+
+    assert [pcb.pid for pcb in queue] == [2, 4, 1, 3]
+    assert queue.peek().pid == 2
+    assert [queue.dequeue().pid for _ in range(4)] == [2, 4, 1, 3]
+    assert queue.dequeue() is None
+
+
+def test_blocked_queue_releases_only_due_pcbs_in_block_order():
+    queue = BlockedQueue()
+    queue.enqueue(PCB(1, 0, 5), wake_time=7)
+    queue.enqueue(PCB(2, 0, 5), wake_time=4)
+    queue.enqueue(PCB(3, 0, 5), wake_time=7)
+
+    assert queue.next_wake_time() == 4
+    assert [pcb.pid for pcb in queue] == [2, 1, 3]
+    assert queue.pop_due(3) == []
+    assert [pcb.pid for pcb in queue.pop_due(4)] == [2]
+    assert [pcb.pid for pcb in queue.pop_due(10)] == [1, 3]
+    assert len(queue) == 0
+    assert queue.next_wake_time() is None
+
+
+def test_presorted_stream_matches_sorted_list():
+    def make_jobs():
+        rng = random.Random(7)
+        return sorted(
+            (PCB(pid, rng.randint(0, 40), rng.randint(1, 15)) for pid in range(10)),
+            key=lambda pcb: pcb.arrival_time,
+        )
+
+    results = []
+    for presorted in (False, True):
+        sim = SchedulerSimulator(SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=2)))
+        random.seed(7)
+        sim.load_jobs(iter(make_jobs()), presorted=presorted)
+        metrics = sim.run()
+        results.append((metrics, [pcb.pid for pcb in sim.completed], sim.clock))
+
+    assert results[0] == results[1]
+
+
+def test_presorted_stream_rejects_out_of_order_arrivals():
+    sim = SchedulerSimulator(SimulationConfig(algorithm=FCFSAlgorithm(), io_enabled=False))
+    sim.load_jobs(iter([PCB(1, 5, 2), PCB(2, 3, 2)]), presorted=True)
+
+    with pytest.raises(ValueError):
+        sim.run()
+
+
+def test_streaming_run_drops_finished_pcbs_but_keeps_metrics():
+    def job_stream():
+        for pid in range(1, 6):
+            yield PCB(pid, pid * 2, 3)
+
+    retained = SchedulerSimulator(SimulationConfig(algorithm=FCFSAlgorithm(), io_enabled=False))
+    retained.load_jobs(list(job_stream()))
+    expected = retained.run()
+
+    config = SimulationConfig(algorithm=FCFSAlgorithm(), io_enabled=False, retain_completed=False)
+    streamed = SchedulerSimulator(config)
+    streamed.load_jobs(job_stream(), presorted=True)
+    metrics = streamed.run()
+
+    assert streamed.completed == []
+    assert metrics == expected
+    assert [m.pid for m in metrics.processes] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize(
+    "make_algorithm",
+    [SRTFAlgorithm, lambda: RoundRobinAlgorithm(quantum=3), lambda: LotteryAlgorithm(quantum=2, seed=1)],
+)
+def test_pcb_table_runs_like_pcb_objects(make_algorithm):
+    rng = random.Random(9)
+    specs = [(pid, rng.randint(0, 50), rng.randint(0, 15), rng.randint(0, 3)) for pid in range(40)]
+
+    def run(jobs, presorted):
+        config = SimulationConfig(algorithm=make_algorithm(), engine="event", seed=9, cpus=2, retain_completed=False)
+        sim = SchedulerSimulator(config)
+        sim.load_jobs(jobs, presorted=presorted)
+        return sim.run()
+
+    table = PCBTable()
+    for pid, arrival, burst, priority in specs:
+        table.add(pid, arrival, burst, priority=priority, deadline=arrival + 20)
+    pcbs = [PCB(pid, arrival, burst, priority, deadline=arrival + 20) for pid, arrival, burst, priority in specs]
+    expected = run(pcbs, False)
+
+    assert run(table.jobs(), True) == expected
+    assert table.nbytes == 40 * 7 * 8
+    view = table.view(0)
+    assert view.turnaround_time == table.finish_times[0] - view.arrival_time
+    assert view.waiting_time == view.turnaround_time - view.burst_time
+    assert view.response_time == table.start_times[0] - view.arrival_time
+    assert view.metadata == {}
+
+
+def test_pcb_table_binary_round_trip(tmp_path):
+    table = PCBTable()
+    table.extend(array("q", [1, 2]), array("q", [0, 3]), array("q", [4, 5]), priorities=array("q", [2, 0]))
+    burst, events = replay_schedule([3, 2, 4])
+    table.add(3, 5, burst, deadline=30, metadata={"io_device": "disk"}, io_trace=events)
+    path = tmp_path / "jobs.pcbt"
+    table.write_binary(path, stamp=(123, 456))
+
+    loaded = PCBTable.read_binary(path, stamp=(123, 456))
+
+    assert [(view.pid, view.arrival_time, view.burst_time, view.priority, view.deadline) for view in loaded.jobs()] == [
+        (1, 0, 4, 2, None),
+        (2, 3, 5, 0, None),
+        (3, 5, 7, None, 30),
+    ]
+    assert loaded.metadata == {2: {"io_device": "disk"}}
+    assert list(loaded.io_traces[2]) == [3, 2]
+    assert loaded.view(0).start_time is None
+    with pytest.raises(ValueError):
+        PCBTable.read_binary(path, stamp=(123, 457))
+
+
+def test_single_channel_device_serializes_io():
+    def run(devices):
+        config = SimulationConfig(
+            algorithm=FCFSAlgorithm(),
+            cpus=2,
+            io_interval_mean=2,
+            io_interval_stddev=0,
+            io_duration_mean=3,
+            io_duration_stddev=0,
+            io_devices=devices,
+        )
+        sim = SchedulerSimulator(config)
+        sim.load_jobs([PCB(1, 0, 3), PCB(2, 0, 3)])
+        return sim.run(), {pcb.pid: pcb.finish_time for pcb in sim.completed}
+
+    # Unlimited I/O: both requests overlap.
+    assert run([])[1] == {1: 5, 2: 5}
+
+    metrics, finish = run([IODevice("disk")])
+    disk = metrics.devices["disk"]
+
+    # The second request waits for the first to leave the only channel.
+    assert finish == {1: 5, 2: 8}
+    assert (disk.requests, disk.busy_time, disk.max_wait, disk.max_queue) == (2, 6, 3, 1)
+    assert disk.mean_wait == 1.5
+    assert disk.utilization == pytest.approx(6 / 8)
+
+
+@pytest.mark.parametrize("engine", ["tick", "event"])
+def test_device_busy_time_stops_at_max_time(engine):
+    config = SimulationConfig(algorithm=FCFSAlgorithm(), engine=engine, max_time=10, io_devices=[IODevice("disk")])
+    sim = SchedulerSimulator(config)
+    sim.load_jobs([PCB(1, 0, 5, io_trace=[1, 1000])])
+    metrics = sim.run()
+    disk = metrics.devices["disk"]
+
+    # The I/O is issued on the CPU burst's last tick (0); only the ticks served before the cut-off count.
+    assert metrics.total_time == 10
+    assert disk.busy_time == 10
+    assert disk.utilization == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "discipline, expected",
+    [("fifo", [10, 60, 45, 90, 55]), ("sstf", [45, 55, 60, 90, 10]), ("scan", [55, 60, 90, 45, 10])],
+)
+def test_device_disciplines_pick_requests_by_track(discipline, expected):
+    device = DeviceQueue(IODevice("disk", discipline=discipline, tracks=100))
+    first = PCB(0, 0, 1, metadata={"io_track": 50})
+    assert device.submit(first, issued=0, duration=1) == 1
+    for track in [10, 60, 45, 90, 55]:
+        assert device.submit(PCB(track, 0, 1, metadata={"io_track": track}), issued=0, duration=1) is None
+
+    served, current, now = [], first, 1
+    while True:
+        started = device.complete(current, now)
+        if started is None:
+            break
+        current, now = started
+        served.append(current.pid)
+
+    assert served == expected
+
+
+def test_replay_schedule_splits_cpu_and_io_bursts():
+    burst, events = replay_schedule([3, 2, 4, 6, 1])
+    assert burst == 8
+    assert list(events) == [3, 2, 7, 6]
+    with pytest.raises(ValueError):
+        replay_schedule([3, 2])
+    with pytest.raises(ValueError):
+        replay_schedule([3, 0, 1])
+
+
+@pytest.mark.parametrize("engine", ["tick", "event"])
+@pytest.mark.parametrize("store", ["objects", "table"])
+def test_recorded_io_trace_is_replayed_exactly(engine, store):
+    traces = {1: [3, 2, 4], 2: [5], 3: [4, 6, 5]}
+    arrivals = {1: 0, 2: 1, 3: 2}
+    if store == "table":
+        table = PCBTable()
+        for pid, bursts in traces.items():
+            burst, events = replay_schedule(bursts)
+            table.add(pid, arrivals[pid], burst, io_trace=events)
+        jobs, presorted = table.jobs(), True
+    else:
+        jobs, presorted = [], False
+        for pid, bursts in traces.items():
+            burst, events = replay_schedule(bursts)
+            jobs.append(PCB(pid, arrivals[pid], burst, io_trace=events))
+
+    config = SimulationConfig(algorithm=FCFSAlgorithm(), engine=engine, io_interval_mean=1, seed=None)
+    sim = SchedulerSimulator(config)
+    state = random.getstate()
+    sim.load_jobs(jobs, presorted=presorted)
+    sim.run()
+
+    # Replayed traces draw nothing from the global generator.
+    assert random.getstate() == state
+    assert {pcb.pid: pcb.finish_time for pcb in sim.completed} == {2: 8, 1: 16, 3: 22}
+
+
+def test_two_cores_run_fcfs_jobs_in_parallel():
+    config = SimulationConfig(algorithm=FCFSAlgorithm(), io_enabled=False, cpus=2)
+    sim = SchedulerSimulator(config)
+    sim.load_jobs([PCB(1, 0, 4), PCB(2, 0, 2), PCB(3, 1, 3)])
+
+    metrics = sim.run()
+    results = {m.pid: m for m in metrics.processes}
+
+    assert [pcb.pid for pcb in sim.completed] == [2, 1, 3]
+    assert results[3].waiting_time == 1
+    assert sim.clock == 5
+    assert metrics.core_busy_time == [4, 5]
+    assert metrics.core_context_switches == [1, 2]
+    assert metrics.cpu_utilization == pytest.approx(9 / 10)
+
+
+@pytest.mark.parametrize("queue_policy", ["global", "per_core"])
+@pytest.mark.parametrize(
+    "make_algorithm",
+    [
+        FCFSAlgorithm,
+        SJFAlgorithm,
+        SRTFAlgorithm,
+        EDFAlgorithm,
+        lambda: RoundRobinAlgorithm(quantum=2),
+        lambda: AdaptiveRoundRobinAlgorithm(quantum=1, window=8, update_every=2),
+    ],
+)
+def test_multicore_event_engine_matches_tick_engine(make_algorithm, queue_policy):
+    def run(engine, seed):
+        rng = random.Random(seed)
+        jobs = [PCB(pid, rng.randint(0, 30), rng.randint(1, 12)) for pid in range(16)]
+        for pcb in jobs:
+            pcb.deadline = pcb.arrival_time + rng.randint(5, 40)
+        config = SimulationConfig(algorithm=make_algorithm(), engine=engine, cpus=3, queue_policy=queue_policy)
+        sim = SchedulerSimulator(config)
+        random.seed(seed)
+        sim.load_jobs(jobs)
+        return sim.run(), [pcb.pid for pcb in sim.completed], sim.clock
+
+    for seed in range(10):
+        tick = run("tick", seed)
+        event = run("event", seed)
+
+        assert len(tick[1]) == 16
+        assert event == tick
+
+
+def test_seeded_io_schedules_are_reproducible():
+    def run():
+        config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=2), seed=1234)
+        sim = SchedulerSimulator(config)
+        jobs = [PCB(pid, pid, 20) for pid in range(5)]
+        sim.load_jobs(jobs)
+        return [job.io_schedule for job in jobs], sim.run()
+
+    random.seed(1)
+    first = run()
+    random.seed(2)
+    second = run()
+
+    assert first == second
+    assert any(first[0])
+
+
+def test_io_schedule_round_trips_through_flat_storage():
+    pcb = PCB(1, 0, 10)
+    pcb.io_schedule = [(2, 3), (6, 1)]
+
+    assert pcb.io_schedule == [(2, 3), (6, 1)]
+    assert pcb.cpu_until_next_io() == 2
+    pcb.consume(2)
+    assert pcb.io_request_due() == (True, 3)
+    assert pcb.cpu_until_next_io() == 4
+
+
+def test_loaded_jobs_share_one_flat_io_buffer():
+    config = SimulationConfig(algorithm=FCFSAlgorithm(), seed=7, io_interval_mean=3, io_duration_mean=2)
+    sim = SchedulerSimulator(config)
+    jobs = [PCB(pid, 10 - pid, 12) for pid in range(1, 6)]
+    jobs.append(PCB(6, 0, 12, metadata={"io_enabled": False}))
+    sim.load_jobs(jobs)
+
+    buffers = {id(job._io_events) for job in jobs[:5]}  # noqa: SLF001
+    assert len(buffers) == 1
+    assert jobs[5].io_schedule == []
+    # Schedules are laid out in arrival order, one after the other.
+    flat = [event for job in reversed(jobs[:5]) for pair in job.io_schedule for event in pair]
+    assert flat == list(jobs[0]._io_events)  # noqa: SLF001
+
+
+def test_metrics_columns_and_summary_statistics():
+    metrics = SimulationMetrics()
+    for pid, waiting in enumerate([0, 2, 4, 6, 8], start=1):
+        metrics.add_process_metrics(ProcessMetrics(pid=pid, waiting_time=waiting, turnaround_time=waiting + 1))
+
+    summary = metrics.summaries()["waiting"]
+
+    assert list(metrics.pids) == [1, 2, 3, 4, 5]
+    assert metrics.processes[2].waiting_time == 4
+    assert metrics.processes[2].response_time is None
+    assert summary.count == 5
+    assert summary.mean == pytest.approx(4.0)
+    assert summary.p50 == pytest.approx(4.0)
+    assert summary.p95 == pytest.approx(7.6)
+    assert summary.max == 8
+    assert summary.stddev == pytest.approx(8 ** 0.5)
+    assert summary.fairness == pytest.approx(400 / (5 * 120))
+    assert metrics.summaries()["response"].count == 0
+
+
+def test_fairness_index_is_one_for_equal_shares():
+    assert summarize([3.0, 3.0, 3.0]).fairness == pytest.approx(1.0)
+    assert summarize([]).mean is None
+
+
+def test_online_metrics_track_columns_in_constant_memory():
+    def run(mode):
+        config = SimulationConfig(
+            algorithm=RoundRobinAlgorithm(quantum=3),
+            engine="event",
+            seed=5,
+            metrics_mode=mode,
+            retain_completed=False,
+        )
+        sim = SchedulerSimulator(config)
+        rng = random.Random(5)
+        sim.load_jobs(PCB(pid, pid, rng.randint(1, 30)) for pid in range(2000))
+        return sim.run()
+
+    exact = run("columns").summaries()["turnaround"]
+    online_metrics = run("online")
+    estimate = online_metrics.summaries()["turnaround"]
+
+    assert len(online_metrics.pids) == 0
+    assert online_metrics.online.count == 2000
+    assert estimate.mean == pytest.approx(exact.mean)
+    assert estimate.stddev == pytest.approx(exact.stddev)
+    assert estimate.max == exact.max
+    assert estimate.p50 == pytest.approx(exact.p50, rel=0.1)
+    assert estimate.p95 == pytest.approx(exact.p95, rel=0.1)
+
+
+def test_trace_records_run_length_segments():
+    config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=2), io_enabled=False, trace=True)
+    sim = SchedulerSimulator(config)
+    sim.load_jobs([PCB(1, 0, 3), PCB(2, 0, 2)])
+    sim.run()
+
+    assert list(sim.trace.segments()) == [
+        (1, 0, 2, 0, "preempt"),
+        (2, 2, 4, 0, "finish"),
+        (1, 4, 5, 0, "finish"),
+    ]
+
+
+def test_trace_is_identical_across_engines_and_round_trips(tmp_path):
+    def traced(engine):
+        config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=3), engine=engine, seed=11, cpus=2, trace=True)
+        sim = SchedulerSimulator(config)
+        sim.load_jobs([PCB(pid, pid * 2, 12) for pid in range(6)])
+        sim.run()
+        return sim.trace
+
+    tick, event = traced("tick"), traced("event")
+    assert list(tick.segments()) == list(event.segments())
+    assert list(tick.events()) == list(event.events())
+    assert any(reason == "block" for *_, reason in tick.segments())
+
+    tick.write_binary(tmp_path / "run.trace")
+    loaded = TraceRecorder.read_binary(tmp_path / "run.trace")
+    assert list(loaded.segments()) == list(tick.segments())
+    assert list(loaded.events()) == list(tick.events())
+
+    tick.write_chrome_trace(tmp_path / "run.json")
+    chrome = json.loads((tmp_path / "run.json").read_text(encoding="utf-8"))
+    slices = [entry for entry in chrome["traceEvents"] if entry["ph"] == "X"]
+    assert len(slices) == len(tick)
+
+
+def test_observers_and_profile_see_the_same_run():
+    class Recorder(SimulationObserver):
+        def __init__(self):
+            self.events = []
+
+        def on_dispatch(self, core, pcb, time):
+            self.events.append(("dispatch", pcb.pid, time))
+
+        def on_preempt(self, core, pcb, time):
+            self.events.append(("preempt", pcb.pid, time))
+
+        def on_finish(self, core, pcb, time):
+            self.events.append(("finish", pcb.pid, time))
+
+    recorder = Recorder()
+    config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=2), io_enabled=False, profile=True)
+    sim = SchedulerSimulator(config, observers=[recorder])
+    sim.load_jobs([PCB(1, 0, 3), PCB(2, 0, 2)])
+    metrics = sim.run()
+
+    assert recorder.events == [
+        ("dispatch", 1, 0),
+        ("preempt", 1, 2),
+        ("dispatch", 2, 2),
+        ("finish", 2, 4),
+        ("dispatch", 1, 4),
+        ("finish", 1, 5),
+    ]
+    profile = metrics.profile
+    assert (profile.dispatches, profile.preemptions, profile.ticks) == (3, 1, 5)
+    assert profile.decisions == profile.steps == 5
+    assert profile.ready_queue_max == 1
+    assert set(profile.phase_times) == set(PHASES)
+
+    unprofiled = SchedulerSimulator(SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=2), io_enabled=False))
+    unprofiled.load_jobs([PCB(1, 0, 3), PCB(2, 0, 2)])
+    assert unprofiled.run().profile is None
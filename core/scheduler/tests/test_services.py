@@ -0,0 +1,219 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure the `core` package is importable when tests run from repository root.
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from core.scheduler.metrics import ProcessMetrics, SimulationMetrics
+from core.scheduler.pcb import PCB
+from core.services.bench_service import (
+    ARRIVAL_PATTERNS,
+    BENCH_FORMAT_VERSION,
+    BURST_DISTRIBUTIONS,
+    BenchCase,
+    BenchResult,
+    BenchService,
+    synthetic_jobs,
+)
+from core.services.sim_service import JobSpec, SimService, SimulationRequest, SweepRequest
+
+
+def _jobs(count):
+    return [JobSpec(pid=pid, arrival=pid // 2, burst=1 + pid % 5, relative_deadline=6) for pid in range(1, count + 1)]
+
+
+def test_streaming_run_keeps_no_per_job_state(monkeypatch):
+    def fail(*_args):
+        raise AssertionError("streaming runs must not build per-process objects")
+
+    monkeypatch.setattr(ProcessMetrics, "from_pcb", classmethod(fail))
+    options = {"io_enabled": False, "seed": 1}
+
+    streamed = SimService().run(
+        SimulationRequest(jobs=iter(_jobs(500)), algorithm="rr", quantum=2, options=options, streaming=True)
+    )
+    kept = SimService().run(SimulationRequest(jobs=_jobs(500), algorithm="rr", quantum=2, options=options))
+
+    assert len(streamed.pids) == 0
+    assert streamed.online.count == 500
+    assert streamed.summaries()["waiting"].mean == pytest.approx(kept.summaries()["waiting"].mean)
+    assert (streamed.deadline_jobs, streamed.deadline_misses) == (kept.deadline_jobs, kept.deadline_misses)
+
+
+def test_metrics_from_pcbs_skips_unfinished_jobs():
+    done = PCB(1, 0, 3, deadline=2)
+    done.finish_time = 5
+    done.response_time = 0
+    done.turnaround_time = 5
+
+    metrics = SimulationMetrics.from_pcbs([done, PCB(2, 0, 3)])
+
+    assert list(metrics.pids) == [1]
+    assert list(metrics.turnaround_times) == [5.0]
+    assert list(metrics.waiting_times) == [2.0]
+    assert (metrics.deadline_jobs, metrics.deadline_misses, metrics.max_lateness) == (1, 1, 3)
+    assert ProcessMetrics.from_pcb(done) == metrics.processes[0]
+
+
+def _sweep_request(**overrides):
+    traces = {
+        "a.csv": [JobSpec(pid=pid, arrival=pid, burst=2 + pid % 4) for pid in range(1, 9)],
+        "b.csv": [JobSpec(pid=pid, arrival=0, burst=1 + pid % 3, priority=pid % 2) for pid in range(1, 6)],
+    }
+    request = SweepRequest(
+        traces=traces,
+        algorithms=["fcfs", "rr", "priority"],
+        quanta=[1, 3],
+        option_grid={"io_interval_mean": [2.0, 5.0], "seed": [7]},
+    )
+    for name, value in overrides.items():
+        setattr(request, name, value)
+    return request
+
+
+def test_sweep_points_expand_the_grid_in_order():
+    points = SimService().sweep_points(_sweep_request())
+
+    # Per trace: fcfs and priority once, rr once per quantum; each times two I/O settings.
+    assert len(points) == 2 * (1 + 2 + 1) * 2
+    assert [(point.algorithm, point.quantum, point.options["io_interval_mean"]) for point in points[:6]] == [
+        ("fcfs", None, 2.0),
+        ("fcfs", None, 5.0),
+        ("rr", 1, 2.0),
+        ("rr", 1, 5.0),
+        ("rr", 3, 2.0),
+        ("rr", 3, 5.0),
+    ]
+    assert {point.trace for point in points[:8]} == {"a.csv"}
+    assert all(point.options["seed"] == 7 for point in points)
+
+
+def test_sweep_points_reject_incomplete_grids():
+    with pytest.raises(ValueError):
+        SimService().sweep_points(_sweep_request(algorithms=[]))
+    with pytest.raises(ValueError):
+        SimService().sweep_points(_sweep_request(quanta=[]))
+
+
+def test_sweep_process_pool_matches_in_process_run():
+    in_process = SimService().sweep(_sweep_request(max_workers=1))
+    pooled = SimService().sweep(_sweep_request(max_workers=2))
+
+    assert [result.point for result in pooled] == [result.point for result in in_process]
+    assert [result.metrics for result in pooled] == [result.metrics for result in in_process]
+
+
+def test_synthetic_jobs_are_deterministic_per_seed():
+    for arrivals in ARRIVAL_PATTERNS:
+        for bursts in BURST_DISTRIBUTIONS:
+            first = list(synthetic_jobs(200, arrivals=arrivals, bursts=bursts, seed=3))
+            assert first == list(synthetic_jobs(200, arrivals=arrivals, bursts=bursts, seed=3))
+            assert first != list(synthetic_jobs(200, arrivals=arrivals, bursts=bursts, seed=4))
+            assert [job.pid for job in first] == list(range(1, 201))
+            assert all(later.arrival >= earlier.arrival for earlier, later in zip(first, first[1:]))
+            assert min(job.burst for job in first) >= 1
+
+    bursty = [job.arrival for job in synthetic_jobs(200, arrivals="bursty", seed=3)]
+    assert len(set(bursty)) < len(bursty) // 2
+    with pytest.raises(ValueError):
+        list(synthetic_jobs(1, arrivals="steady"))
+
+
+def test_bench_case_names_include_engine_quantum_and_options():
+    assert BenchCase(jobs=1000, algorithm="fcfs", quantum=4).name == "fcfs/poisson/exponential/1000/cpu/tick/seed0"
+    assert (
+        BenchCase(jobs=1000, algorithm="rr", io=True, quantum=4, options={"engine": "event", "cpus": 2}).name
+        == "rr/poisson/exponential/1000/io/q4/event/seed0/cpus=2"
+    )
+    tick = BenchCase(jobs=10, algorithm="rr", quantum=4)
+    assert tick.name != BenchCase(jobs=10, algorithm="rr", quantum=8).name
+    assert tick.name != BenchCase(jobs=10, algorithm="rr", quantum=4, options={"engine": "event"}).name
+
+
+def _bench_result(case, ticks_per_second, jobs_per_second):
+    return BenchResult(
+        case=case,
+        wall_time=1.0,
+        ticks=int(ticks_per_second),
+        completed=int(jobs_per_second),
+        ticks_per_second=ticks_per_second,
+        jobs_per_second=jobs_per_second,
+    )
+
+
+def test_bench_compare_flags_drops_beyond_the_tolerance(tmp_path):
+    service = BenchService()
+    fast = BenchCase(jobs=10, algorithm="fcfs")
+    slow = BenchCase(jobs=10, algorithm="sjf")
+    path = tmp_path / "baseline.json"
+    service.write([_bench_result(fast, 1000.0, 100.0), _bench_result(slow, 1000.0, 100.0)], path)
+    baseline = service.load_baseline(path)
+
+    assert set(baseline) == {fast.name, slow.name}
+    current = [
+        _bench_result(fast, 950.0, 91.0),
+        _bench_result(slow, 890.0, 100.0),
+        _bench_result(BenchCase(jobs=10, algorithm="fcfs", options={"engine": "event"}), 1.0, 1.0),
+    ]
+    comparisons = service.compare(current, baseline, tolerance=0.10)
+
+    # The event-engine run has no baseline entry and is skipped rather than compared.
+    assert [(c.name, c.metric, c.regressed) for c in comparisons] == [
+        (fast.name, "ticks_per_second", False),
+        (fast.name, "jobs_per_second", False),
+        (slow.name, "ticks_per_second", True),
+        (slow.name, "jobs_per_second", False),
+    ]
+    assert comparisons[2].ratio == pytest.approx(0.89)
+
+
+def test_bench_load_baseline_rejects_other_formats(tmp_path):
+    path = tmp_path / "old.json"
+    path.write_text(json.dumps({"version": BENCH_FORMAT_VERSION - 1, "results": []}), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        BenchService().load_baseline(path)
+
+
+@pytest.mark.parametrize(
+    "algorithm, options, attribute, expected",
+    [
+        ("priority", {"aging_interval": "3"}, "aging_interval", 3),
+        ("mlfq", {"levels": 2.0, "quanta": (3, "6")}, "quanta", [3, 6]),
+        ("mlfq", {"levels": "2", "boost_interval": "50"}, "boost_interval", 50),
+        ("lottery", {"seed": "11"}, "seed", 11),
+        ("rr-adaptive", {"percentile": "0.5", "window": 16.0}, "percentile", 0.5),
+        ("rr-adaptive", {"window": "16", "max_quantum": 9.0}, "max_quantum", 9),
+    ],
+)
+def test_algorithm_options_are_coerced(algorithm, options, attribute, expected):
+    request = SimulationRequest(jobs=[], algorithm=algorithm, quantum=2, algorithm_options=options)
+
+    assert getattr(SimService()._build_algorithm(request), attribute) == expected
+
+
+def test_lottery_seed_falls_back_to_the_simulation_seed():
+    request = SimulationRequest(jobs=[], algorithm="lottery", quantum=2, options={"seed": 5})
+
+    assert SimService()._build_algorithm(request).seed == 5
+
+
+@pytest.mark.parametrize(
+    "algorithm, options",
+    [
+        ("priority", {"aging_interval": [3]}),
+        ("priority", {"aging_interval": True}),
+        ("mlfq", {"quanta": 4}),
+        ("rr-adaptive", {"window": {"size": 16}}),
+    ],
+)
+def test_algorithm_options_reject_wrong_types(algorithm, options):
+    request = SimulationRequest(jobs=[], algorithm=algorithm, quantum=2, algorithm_options=options)
+
+    with pytest.raises(ValueError, match="Algorithm option"):
+        SimService()._build_algorithm(request)
@@ -0,0 +1,181 @@
+"""Opt-in execution trace recorder with run-length encoded CPU segments."""
+
+from __future__ import annotations
+
+import json
+import struct
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+from .binary import little_endian_bytes, read_column
+
+# Why a segment ended.
+PREEMPT = 0
+BLOCK = 1
+FINISH = 2
+CUTOFF = 3  # still running when the simulation stopped (e.g. max_time)
+END_REASONS = ("preempt", "block", "finish", "cutoff")
+
+# Point events that do not occupy a CPU.
+UNBLOCK = 0
+EVENT_KINDS = ("unblock",)
+
+_MAGIC = b"SCHTRACE"
+_VERSION = 1
+_HEADER = struct.Struct("<8sHQQ")
+# Bytes per segment (pid, start, end, core, reason) and per event (pid, time, kind) in the file.
+_SEGMENT_BYTES = 3 * array("q").itemsize + array("i").itemsize + array("b").itemsize
+_EVENT_BYTES = 2 * array("q").itemsize + array("b").itemsize
+
+
+class TraceRecorder:
+    """
+    Records who ran where as (pid, start, end, core) segments.
+
+    A segment opens when a process is dispatched on a core and closes when it
+    is preempted, blocks, finishes or the run stops, so a process running for
+    a million ticks costs one segment. Columns are typed `array`s; unblocks
+    are kept as separate (pid, time) point events.
+    """
+
+    def __init__(self) -> None:
+        self.pids = array("q")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.cores = array("i")
+        self.reasons = array("b")
+        self.event_pids = array("q")
+        self.event_times = array("q")
+        self.event_kinds = array("b")
+        self._open: Dict[int, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    def dispatch(self, core: int, pid: int, time: int) -> None:
+        """Open a segment for `pid` on `core`, closing whatever was open there."""
+        if core in self._open:
+            self.stop(core, time, PREEMPT)
+        self._open[core] = (pid, time)
+
+    def stop(self, core: int, time: int, reason: int) -> None:
+        """Close the open segment of `core`, if any."""
+        opened = self._open.pop(core, None)
+        if opened is None:
+            return
+        pid, start = opened
+        self.pids.append(pid)
+        self.starts.append(start)
+        self.ends.append(time)
+        self.cores.append(core)
+        self.reasons.append(reason)
+
+    def unblock(self, pid: int, time: int) -> None:
+        """Record the instant a blocked process becomes ready again."""
+        self.event_pids.append(pid)
+        self.event_times.append(time)
+        self.event_kinds.append(UNBLOCK)
+
+    def close(self, time: int) -> None:
+        """Close every segment still open when the run stops."""
+        for core in sorted(self._open):
+            self.stop(core, time, CUTOFF)
+
+    def segments(self) -> Iterator[Tuple[int, int, int, int, str]]:
+        """Yield (pid, start, end, core, reason) tuples in closing order."""
+        for pid, start, end, core, reason in zip(self.pids, self.starts, self.ends, self.cores, self.reasons):
+            yield pid, start, end, core, END_REASONS[reason]
+
+    def events(self) -> Iterator[Tuple[int, int, str]]:
+        """Yield (pid, time, kind) point events."""
+        for pid, time, kind in zip(self.event_pids, self.event_times, self.event_kinds):
+            yield pid, time, EVENT_KINDS[kind]
+
+    def write_binary(self, path: Path | str) -> None:
+        """
+        Write the trace as a compact little-endian binary file.
+
+        Layout: header (magic, version, segment count, event count) followed by
+        the raw columns pids, starts, ends, cores, reasons, event pids, event
+        times and event kinds.
+        """
+        with open(path, "wb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, _VERSION, len(self.pids), len(self.event_pids)))
+            for column in (
+                self.pids,
+                self.starts,
+                self.ends,
+                self.cores,
+                self.reasons,
+                self.event_pids,
+                self.event_times,
+                self.event_kinds,
+            ):
+                handle.write(little_endian_bytes(column))
+
+    @classmethod
+    def read_binary(cls, path: Path | str) -> "TraceRecorder":
+        """
+        Load a trace written by :meth:`write_binary`.
+
+        Raises ValueError when the file is not a complete scheduler trace.
+        """
+        payload = memoryview(Path(path).read_bytes())
+        if len(payload) < _HEADER.size:
+            raise ValueError(f"'{path}' is not a scheduler trace (version {_VERSION}).")
+        magic, version, segments, events = _HEADER.unpack_from(payload, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"'{path}' is not a scheduler trace (version {_VERSION}).")
+        if len(payload) != _HEADER.size + segments * _SEGMENT_BYTES + events * _EVENT_BYTES:
+            raise ValueError(f"'{path}' is truncated or corrupt.")
+        recorder = cls()
+        offset = _HEADER.size
+        recorder.pids, offset = read_column("q", payload, offset, segments)
+        recorder.starts, offset = read_column("q", payload, offset, segments)
+        recorder.ends, offset = read_column("q", payload, offset, segments)
+        recorder.cores, offset = read_column("i", payload, offset, segments)
+        recorder.reasons, offset = read_column("b", payload, offset, segments)
+        recorder.event_pids, offset = read_column("q", payload, offset, events)
+        recorder.event_times, offset = read_column("q", payload, offset, events)
+        recorder.event_kinds, offset = read_column("b", payload, offset, events)
+        return recorder
+
+    def write_chrome_trace(self, path: Path | str) -> None:
+        """
+        Stream the trace as Chrome trace-event JSON (chrome://tracing, Perfetto).
+
+        One tick maps to one microsecond; each core is a thread of a single
+        "CPU" process and unblocks are global instant events.
+        """
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write('{"traceEvents": [\n')
+            handle.write(json.dumps({"name": "process_name", "ph": "M", "pid": 0, "args": {"name": "CPU"}}))
+            for core in sorted(set(self.cores)):
+                handle.write(",\n")
+                handle.write(
+                    json.dumps(
+                        {"name": "thread_name", "ph": "M", "pid": 0, "tid": core, "args": {"name": f"core {core}"}}
+                    )
+                )
+            for pid, start, end, core, reason in self.segments():
+                handle.write(",\n")
+                handle.write(
+                    json.dumps(
+                        {
+                            "name": f"pid {pid}",
+                            "ph": "X",
+                            "ts": start,
+                            "dur": end - start,
+                            "pid": 0,
+                            "tid": core,
+                            "args": {"pid": pid, "end": reason},
+                        }
+                    )
+                )
+            for pid, time, kind in self.events():
+                handle.write(",\n")
+                handle.write(
+                    json.dumps({"name": f"{kind} {pid}", "ph": "i", "s": "g", "ts": time, "pid": 0, "tid": 0})
+                )
+            handle.write("\n]}\n")
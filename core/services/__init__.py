@@ -1,6 +1,7 @@
 """Use-case layer that bridges adapters with the core domain."""
 
+from .bench_service import BenchService
 from .fs_service import FsService
 from .sim_service import SimService
 
-__all__ = ["FsService", "SimService"]
+__all__ = ["BenchService", "FsService", "SimService"]
@@ -0,0 +1,291 @@
+"""Benchmark suite that times the scheduler on synthetic workloads."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence
+
+if sys.platform != "win32":
+    import resource
+
+from ..scheduler.metrics import SimulationMetrics
+from .sim_service import QUANTUM_ALGORITHMS, JobSpec, SimService, SimulationRequest
+
+ARRIVAL_PATTERNS = ("poisson", "bursty", "uniform")
+BURST_DISTRIBUTIONS = ("exponential", "heavy_tailed")
+# Version 2 added the engine, quantum, seed and options to case names.
+BENCH_FORMAT_VERSION = 2
+
+# Pareto shape of heavy-tailed bursts: finite mean, infinite variance.
+_PARETO_ALPHA = 1.5
+# Mean number of jobs released together by the "bursty" arrival pattern.
+_BATCH_MEAN = 8
+
+
+def synthetic_jobs(
+    count: int,
+    *,
+    arrivals: str = "poisson",
+    bursts: str = "exponential",
+    mean_interarrival: float = 4.0,
+    mean_burst: float = 3.0,
+    seed: int = 0,
+) -> Iterator[JobSpec]:
+    """
+    Lazily generate `count` jobs sorted by arrival, ready for streaming runs.
+
+    Arrivals are a Poisson process ("poisson"), batches of jobs released at the
+    same tick with exponential gaps ("bursty") or uniform random interarrival
+    times ("uniform"), all with the same long-run rate. Bursts are exponential
+    or Pareto ("heavy_tailed") with the given mean and at least one tick.
+    """
+    if arrivals not in ARRIVAL_PATTERNS:
+        raise ValueError(f"Unsupported arrival pattern '{arrivals}'. Use one of {ARRIVAL_PATTERNS}.")
+    if bursts not in BURST_DISTRIBUTIONS:
+        raise ValueError(f"Unsupported burst distribution '{bursts}'. Use one of {BURST_DISTRIBUTIONS}.")
+    rng = random.Random(seed)
+    pareto_scale = mean_burst * (_PARETO_ALPHA - 1) / _PARETO_ALPHA
+    clock = 0.0
+    batch_left = 0
+    for pid in range(1, count + 1):
+        if arrivals == "poisson":
+            clock += rng.expovariate(1.0 / mean_interarrival)
+        elif arrivals == "uniform":
+            clock += rng.uniform(0.0, 2.0 * mean_interarrival)
+        elif batch_left == 0:
+            batch_left = 1 + int(rng.expovariate(1.0 / (_BATCH_MEAN - 1)))
+            clock += rng.expovariate(1.0 / (mean_interarrival * _BATCH_MEAN))
+        batch_left = max(batch_left - 1, 0)
+
+        if bursts == "exponential":
+            burst = rng.expovariate(1.0 / mean_burst)
+        else:
+            burst = pareto_scale * rng.paretovariate(_PARETO_ALPHA)
+        yield JobSpec(pid=pid, arrival=int(clock), burst=max(1, round(burst)))
+
+
+def peak_rss_kb() -> int | None:
+    """Peak resident set size of the current process in KiB, if the platform reports it."""
+    if sys.platform == "win32":
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+@dataclass(slots=True)
+class BenchCase:
+    """One timed simulation: a workload shape, an algorithm and the I/O switch."""
+
+    jobs: int
+    algorithm: str
+    arrivals: str = "poisson"
+    bursts: str = "exponential"
+    io: bool = False
+    quantum: int | None = None
+    seed: int = 0
+    options: Dict[str, object] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        """
+        Stable key used to match results against a baseline.
+
+        Besides the workload it names the engine, the quantum of time-sliced
+        algorithms, the seed and any other option, so runs configured
+        differently never get compared with each other.
+        """
+        parts = [self.algorithm, self.arrivals, self.bursts, str(self.jobs), "io" if self.io else "cpu"]
+        if self.quantum is not None and self.algorithm.lower() in QUANTUM_ALGORITHMS:
+            parts.append(f"q{self.quantum}")
+        options = dict(self.options)
+        # "tick" is the SimulationConfig default.
+        parts.append(str(options.pop("engine", "tick")))
+        parts.append(f"seed{self.seed}")
+        parts.extend(f"{key}={options[key]}" for key in sorted(options))
+        return "/".join(parts)
+
+
+@dataclass(slots=True)
+class BenchResult:
+    """Timings and throughput of one :class:`BenchCase`."""
+
+    case: BenchCase
+    wall_time: float
+    ticks: int
+    completed: int
+    ticks_per_second: float
+    jobs_per_second: float
+    peak_rss_kb: int | None = None
+
+
+@dataclass(slots=True)
+class BenchRequest:
+    """
+    Grid accepted by :class:`BenchService.run`.
+
+    Cases are the cross product of `sizes`, `algorithms`, `arrivals`, `bursts`
+    and `io`. `options` holds extra `SimulationConfig` fields shared by every
+    case (e.g. `engine`). With `isolate=True` each case runs in a fresh worker
+    process so its peak RSS is not inflated by earlier, larger cases.
+    """
+
+    sizes: Sequence[int]
+    algorithms: Sequence[str] = ("fcfs", "sjf", "rr")
+    arrivals: Sequence[str] = ("poisson",)
+    bursts: Sequence[str] = ("exponential",)
+    io: Sequence[bool] = (False, True)
+    quantum: int = 4
+    seed: int = 0
+    options: Dict[str, object] = field(default_factory=dict)
+    isolate: bool = True
+
+
+@dataclass(slots=True)
+class BenchComparison:
+    """Throughput of one case against the stored baseline."""
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def run_bench_case(case: BenchCase) -> BenchResult:
+    """
+    Time one case through `SimService` in streaming mode.
+
+    Jobs are generated lazily while the simulator admits them, so generation is
+    part of the measured time the same way parsing is for a real trace.
+    """
+    options: Dict[str, object] = {"io_enabled": case.io, "seed": case.seed}
+    options.update(case.options)
+    request = SimulationRequest(
+        jobs=synthetic_jobs(case.jobs, arrivals=case.arrivals, bursts=case.bursts, seed=case.seed),
+        algorithm=case.algorithm,
+        quantum=case.quantum if case.algorithm.lower() in QUANTUM_ALGORITHMS else None,
+        options=options,
+        streaming=True,
+    )
+    started = time.perf_counter()
+    metrics = SimService().run(request)
+    wall_time = time.perf_counter() - started
+    completed = _completed(metrics)
+    elapsed = wall_time or float("inf")
+    return BenchResult(
+        case=case,
+        wall_time=wall_time,
+        ticks=metrics.total_time,
+        completed=completed,
+        ticks_per_second=metrics.total_time / elapsed,
+        jobs_per_second=completed / elapsed,
+        peak_rss_kb=peak_rss_kb(),
+    )
+
+
+def _completed(metrics: SimulationMetrics) -> int:
+    if metrics.online is not None:
+        return metrics.online.count
+    return len(metrics.pids)
+
+
+class BenchService:
+    """Runs benchmark grids and compares their results with a stored baseline."""
+
+    def cases(self, request: BenchRequest) -> List[BenchCase]:
+        """Expand the benchmark grid in a stable order."""
+        if not request.sizes:
+            raise ValueError("A benchmark needs at least one workload size.")
+        return [
+            BenchCase(
+                jobs=size,
+                algorithm=algorithm,
+                arrivals=arrivals,
+                bursts=bursts,
+                io=io,
+                quantum=request.quantum,
+                seed=request.seed,
+                options=dict(request.options),
+            )
+            for size, arrivals, bursts, io, algorithm in itertools.product(
+                request.sizes, request.arrivals, request.bursts, request.io, request.algorithms
+            )
+        ]
+
+    def run(self, request: BenchRequest) -> List[BenchResult]:
+        """Run every case of the grid sequentially, one case per worker when isolated."""
+        cases = self.cases(request)
+        if not request.isolate:
+            return [run_bench_case(case) for case in cases]
+        results: List[BenchResult] = []
+        for case in cases:
+            # A single-use worker per case keeps peak RSS readings independent.
+            with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+                results.append(pool.submit(run_bench_case, case).result())
+        return results
+
+    def to_json(self, results: Sequence[BenchResult]) -> Dict[str, object]:
+        """Serialize results together with the interpreter they were measured on."""
+        return {
+            "version": BENCH_FORMAT_VERSION,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "results": [dict(asdict(result), name=result.case.name) for result in results],
+        }
+
+    def write(self, results: Sequence[BenchResult], path: Path | str) -> None:
+        """Write results as JSON that can later serve as a baseline."""
+        Path(path).write_text(json.dumps(self.to_json(results), indent=2) + "\n", encoding="utf-8")
+
+    def load_baseline(self, path: Path | str) -> Dict[str, Dict[str, float]]:
+        """Read a results file written by :meth:`write`, keyed by case name."""
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        if payload.get("version") != BENCH_FORMAT_VERSION:
+            raise ValueError(f"'{path}' is not a benchmark results file (version {BENCH_FORMAT_VERSION}).")
+        return {entry["name"]: entry for entry in payload["results"]}
+
+    def compare(
+        self,
+        results: Sequence[BenchResult],
+        baseline: Dict[str, Dict[str, float]],
+        *,
+        tolerance: float = 0.10,
+    ) -> List[BenchComparison]:
+        """
+        Compare throughput with the baseline; cases missing from it are skipped.
+
+        A case regresses when its ticks or jobs per second drop by more than
+        `tolerance` (a fraction) below the baseline value.
+        """
+        comparisons: List[BenchComparison] = []
+        for result in results:
+            reference = baseline.get(result.case.name)
+            if reference is None:
+                continue
+            for metric in ("ticks_per_second", "jobs_per_second"):
+                expected = float(reference[metric])
+                current = getattr(result, metric)
+                comparisons.append(
+                    BenchComparison(
+                        name=result.case.name,
+                        metric=metric,
+                        baseline=expected,
+                        current=current,
+                        regressed=current < expected * (1.0 - tolerance),
+                    )
+                )
+        return comparisons
@@ -2,36 +2,240 @@
 
 from __future__ import annotations
 
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Type
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Type
 
-from ..scheduler.algorithms import FCFSAlgorithm, RoundRobinAlgorithm, SJFAlgorithm, SchedulingAlgorithm
+from ..scheduler.algorithms import (
+    AdaptiveRoundRobinAlgorithm,
+    EDFAlgorithm,
+    FCFSAlgorithm,
+    LotteryAlgorithm,
+    MLFQAlgorithm,
+    PriorityAlgorithm,
+    RoundRobinAlgorithm,
+    SJFAlgorithm,
+    SRTFAlgorithm,
+    SchedulingAlgorithm,
+    StrideAlgorithm,
+)
 from ..scheduler.metrics import SimulationMetrics
-from ..scheduler.pcb import PCB
+from ..scheduler.pcb import PCB, replay_schedule
+from ..scheduler.pcb_table import PCBTable
 from ..scheduler.simulator import SchedulerSimulator, SimulationConfig
 
 
 @dataclass(slots=True)
 class JobSpec:
-    """Declarative job description typically produced by parsers or adapters."""
+    """
+    Declarative job description typically produced by parsers or adapters.
+
+    A deadline is either absolute (`deadline`) or relative to the arrival
+    (`relative_deadline`); the absolute one wins when both are set.
+    `io_trace` holds recorded I/O as flat (trigger, duration) events, replayed
+    instead of the simulator's synthetic schedule; build it from an observed
+    burst sequence with :meth:`from_bursts`.
+    """
 
     pid: int
     arrival: int
     burst: int
     priority: int | None = None
     metadata: Dict[str, object] = field(default_factory=dict)
+    deadline: int | None = None
+    relative_deadline: int | None = None
+    io_trace: array | None = None
+
+    @classmethod
+    def from_bursts(
+        cls,
+        pid: int,
+        arrival: int,
+        bursts: Iterable[int],
+        *,
+        priority: int | None = None,
+        metadata: Dict[str, object] | None = None,
+        deadline: int | None = None,
+        relative_deadline: int | None = None,
+    ) -> "JobSpec":
+        """Job replaying an alternating (cpu, io, cpu, ..., cpu) burst sequence."""
+        burst, io_trace = replay_schedule(bursts)
+        return cls(
+            pid=pid,
+            arrival=arrival,
+            burst=burst,
+            priority=priority,
+            metadata={} if metadata is None else metadata,
+            deadline=deadline,
+            relative_deadline=relative_deadline,
+            io_trace=io_trace,
+        )
+
+    @property
+    def absolute_deadline(self) -> int | None:
+        """Deadline as a simulation tick, or None when the job has none."""
+        if self.deadline is not None:
+            return self.deadline
+        if self.relative_deadline is not None:
+            return self.arrival + self.relative_deadline
+        return None
 
 
 @dataclass(slots=True)
 class SimulationRequest:
-    """Payload accepted by :class:`SimService.run`."""
+    """
+    Payload accepted by :class:`SimService.run`.
+
+    `options` holds extra `SimulationConfig` fields (e.g. `cpus`, `queue_policy`,
+    `engine`) and `algorithm_options` tuning knobs of the algorithm itself
+    (e.g. `aging_interval` for the priority schedulers, `levels`, `quanta` and
+    `boost_interval` for MLFQ, `seed` for lottery draws, which otherwise
+    reuse the simulation seed, `percentile`, `window` and `update_every` for
+    adaptive Round Robin). With `streaming=True`, `jobs` is consumed lazily and must already be sorted
+    by arrival; PCBs are created as jobs arrive and dropped once they finish, and
+    metrics default to constant-memory online statistics, so memory follows the
+    number of live jobs rather than the trace size.
+    `job_store="table"` keeps every job as a row of a `PCBTable` instead of a
+    `PCB` object. Only the jobs in the system get a view, and finished jobs are
+    not retained, which suits multi-million job traces that are not streamed.
+    `jobs` may then also be a ready-made `PCBTable`, e.g. from a bulk loader.
+    """
+
+    jobs: Iterable[JobSpec] | PCBTable
+    algorithm: str
+    quantum: int | None = None
+    options: Dict[str, object] = field(default_factory=dict)
+    streaming: bool = False
+    algorithm_options: Dict[str, object] = field(default_factory=dict)
+    job_store: str = "objects"
+
+
+@dataclass(slots=True)
+class SweepRequest:
+    """
+    Parameter grid accepted by :class:`SimService.sweep`.
+
+    Every trace is simulated for the cross product of `algorithms`, `quanta`
+    (Round Robin only) and the values listed in `option_grid`, whose keys are
+    `SimulationConfig` fields such as `io_interval_mean`.
+    """
+
+    traces: Dict[str, Sequence[JobSpec]]
+    algorithms: Sequence[str]
+    quanta: Sequence[int] = ()
+    option_grid: Dict[str, Sequence[object]] = field(default_factory=dict)
+    max_workers: int | None = None
 
-    jobs: Iterable[JobSpec]
+
+@dataclass(slots=True)
+class SweepPoint:
+    """A single simulation within a sweep."""
+
+    trace: str
     algorithm: str
     quantum: int | None = None
     options: Dict[str, object] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class SweepResult:
+    """Metrics produced for one :class:`SweepPoint`."""
+
+    point: SweepPoint
+    metrics: SimulationMetrics
+
+
+# "objects" builds one PCB per job, "table" keeps jobs in a PCBTable.
+JOB_STORES = ("objects", "table")
+
+# Time-sliced algorithms that take a quantum (only a starting point for rr-adaptive).
+QUANTUM_ALGORITHMS = ("rr", "rr-adaptive", "lottery", "stride")
+
+
+def jobs_to_table(jobs: Iterable[JobSpec], table: PCBTable | None = None) -> PCBTable:
+    """Append JobSpecs to a structure-of-arrays job table (a new one by default)."""
+    table = PCBTable() if table is None else table
+    for job in jobs:
+        table.add(
+            job.pid,
+            job.arrival,
+            job.burst,
+            priority=job.priority,
+            deadline=job.absolute_deadline,
+            metadata=job.metadata,
+            io_trace=job.io_trace,
+        )
+    return table
+
+
+def table_to_jobs(table: PCBTable) -> Iterator[JobSpec]:
+    """Yield the rows of a job table as JobSpecs, in row order (e.g. to run a bulk-loaded table on PCBs)."""
+    for job in table.jobs():
+        yield JobSpec(
+            pid=job.pid,
+            arrival=job.arrival_time,
+            burst=job.burst_time,
+            priority=job.priority,
+            metadata=dict(job.metadata),
+            deadline=job.deadline,
+            io_trace=job.io_trace,
+        )
+
+
+def _int_option(options: Mapping[str, object], name: str) -> int | None:
+    """Integer algorithm option `name`, or None when it is missing or None."""
+    value = options.get(name)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"Algorithm option '{name}' must be an integer, got {value!r}.")
+    return int(value)
+
+
+def _float_option(options: Mapping[str, object], name: str) -> float | None:
+    """Numeric algorithm option `name`, or None when it is missing or None."""
+    value = options.get(name)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"Algorithm option '{name}' must be a number, got {value!r}.")
+    return float(value)
+
+
+def _int_list_option(options: Mapping[str, object], name: str) -> List[int] | None:
+    """Integer sequence algorithm option `name`, or None when it is missing or None."""
+    value = options.get(name)
+    if value is None:
+        return None
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"Algorithm option '{name}' must be a list of integers, got {value!r}.")
+    return [int(item) for item in value]
+
+
+# Per-process state of sweep workers: traces are shipped once, at pool start-up.
+_SWEEP_TRACES: Dict[str, Sequence[JobSpec]] = {}
+_SWEEP_SIMULATOR: Type[SchedulerSimulator] = SchedulerSimulator
+
+
+def _init_sweep_worker(
+    traces: Dict[str, Sequence[JobSpec]],
+    simulator_cls: Type[SchedulerSimulator],
+) -> None:
+    """Pool initializer that keeps the parsed traces for every task of the worker."""
+    global _SWEEP_TRACES, _SWEEP_SIMULATOR  # pylint: disable=global-statement
+    _SWEEP_TRACES = traces
+    _SWEEP_SIMULATOR = simulator_cls
+
+
+def _run_sweep_point(point: SweepPoint) -> SweepResult:
+    """Run one sweep point against the traces loaded by the worker initializer."""
+    service = SimService(_SWEEP_SIMULATOR)
+    return SweepResult(point=point, metrics=service.run(service.sweep_request(_SWEEP_TRACES, point)))
+
+
 class SimService:
     """Facade that hides simulator wiring from adapters."""
 
@@ -42,13 +246,90 @@ class SimService:
         """
         Execute the simulation for the given request payload.
         """
+        if request.job_store not in JOB_STORES:
+            raise ValueError(f"Unsupported job store '{request.job_store}'. Use one of {JOB_STORES}.")
         algorithm = self._build_algorithm(request)
-        sim = self.simulator_cls(SimulationConfig(algorithm=algorithm))
-        pcbs: list[PCB] = [self._job_to_pcb(job) for job in request.jobs]
-        sim.load_jobs(pcbs)
+        sim = self.simulator_cls(self._build_config(request, algorithm))
+        if request.job_store == "table":
+            table = request.jobs if isinstance(request.jobs, PCBTable) else jobs_to_table(request.jobs)
+            sim.load_jobs(table.jobs(), presorted=True)
+        elif request.streaming:
+            sim.load_jobs((self._job_to_pcb(job) for job in request.jobs), presorted=True)
+        else:
+            pcbs: list[PCB] = [self._job_to_pcb(job) for job in request.jobs]
+            sim.load_jobs(pcbs)
         # Execute the actual simulation
         return sim.run()
 
+    def sweep(self, request: SweepRequest) -> List[SweepResult]:
+        """
+        Run every point of the sweep grid and return the results in grid order.
+
+        Points run in a `ProcessPoolExecutor` whose workers receive the traces
+        once through the pool initializer; `max_workers=1` runs in-process.
+        """
+        points = self.sweep_points(request)
+        if request.max_workers == 1 or len(points) <= 1:
+            return [
+                SweepResult(point=point, metrics=self.run(self.sweep_request(request.traces, point)))
+                for point in points
+            ]
+
+        with ProcessPoolExecutor(
+            max_workers=request.max_workers,
+            initializer=_init_sweep_worker,
+            initargs=(request.traces, self.simulator_cls),
+        ) as pool:
+            workers = request.max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(points) // (workers * 4))
+            return list(pool.map(_run_sweep_point, points, chunksize=chunksize))
+
+    def sweep_points(self, request: SweepRequest) -> List[SweepPoint]:
+        """Expand the sweep grid; quanta only multiply time-sliced algorithms."""
+        if not request.algorithms:
+            raise ValueError("A sweep needs at least one algorithm.")
+        option_names = list(request.option_grid)
+        option_values = [list(request.option_grid[name]) for name in option_names]
+        points: List[SweepPoint] = []
+        for trace in request.traces:
+            for algorithm in request.algorithms:
+                quanta: Sequence[int | None] = [None]
+                if algorithm.lower() in QUANTUM_ALGORITHMS:
+                    if not request.quanta:
+                        raise ValueError(f"'{algorithm}' sweeps require at least one quantum value.")
+                    quanta = request.quanta
+                for quantum in quanta:
+                    for combo in itertools.product(*option_values):
+                        points.append(
+                            SweepPoint(
+                                trace=trace,
+                                algorithm=algorithm,
+                                quantum=quantum,
+                                options=dict(zip(option_names, combo)),
+                            )
+                        )
+        return points
+
+    def sweep_request(self, traces: Dict[str, Sequence[JobSpec]], point: SweepPoint) -> SimulationRequest:
+        """Build the simulation request for one sweep point."""
+        return SimulationRequest(
+            jobs=traces[point.trace],
+            algorithm=point.algorithm,
+            quantum=point.quantum,
+            options=dict(point.options),
+        )
+
+    def _build_config(self, request: SimulationRequest, algorithm: SchedulingAlgorithm) -> SimulationConfig:
+        """Merge the request options into a simulator configuration."""
+        options = dict(request.options)
+        options.setdefault("retain_completed", not request.streaming and request.job_store == "objects")
+        if request.streaming:
+            options.setdefault("metrics_mode", "online")
+        try:
+            return SimulationConfig(algorithm=algorithm, **options)
+        except TypeError as exc:
+            raise ValueError(f"Unsupported simulation option: {exc}") from exc
+
     def _job_to_pcb(self, job: JobSpec) -> PCB:
         """Convert a JobSpec into a PCB instance."""
         pcb = PCB(
@@ -57,6 +338,8 @@ class SimService:
             burst_time=job.burst,
             priority=job.priority,
             metadata=job.metadata,
+            deadline=job.absolute_deadline,
+            io_trace=job.io_trace,
         )
         return pcb
 
@@ -69,6 +352,53 @@ class SimService:
             if request.quantum is None:
                 raise ValueError("Round Robin requires a quantum value.")
             return RoundRobinAlgorithm(request.quantum)
+        if algo == "rr-adaptive":
+            options = request.algorithm_options
+            # The quantum, when given, is only the starting point.
+            tuning: Dict[str, Any] = {} if request.quantum is None else {"quantum": request.quantum}
+            readers = (
+                ("percentile", _float_option),
+                ("window", _int_option),
+                ("update_every", _int_option),
+                ("min_quantum", _int_option),
+                ("max_quantum", _int_option),
+            )
+            for name, read in readers:
+                value = read(options, name)
+                if value is not None:
+                    tuning[name] = value
+            return AdaptiveRoundRobinAlgorithm(**tuning)
         if algo == "sjf":
             return SJFAlgorithm()
+        if algo == "srtf":
+            return SRTFAlgorithm()
+        if algo in ("edf", "edf-nonpreemptive"):
+            return EDFAlgorithm(preemptive=algo == "edf")
+        if algo == "mlfq":
+            options = request.algorithm_options
+            levels = _int_option(options, "levels")
+            if levels is None:
+                levels = 3
+            quanta = _int_list_option(options, "quanta")
+            if quanta is None and request.quantum is not None:
+                # A single quantum seeds level 0; each lower level doubles it.
+                quanta = [request.quantum * 2**level for level in range(levels)]
+            return MLFQAlgorithm(
+                levels=levels,
+                quanta=quanta,
+                boost_interval=_int_option(options, "boost_interval"),
+            )
+        if algo in ("lottery", "stride"):
+            if request.quantum is None:
+                raise ValueError(f"{algo.capitalize()} scheduling requires a quantum value.")
+            if algo == "stride":
+                return StrideAlgorithm(request.quantum)
+            # Lottery draws reuse the simulation seed unless they get their own.
+            options = request.algorithm_options if "seed" in request.algorithm_options else request.options
+            return LotteryAlgorithm(request.quantum, seed=_int_option(options, "seed"))
+        if algo in ("priority", "priority-preemptive"):
+            return PriorityAlgorithm(
+                preemptive=algo == "priority-preemptive",
+                aging_interval=_int_option(request.algorithm_options, "aging_interval"),
+            )
         raise ValueError(f"Unsupported algorithm '{request.algorithm}'.")